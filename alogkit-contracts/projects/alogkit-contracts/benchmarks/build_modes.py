@@ -0,0 +1,106 @@
+"""
+Compares the subprocess build path against the in-process build path.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.build_modes [--rounds N] [contract_name ...]
+
+Both modes build every selected contract from scratch (the build cache is bypassed)
+into scratch folders next to smart_contracts/artifacts, and the benchmark checks that
+they produce byte-identical artifacts before reporting timings.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from shutil import rmtree
+
+import smart_contracts.__main__ as sc
+from smart_contracts._helpers.build_cache import BuildCache
+
+
+def _subprocess_build(artifact_path: Path, selected: list[sc.SmartContract]) -> None:
+    for contract in selected:
+        sc.build(artifact_path / contract.name, contract.path, use_cache=False)
+
+
+def _in_process_build(artifact_path: Path, selected: list[sc.SmartContract]) -> None:
+    sc.build_in_process(artifact_path, selected, use_cache=False)
+
+
+def _snapshot(artifact_path: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(artifact_path)): path.read_bytes()
+        for path in sorted(artifact_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def _time_mode(
+    build_fn: Callable[[Path, list[sc.SmartContract]], None],
+    artifact_path: Path,
+    selected: list[sc.SmartContract],
+    rounds: int,
+) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        rmtree(artifact_path, ignore_errors=True)
+        started = time.perf_counter()
+        build_fn(artifact_path, selected)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("contracts", nargs="*")
+    args = parser.parse_args()
+
+    selected = [
+        contract
+        for contract in sc.contracts
+        if not args.contracts or contract.name in args.contracts
+    ]
+    # Keep the real build cache out of the benchmark.
+    sc.build_cache = BuildCache(Path(tempfile.mkdtemp()))
+
+    scratch = sc.root_path / ".benchmark"
+    modes = {"subprocess": _subprocess_build, "in-process": _in_process_build}
+    results: dict[str, list[float]] = {}
+    snapshots: dict[str, dict[str, bytes]] = {}
+    try:
+        for mode, build_fn in modes.items():
+            artifact_path = scratch / mode
+            results[mode] = _time_mode(build_fn, artifact_path, selected, args.rounds)
+            snapshots[mode] = _snapshot(artifact_path)
+    finally:
+        rmtree(scratch, ignore_errors=True)
+
+    print(f"\nBuilt {len(selected)} contract(s), {args.rounds} round(s) per mode")
+    print(f"{'mode':<12} {'mean (s)':>10} {'min (s)':>10} {'max (s)':>10}")
+    for mode, timings in results.items():
+        print(
+            f"{mode:<12} {statistics.mean(timings):>10.3f} "
+            f"{min(timings):>10.3f} {max(timings):>10.3f}"
+        )
+    speedup = statistics.mean(results["subprocess"]) / statistics.mean(results["in-process"])
+    print(f"in-process speedup: {speedup:.2f}x")
+
+    if snapshots["subprocess"] != snapshots["in-process"]:
+        differing = sorted(
+            set(snapshots["subprocess"]).symmetric_difference(snapshots["in-process"])
+            | {
+                name
+                for name in set(snapshots["subprocess"]) & set(snapshots["in-process"])
+                if snapshots["subprocess"][name] != snapshots["in-process"][name]
+            }
+        )
+        raise SystemExit(f"Artifacts differ between modes: {', '.join(differing)}")
+    print("Artifacts are identical across modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measures bulk SavingsVault deployment throughput against the LocalNet stand-in.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.bulk_deploy [--vaults 512] [--latency-ms 5]
+
+Runs the same cohort twice on a fresh StandinAlgod with the given per-request
+latency: once one vault at a time (a params fetch, a create and a funding
+payment per vault, as deploy_config.deploy() does) and once through the
+pipelined BulkDeployer, and reports vaults/s and algod requests for each.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import account
+
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import (
+    BulkDeployer,
+    BulkDeployReport,
+    Manifest,
+    VaultPrograms,
+    VaultSpec,
+)
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+# Stand-in programs: the stand-in executes handlers, not bytecode.
+PROGRAMS = VaultPrograms(approval=b"\x0a", clear=b"\x0a", global_ints=6, global_bytes=1)
+
+
+def _run(
+    specs: list[VaultSpec], latency: float, max_in_flight: int, group_size: int, max_age: float
+) -> tuple[BulkDeployReport, int]:
+    algod = StandinAlgod(handlers=savings_vault_handlers(), latency=latency)
+    private_key, sender = account.generate_account()
+    algod.balances[sender] = 10**15
+    with tempfile.TemporaryDirectory() as tmp:
+        deployer = BulkDeployer(
+            algod,
+            sender,
+            private_key,
+            PROGRAMS,
+            Manifest(Path(tmp) / "manifest.jsonl"),
+            max_in_flight=max_in_flight,
+            group_size=group_size,
+        )
+        deployer.params.max_age = max_age
+        report = deployer.run(specs)
+    if report.created != len(specs) or report.funded != len(specs):
+        raise SystemExit(f"Incomplete deployment: {report}")
+    return report, algod.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=512)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    args = parser.parse_args()
+
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [
+        VaultSpec(account.generate_account()[1], 1_000_000 + i, deadline)
+        for i in range(args.vaults)
+    ]
+    latency = args.latency_ms / 1000
+    runs = {
+        "one at a time": _run(specs, latency, max_in_flight=1, group_size=1, max_age=0.0),
+        "pipelined": _run(specs, latency, args.max_in_flight, group_size=16, max_age=2.8),
+    }
+
+    print(
+        f"Deploying {args.vaults} vaults, {args.latency_ms:g} ms per algod request "
+        f"(max {args.max_in_flight} groups in flight):"
+    )
+    print(f"  {'mode':<14} {'seconds':>8} {'vaults/s':>9} {'requests':>9} {'params':>7}")
+    for mode, (report, requests) in runs.items():
+        print(
+            f"  {mode:<14} {report.elapsed:>8.2f} {report.vaults_per_second:>9.1f} "
+            f"{requests:>9} {report.params_fetches:>7}"
+        )
+    sequential, pipelined = runs["one at a time"][0], runs["pipelined"][0]
+    print(f"  speedup: {sequential.elapsed / pipelined.elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measures deposit throughput through VaultClientPool against the LocalNet stand-in.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.client_pool [--deposits 2000] [--latency-ms 2]
+
+Deploys a set of vaults on a StandinAlgod with the given per-request latency, then
+sends deposit groups one at a time the way the generated client does (fresh
+params, send, wait for confirmation) and through VaultClientPool, and reports
+throughput and latency percentiles for both.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import account, transaction
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.client_pool import CallStats, VaultCall, VaultClientPool
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+
+def _one_at_a_time(algod: StandinAlgod, calls: list[VaultCall]) -> CallStats:
+    pool = VaultClientPool(algod)
+    stats = CallStats(first_submit=time.perf_counter())
+    for call in calls:
+        started = time.perf_counter()
+        signed = pool._sign(pool._compose(call, algod.suggested_params()), call)
+        algod.send_transactions(signed)
+        transaction.wait_for_confirmation(algod, signed[-1].get_txid(), 10)
+        stats.last_confirm = time.perf_counter()
+        stats.latencies.append(stats.last_confirm - started)
+    stats.submitted = stats.confirmed = len(calls)
+    pool.close()
+    return stats
+
+
+def _pooled(algod: StandinAlgod, calls: list[VaultCall], max_in_flight: int) -> CallStats:
+    with VaultClientPool(algod, max_in_flight=max_in_flight) as pool:
+        futures = pool.submit_many(calls)
+        for future in futures:
+            future.result()
+    return pool.stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--deposits", type=int, default=2000)
+    parser.add_argument("--vaults", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    args = parser.parse_args()
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    private_key, owner = account.generate_account()
+    algod.balances[owner] = 10**15
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [VaultSpec(owner, 10**12, deadline) for _ in range(args.vaults)]
+    with tempfile.TemporaryDirectory() as tmp:
+        BulkDeployer(
+            algod, owner, private_key, PROGRAMS, Manifest(Path(tmp) / "manifest.jsonl")
+        ).run(specs)
+    app_ids = sorted(algod.apps)
+    calls = [
+        VaultCall.deposit(app_ids[i % len(app_ids)], owner, private_key, 1_000 + i)
+        for i in range(args.deposits)
+    ]
+    algod.latency = args.latency_ms / 1000
+
+    sample = calls[: max(1, args.deposits // 10)]
+    runs = {
+        f"one at a time ({len(sample)})": _one_at_a_time(algod, sample),
+        f"pooled ({len(calls)})": _pooled(algod, calls, args.max_in_flight),
+    }
+    print(f"Deposit groups, {args.latency_ms:g} ms per algod request:")
+    for mode, stats in runs.items():
+        print(f"  {mode:<22} {stats}")
+
+
+if __name__ == "__main__":
+    main()
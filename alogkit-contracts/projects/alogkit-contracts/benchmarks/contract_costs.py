@@ -0,0 +1,198 @@
+"""
+Opcode-cost and program-size benchmark for the SavingsVault contracts.
+
+Usage (from the project root, after `algokit project run build`):
+    poetry run python -m benchmarks.contract_costs [--threshold 0.05] [--update-baseline]
+
+Runs offline against the compiled TEAL of every algopy contract in
+smart_contracts/artifacts and of the Beaker SavingsVault in contracts/. For each
+variant it reports program sizes, global-state schema, minimum balance requirements
+and the static worst-case opcode cost per ABI method, writes them to a
+machine-readable report and compares them against the committed baseline. Exits
+non-zero when any metric grows by more than the threshold, or when a variant or
+metric has no baseline yet (record it with --update-baseline).
+"""
+
+import argparse
+import ast
+import base64
+import json
+import re
+import sys
+from pathlib import Path
+
+from smart_contracts._helpers.contract_metrics import (
+    ContractMetrics,
+    measure_puya_artifacts,
+    measure_teal,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARTIFACTS_DIR = PROJECT_ROOT / "smart_contracts" / "artifacts"
+# The Beaker contract lives at the root of the web app repository.
+BEAKER_DIR = PROJECT_ROOT.parent.parent.parent / "contracts"
+BLOCKCHAIN_TS = BEAKER_DIR.parent / "src" / "lib" / "blockchain.ts"
+
+# Paid by the creator of every deployed vault, so they may not grow at all.
+STRICT_METRICS = ("global_ints", "global_bytes", "creator_mbr")
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "contract_costs.json"
+REPORT_PATH = PROJECT_ROOT / "smart_contracts" / ".benchmark" / "contract_costs.json"
+
+
+def _beaker_schema(app_source: Path) -> tuple[int, int]:
+    """Counts the uint64 and bytes GlobalStateValue declarations in contracts/app.py."""
+    ints = byte_slices = 0
+    for node in ast.walk(ast.parse(app_source.read_text())):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "GlobalStateValue":
+            for keyword in node.keywords:
+                if keyword.arg == "stack_type" and isinstance(keyword.value, ast.Attribute):
+                    if keyword.value.attr == "bytes":
+                        byte_slices += 1
+                    else:
+                        ints += 1
+    return ints, byte_slices
+
+
+def _beaker_program_size(kind: str) -> int | None:
+    """Size of the assembled Beaker program, from compile.py output or blockchain.ts."""
+    b64_path = BEAKER_DIR / "build" / f"{kind}.b64"
+    if b64_path.exists():
+        return len(base64.b64decode(b64_path.read_text()))
+    if BLOCKCHAIN_TS.exists():
+        constant = f"{kind.upper()}_B64"
+        match = re.search(rf'const {constant}\s*=\s*"([^"]*)"', BLOCKCHAIN_TS.read_text())
+        if match and match.group(1):
+            return len(base64.b64decode(match.group(1)))
+    return None
+
+
+def measure_beaker() -> ContractMetrics | None:
+    built_teal = BEAKER_DIR / "build" / "approval.teal"
+    # compile.py output when available, otherwise the hand-assembled program the dApp deploys.
+    if built_teal.exists() and built_teal.stat().st_size:
+        teal_path = built_teal
+    else:
+        teal_path = BEAKER_DIR / "approval.teal"
+    if not teal_path.exists():
+        return None
+    ints, byte_slices = _beaker_schema(BEAKER_DIR / "app.py")
+    return measure_teal(
+        teal_path.read_text(),
+        _beaker_program_size("approval"),
+        _beaker_program_size("clear"),
+        ints,
+        byte_slices,
+    )
+
+
+def measure_all() -> dict[str, dict[str, object]]:
+    variants: dict[str, dict[str, object]] = {}
+    for app_spec in sorted(ARTIFACTS_DIR.glob("*/*.arc56.json")):
+        contract_name = app_spec.name.removesuffix(".arc56.json")
+        metrics = measure_puya_artifacts(app_spec.parent, contract_name)
+        variants[f"algopy/{contract_name}"] = metrics.as_dict()
+    beaker = measure_beaker()
+    if beaker is not None:
+        variants["beaker/SavingsVault"] = beaker.as_dict()
+    return variants
+
+
+def _flatten(variants: dict[str, dict[str, object]]) -> dict[str, int]:
+    flat: dict[str, int] = {}
+    for variant, metrics in variants.items():
+        for name, value in metrics.items():
+            if isinstance(value, dict):
+                for method, cost in value.items():
+                    flat[f"{variant} {name}[{method}]"] = cost
+            elif isinstance(value, int):
+                flat[f"{variant} {name}"] = value
+    return flat
+
+
+def compare(
+    current: dict[str, dict[str, object]],
+    baseline: dict[str, dict[str, object]],
+    threshold: float,
+) -> list[str]:
+    """
+    Returns a description of every metric that regressed past the threshold (any
+    growth, for STRICT_METRICS) or is missing from the baseline, so a new variant
+    or method cannot pass unchecked.
+    """
+    regressions = [
+        f"{variant}: no baseline" for variant in current if variant not in baseline
+    ]
+    old = _flatten(baseline)
+    for key, value in _flatten({v: m for v, m in current.items() if v in baseline}).items():
+        previous = old.get(key)
+        allowed = 0.0 if key.rsplit(" ", 1)[-1] in STRICT_METRICS else threshold
+        if previous is None:
+            regressions.append(f"{key}: no baseline")
+        elif value > previous * (1 + allowed):
+            regressions.append(f"{key}: {previous} -> {value}")
+    return regressions
+
+
+def print_report(variants: dict[str, dict[str, object]]) -> None:
+    for variant, metrics in variants.items():
+        print(f"\n{variant}")
+        print(
+            f"  approval {metrics['approval_size']} B, clear {metrics['clear_size']} B, "
+            f"extra pages {metrics['extra_pages']}"
+        )
+        print(
+            f"  global schema {metrics['global_ints']} uint / {metrics['global_bytes']} bytes, "
+            f"creator MBR {metrics['creator_mbr']} µALGO, app account MBR {metrics['app_account_mbr']} µALGO"
+        )
+        loops = set(metrics["methods_with_loops"])  # type: ignore[arg-type]
+        for method, cost in metrics["method_costs"].items():  # type: ignore[union-attr]
+            note = " (loop counted once)" if method in loops else ""
+            print(f"  {cost:>6} ops  {method}{note}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Allowed relative growth of any metric before failing (default: 0.05)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"Write the current metrics to {BASELINE_PATH.relative_to(PROJECT_ROOT)}",
+    )
+    args = parser.parse_args()
+
+    variants = measure_all()
+    if not variants:
+        sys.exit("No compiled contracts found; run `algokit project run build` first.")
+    print_report(variants)
+
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    REPORT_PATH.write_text(json.dumps({"variants": variants}, indent=2) + "\n")
+    print(f"\nReport written to {REPORT_PATH.relative_to(PROJECT_ROOT)}")
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps({"variants": variants}, indent=2) + "\n")
+        print(f"Baseline updated at {BASELINE_PATH.relative_to(PROJECT_ROOT)}")
+        return
+    if not BASELINE_PATH.exists():
+        print("No baseline yet; run with --update-baseline to record one.")
+        return
+
+    baseline = json.loads(BASELINE_PATH.read_text())["variants"]
+    regressions = compare(variants, baseline, args.threshold)
+    if regressions:
+        sys.exit(
+            f"FAIL: {len(regressions)} metric(s) regressed by more than {args.threshold:.0%} "
+            f"or have no baseline (run with --update-baseline to record them):\n  "
+            + "\n  ".join(regressions)
+        )
+    print(f"OK: no metric regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
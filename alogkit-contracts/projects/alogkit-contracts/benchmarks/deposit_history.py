@@ -0,0 +1,150 @@
+"""
+Measures what SavingsVault's deposit history costs and what it saves on reads.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.deposit_history [--vaults 32] [--deposits 2000] \
+        [--capacity 63] [--last 10] [--latency-ms 2]
+
+Reports, from the built artifacts, the static worst-case opcode cost of each
+method with the history append costed in and out, and the minimum balance of the
+history box per capacity. Then, on a LocalNet stand-in with the given per-request
+latency, deposits into vaults with history enabled and compares reading a
+vault's last deposits from its box (one request) with scanning every block since
+the vaults were created for its Deposited events, as an indexer-less client would.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import abi, account, transaction
+from algosdk.logic import get_application_address
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.contract_metrics import GLOBAL_UINT_MBR
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts._helpers.teal_cost import TealProgram
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.client_pool import VaultCall, VaultClientPool
+from smart_contracts.savings_vault.follower import BlockFollower
+from smart_contracts.savings_vault.history import HISTORY_BOX, box_mbr, read_history
+from smart_contracts.savings_vault.reader import algod_transport
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / "smart_contracts" / "artifacts"
+ENABLE_HISTORY = abi.Method.from_signature("enable_history(uint64,pay)void")
+APPEND_SUBROUTINE = "_append_history"
+
+
+def _print_costs() -> None:
+    teal = ARTIFACTS_DIR / "savings_vault" / "SavingsVault.approval.teal"
+    if not teal.exists():
+        print("Opcode costs: not built, run `algokit project run build` first\n")
+        return
+    program = TealProgram.from_file(teal)
+    with_history = program.method_costs()
+    without = program.method_costs(skip_subroutines={APPEND_SUBROUTINE})
+    print("Static worst-case opcode cost per method:")
+    print(f"  {'method':<42} {'no history':>10} {'history':>8} {'extra':>6}")
+    for signature, cost in sorted(with_history.items()):
+        base = without[signature].cost
+        print(f"  {signature:<42} {base:>10} {cost.cost:>8} {cost.cost - base:>+6}")
+    print()
+
+
+def _print_mbr() -> None:
+    print("Minimum balance:")
+    print(f"  history_capacity global uint (creator, every vault): {GLOBAL_UINT_MBR} µALGO")
+    for capacity in (8, 16, 32, 63):
+        print(
+            f"  history box, {capacity:>2} entries (app account, refunded): "
+            f"{box_mbr(capacity):>9} µALGO"
+        )
+    print()
+
+
+def _enable_history(
+    algod: StandinAlgod, app_id: int, owner: str, private_key: str, capacity: int
+) -> None:
+    params = algod.suggested_params()
+    payment = transaction.PaymentTxn(
+        owner, params, get_application_address(app_id), box_mbr(capacity)
+    )
+    call = transaction.ApplicationCallTxn(
+        owner,
+        params,
+        app_id,
+        transaction.OnComplete.NoOpOC,
+        app_args=[ENABLE_HISTORY.get_selector(), capacity.to_bytes(8, "big")],
+        boxes=[(0, HISTORY_BOX)],
+    )
+    signed = [txn.sign(private_key) for txn in transaction.assign_group_id([payment, call])]
+    algod.send_transactions(signed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=32)
+    parser.add_argument("--deposits", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=63)
+    parser.add_argument("--last", type=int, default=10, help="deposits to read back")
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    _print_costs()
+    _print_mbr()
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    private_key, owner = account.generate_account()
+    algod.balances[owner] = 10**15
+    first_round = algod.status()["last-round"] + 1
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [VaultSpec(owner, 10**12, deadline) for _ in range(args.vaults)]
+    with tempfile.TemporaryDirectory() as tmp:
+        BulkDeployer(
+            algod, owner, private_key, PROGRAMS, Manifest(Path(tmp) / "manifest.jsonl")
+        ).run(specs)
+    app_ids = sorted(algod.apps)
+    for app_id in app_ids:
+        _enable_history(algod, app_id, owner, private_key, args.capacity)
+    calls = [
+        VaultCall.deposit(app_ids[i % len(app_ids)], owner, private_key, 1_000 + i)
+        for i in range(args.deposits)
+    ]
+    with VaultClientPool(algod) as pool:
+        for future in pool.submit_many(calls):
+            future.result()
+    algod.latency = args.latency_ms / 1000
+
+    app_id = app_ids[-1]
+    submitted = {call.amount for call in calls if call.app_id == app_id}
+
+    requests, started = algod.requests, time.perf_counter()
+    history = read_history(algod_transport(algod), app_id, args.last)
+    box_seconds, box_requests = time.perf_counter() - started, algod.requests - requests
+
+    requests, started = algod.requests, time.perf_counter()
+    follower = BlockFollower(algod, [app_id])
+    events = follower.events(from_round=first_round)
+    deposits = [event.amount for event in events if event.name == "Deposited"]
+    deposits = deposits[::-1][: args.last]
+    scan_seconds, scan_requests = time.perf_counter() - started, algod.requests - requests
+
+    # The pool submits from several workers, so deposits may confirm out of
+    # submission order: the box must match the order the blocks recorded.
+    amounts = [record.amount for record in history]
+    expected_count = min(args.last, len(submitted), args.capacity)
+    if amounts != deposits or len(amounts) != expected_count or not submitted >= set(amounts):
+        raise SystemExit(f"History mismatch: box={amounts} blocks={deposits}")
+    print(
+        f"Last {args.last} deposits of one vault ({args.deposits} deposits over "
+        f"{args.vaults} vaults, {args.latency_ms:g} ms per algod request):"
+    )
+    print(f"  {'source':<12} {'requests':>9} {'ms':>9}")
+    print(f"  {'history box':<12} {box_requests:>9} {box_seconds * 1000:>9.1f}")
+    print(f"  {'block scan':<12} {scan_requests:>9} {scan_seconds * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Measures the startup cost of the smart_contracts CLI with `python -X importtime`.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.import_time [--budget-ms 150] [--runs 5] [--top 15]
+
+Imports smart_contracts.__main__ in fresh interpreters, reports the slowest imports
+of the fastest run and exits non-zero when the total goes past the budget, or when
+a module that should only load on demand (network utilities, deploy configs) is
+imported at startup.
+"""
+
+import argparse
+import dataclasses
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TARGET_MODULE = "smart_contracts.__main__"
+
+# Modules that must only be imported once an action needs them: every contract's
+# deploy_config, found on disk so new contracts are covered too.
+LAZY_MODULES = (
+    "algokit_utils",
+    "dotenv",
+    *(
+        f"smart_contracts.{path.parent.name}.deploy_config"
+        for path in sorted((PROJECT_ROOT / "smart_contracts").glob("*/deploy_config.py"))
+    ),
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclasses.dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure() -> list[ImportRecord]:
+    """Imports the CLI module in a fresh interpreter and parses the importtime report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode:
+        raise SystemExit(f"Could not import {TARGET_MODULE}:\n{result.stderr}")
+    records = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    def total_us(run: list[ImportRecord]) -> int:
+        return next(r.cumulative_us for r in run if r.module == TARGET_MODULE)
+
+    # The fastest run is the least affected by noise from the rest of the machine.
+    best = min((measure() for _ in range(args.runs)), key=total_us)
+    total_ms = total_us(best) / 1000
+
+    print(f"Slowest imports for {TARGET_MODULE} (best of {args.runs} runs):")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    for record in sorted(best, key=lambda r: r.cumulative_us, reverse=True)[: args.top]:
+        print(
+            f"{record.cumulative_us / 1000:>16.1f} {record.self_us / 1000:>10.1f}  "
+            f"{'  ' * record.depth}{record.module}"
+        )
+    print(f"\nTotal: {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failures = []
+    eager = sorted(
+        {
+            record.module
+            for record in best
+            if any(
+                record.module == lazy or record.module.startswith(f"{lazy}.")
+                for lazy in LAZY_MODULES
+            )
+        }
+    )
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"startup took {total_ms:.1f} ms, over the {args.budget_ms:.1f} ms budget")
+    if failures:
+        raise SystemExit("FAIL: " + "; ".join(failures))
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
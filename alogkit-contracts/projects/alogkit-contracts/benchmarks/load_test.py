@@ -0,0 +1,193 @@
+"""
+Load test of SavingsVault deposit/withdraw/read flows against the LocalNet stand-in.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.load_test [--owners 50] [--vaults-per-owner 4] \
+        [--ops 5000] [--rate 500] [--mix deposit=70,withdraw=10,read=20] \
+        [--expired-share 0.25] [--latency-ms 2]
+
+Creates owners × vaults-per-owner vaults with the bulk deployment pipeline (a
+share of them with a deadline already in the past), then replays a random mix of
+deposits, withdrawals and state reads at the target rate through VaultClientPool
+and VaultReader. Withdrawals hit active and expired vaults alike, so both the
+"before deadline" rejection and the "after deadline" release path are exercised.
+
+Reports achieved throughput, latency percentiles per method (from the time each
+operation was due, so queueing behind a saturated pool counts), rejections per
+assert message and the fees paid by confirmed groups.
+"""
+
+import argparse
+import collections
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from algosdk import account
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.client_pool import VaultCall, VaultClientPool
+from smart_contracts.savings_vault.reader import VaultReader, algod_transport
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+METHODS = ("deposit", "withdraw", "read")
+
+# "... assert failed // <message>" from the stand-in, "... // <message>" in the TEAL
+# line algod quotes for a failed puya assert.
+_ASSERT_MESSAGE = re.compile(r"//\s*(.+?)\s*$")
+
+
+def _parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        method, _, weight = part.partition("=")
+        if method not in METHODS:
+            raise SystemExit(f"Unknown method {method!r} in --mix (expected {METHODS})")
+        mix[method] = float(weight)
+    return mix
+
+
+def _rejection_reason(error: BaseException) -> str:
+    match = _ASSERT_MESSAGE.search(str(error))
+    return match.group(1) if match else f"{type(error).__name__}: {error}"
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class LoadReport:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = collections.defaultdict(list)
+        self.rejections: dict[str, collections.Counter[str]] = collections.defaultdict(
+            collections.Counter
+        )
+        self._lock = threading.Lock()
+
+    def track(self, method: str, future: Future[object], started: float) -> None:
+        """
+        Records an operation's outcome. Latency runs from `started`, the time it was
+        due to be sent, so signing and waiting for an in-flight slot are counted.
+        """
+
+        def done(finished: Future[object]) -> None:
+            elapsed = time.perf_counter() - started
+            error = finished.exception()
+            with self._lock:
+                if error is None:
+                    self.latencies[method].append(elapsed)
+                else:
+                    self.rejections[method][_rejection_reason(error)] += 1
+
+        future.add_done_callback(done)
+
+    def print(self, elapsed: float, target_rate: float, fees: int) -> None:
+        ok = sum(len(values) for values in self.latencies.values())
+        rejected = sum(sum(counter.values()) for counter in self.rejections.values())
+        print(
+            f"{ok + rejected} operations in {elapsed:.2f}s: "
+            f"{(ok + rejected) / elapsed:.0f} ops/s achieved (target {target_rate:g}), "
+            f"{ok / elapsed:.0f} successful/s"
+        )
+        print(
+            f"  {'method':<9} {'ok':>6} {'rejected':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for method in METHODS:
+            values = self.latencies.get(method, [])
+            failures = sum(self.rejections.get(method, {}).values())
+            if not values and not failures:
+                continue
+            print(
+                f"  {method:<9} {len(values):>6} {failures:>8} "
+                f"{_percentile(values, 50) * 1000:>8.1f} {_percentile(values, 95) * 1000:>8.1f} "
+                f"{_percentile(values, 99) * 1000:>8.1f}"
+            )
+        if rejected:
+            print("Rejections:")
+            for method, counter in self.rejections.items():
+                for reason, count in counter.most_common():
+                    print(f"  {method:<9} {count:>6}  {reason}")
+        print(f"Fees paid by confirmed groups: {fees} µALGO ({fees / 1e6:.3f} ALGO)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--owners", type=int, default=50)
+    parser.add_argument("--vaults-per-owner", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=500.0, help="target operations/s")
+    parser.add_argument("--mix", type=_parse_mix, default="deposit=70,withdraw=10,read=20")
+    parser.add_argument("--expired-share", type=float, default=0.25)
+    parser.add_argument("--deposit-amount", type=int, default=50_000)
+    parser.add_argument("--target", type=int, default=2_000_000, help="goal per vault")
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    deployer_key, deployer = account.generate_account()
+    algod.balances[deployer] = 10**15
+    owners = [account.generate_account() for _ in range(args.owners)]
+    for _, owner in owners:
+        algod.balances[owner] = 10**12
+
+    now = int(time.time())
+    specs, keys = [], []
+    for private_key, owner in owners:
+        for _ in range(args.vaults_per_owner):
+            expired = rng.random() < args.expired_share
+            deadline = now - 3600 if expired else now + 30 * 24 * 3600
+            specs.append(VaultSpec(owner, args.target, deadline))
+            keys.append(private_key)
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Manifest(Path(tmp) / "manifest.jsonl")
+        report = BulkDeployer(algod, deployer, deployer_key, PROGRAMS, manifest).run(specs)
+        created = manifest.load()
+    print(f"Setup: {report}")
+    vaults = [
+        (entry["app_id"], specs[index].owner, keys[index]) for index, entry in created.items()
+    ]
+    algod.latency = args.latency_ms / 1000
+
+    methods = list(args.mix)
+    weights = [args.mix[method] for method in methods]
+    load = LoadReport()
+    reader = VaultReader(algod_transport(algod))
+    with (
+        VaultClientPool(algod, max_in_flight=args.max_in_flight) as pool,
+        ThreadPoolExecutor(max_workers=16) as readers,
+    ):
+        started = time.perf_counter()
+        for i in range(args.ops):
+            due = started + i / args.rate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            method = rng.choices(methods, weights)[0]
+            app_id, owner, private_key = rng.choice(vaults)
+            if method == "read":
+                future: Future[object] = readers.submit(reader.get, app_id)
+            elif method == "deposit":
+                call = VaultCall.deposit(app_id, owner, private_key, args.deposit_amount)
+                future = pool.submit_many([call])[0]
+            else:
+                future = pool.submit_many([VaultCall.withdraw(app_id, owner, private_key)])[0]
+            load.track(method, future, due)
+    elapsed = time.perf_counter() - started
+    load.print(elapsed, args.rate, pool.stats.fees)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Compares finding vaults by deadline through a VaultRegistry with a fleet scan.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.registry_query [--vaults 4096] [--window-days 7] \
+        [--latency-ms 5]
+
+Deploys a cohort of vaults registered with a VaultRegistry on a LocalNet stand-in
+with the given per-request latency, deadlines spread over a year, then reads the
+state of the vaults whose deadline falls in the next --window-days twice: by
+reading every vault and filtering on its deadline (VaultReader), and by listing
+the registry's box names once and reading only the vaults in the window
+(vaults_due + SnapshotReader). Reports requests and wall time for each, checks
+both find the same vaults, and that settling the expired vaults with the
+sweeper removes exactly their entries.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import account, transaction
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.reader import VaultReader, algod_transport
+from smart_contracts.savings_vault.snapshot_reader import SnapshotReader
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+from smart_contracts.savings_vault.sweeper import Sweeper
+from smart_contracts.vault_registry.query import list_entries, vaults_due
+from smart_contracts.vault_registry.standin import vault_registry_handlers
+
+_DAY = 24 * 3600
+
+
+def _create_registry(algod: StandinAlgod, creator: str, private_key: str) -> int:
+    txn = transaction.ApplicationCreateTxn(
+        creator,
+        algod.suggested_params(),
+        transaction.OnComplete.NoOpOC,
+        approval_program=b"\x0a",
+        clear_program=b"\x0a",
+        global_schema=transaction.StateSchema(num_uints=1, num_byte_slices=0),
+        local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+    )
+    txid = algod.send_transaction(txn.sign(private_key))
+    return algod.pending_transaction_info(txid)["application-index"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=4096)
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--expired-share", type=float, default=0.05)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    algod = StandinAlgod(handlers=savings_vault_handlers() | vault_registry_handlers())
+    private_key, deployer = account.generate_account()
+    algod.balances[deployer] = 10**15
+    registry = _create_registry(algod, deployer, private_key)
+
+    now = int(time.time())
+    specs = [
+        VaultSpec(
+            deployer,
+            5_000_000,
+            now - rng.randint(1, 30) * _DAY
+            if rng.random() < args.expired_share
+            else now + rng.randint(1, 365 * _DAY),
+        )
+        for _ in range(args.vaults)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Manifest(Path(tmp) / "manifest.jsonl")
+        BulkDeployer(
+            algod, deployer, private_key, PROGRAMS, manifest, registry_app_id=registry
+        ).run(specs)
+        app_ids = sorted(entry["app_id"] for entry in manifest.load().values())
+    algod.latency = args.latency_ms / 1000
+    window = (now, now + args.window_days * _DAY)
+
+    print(
+        f"Finding the vaults due in the next {args.window_days} day(s) among {len(app_ids)}, "
+        f"{args.latency_ms:g} ms per algod request (max {args.max_in_flight} in flight):"
+    )
+    print(f"  {'mode':<28} {'found':>7} {'requests':>9} {'ms':>9}")
+
+    requests, started = algod.requests, time.perf_counter()
+    reader = VaultReader(algod_transport(algod), max_in_flight=args.max_in_flight)
+    scanned = {
+        vault.app_id for vault in reader.read(app_ids) if window[0] <= vault.deadline < window[1]
+    }
+    scan = (len(scanned), algod.requests - requests, time.perf_counter() - started)
+
+    requests, started = algod.requests, time.perf_counter()
+    due = vaults_due(algod, registry, *window)
+    snapshots = SnapshotReader(algod, deployer, max_in_flight=args.max_in_flight).read(
+        entry.app_id for entry in due
+    )
+    indexed = {snapshot.app_id for snapshot in snapshots}
+    query = (len(indexed), algod.requests - requests, time.perf_counter() - started)
+
+    if scanned != indexed:
+        raise SystemExit(f"Registry found {len(indexed)} vaults, the scan {len(scanned)}")
+    for mode, (found, requests, elapsed) in (
+        ("scan every vault", scan),
+        ("registry + get_state", query),
+    ):
+        print(f"  {mode:<28} {found:>7} {requests:>9} {elapsed * 1000:>9.1f}")
+
+    # Settling the expired vaults deregisters them, and only them.
+    algod.latency = 0.0
+    sweeper = Sweeper(algod, deployer, private_key)
+    expired = sweeper.expired_in_registry(registry)
+    report = sweeper.run(expired, registry=registry)
+    left = {entry.app_id for entry in list_entries(algod, registry)}
+    if report.failed or left & set(expired) or len(left) != len(app_ids) - len(expired):
+        raise SystemExit(f"Registry holds {len(left)} entries after {report}")
+    print(f"  swept {report.settled} expired vault(s), {len(left)} entries left")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Measures per-transaction overhead of the dev, ci and prod runtime profiles.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.runtime_profiles [--txns 500] [--failures 50] \
+        [--latency-ms 0]
+
+Deploys a set of vaults on a LocalNet stand-in, then for each profile applies its
+logging and algokit_utils configuration (log output goes to a file, traces to a
+temporary project root) and sends:
+
+    • --txns payments through algokit_utils' AlgorandClient, as deploy_configs do;
+    • --failures release() calls that fail (the vaults are not due yet) through
+      AlgorandClient, where debug mode simulates and traces each one inline;
+    • --txns deposits and --failures early withdrawals through VaultClientPool,
+      whose failures go to the sampled failure_traces writer under prod.
+
+Reports µs per successful transaction, ms per failed call, and the log output and
+trace files each profile left on disk (algokit_utils names its traces by second
+and round, so failures within the same second overwrite each other's).
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import algokit_utils
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers import failure_traces, runtime
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.client_pool import VaultCall, VaultClientPool
+from smart_contracts.savings_vault.history import HISTORY_BOX
+from smart_contracts.savings_vault.standin import RELEASE, savings_vault_handlers
+
+
+def _per_call(func, count: int) -> float:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter() - started) / count if count else 0.0
+
+
+def _run_profile(
+    profile: runtime.RuntimeProfile,
+    algod: StandinAlgod,
+    owner: str,
+    private_key: str,
+    app_ids: list[int],
+    args: argparse.Namespace,
+) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = Path(tmp)
+        with open(project_root / "run.log", "w") as log_file:
+            runtime.apply(profile, project_root, stream=log_file)
+            runtime.configure_algokit(profile, project_root)
+            algorand = algokit_utils.AlgorandClient.from_clients(algod)
+            algorand.set_signer(owner, AccountTransactionSigner(private_key))
+
+            payment = _per_call(
+                lambda i: algorand.send.payment(
+                    algokit_utils.PaymentParams(
+                        sender=owner,
+                        receiver=owner,
+                        amount=algokit_utils.AlgoAmount(micro_algo=0),
+                        note=i.to_bytes(4, "big"),
+                    )
+                ),
+                args.txns,
+            )
+
+            def failing_release(i: int) -> None:
+                app_id = app_ids[i % len(app_ids)]
+                try:
+                    algorand.send.app_call(
+                        algokit_utils.AppCallParams(
+                            sender=owner,
+                            app_id=app_id,
+                            on_complete=transaction.OnComplete.NoOpOC,
+                            args=[RELEASE.get_selector(), i.to_bytes(4, "big")],
+                            account_references=[owner],
+                            box_references=[algokit_utils.BoxReference(0, HISTORY_BOX)],
+                        )
+                    )
+                except Exception:
+                    pass
+                else:
+                    raise SystemExit(f"release() of vault {app_id} passed before its deadline")
+
+            release_failure = _per_call(failing_release, args.failures)
+
+            calls = [
+                VaultCall.deposit(app_ids[i % len(app_ids)], owner, private_key, 1_000 + i)
+                for i in range(args.txns)
+            ] + [
+                VaultCall.withdraw(app_ids[i % len(app_ids)], owner, private_key)
+                for i in range(args.failures)
+            ]
+            started = time.perf_counter()
+            with VaultClientPool(algod, max_in_flight=args.max_in_flight) as pool:
+                futures = pool.submit_many(calls)
+                failed = sum(future.exception() is not None for future in futures)
+            pooled = (time.perf_counter() - started) / len(calls)
+            # Wait for the background writer, as the process would at exit.
+            failure_traces.disable()
+            runtime.configure_logging(profile)  # stop the listener before closing its file
+            if failed != args.failures:
+                raise SystemExit(f"{failed} pooled calls failed, expected {args.failures}")
+
+        log_kb = (project_root / "run.log").stat().st_size / 1024
+        traces = list((project_root / failure_traces.TRACES_DIR).glob("*"))
+        return {
+            "payment_us": payment * 1e6,
+            "release_failure_ms": release_failure * 1e3,
+            "pooled_us": pooled * 1e6,
+            "trace_files": len(traces),
+            "trace_kb": sum(path.stat().st_size for path in traces) / 1024,
+            "log_kb": log_kb,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--txns", type=int, default=500)
+    parser.add_argument("--failures", type=int, default=50)
+    parser.add_argument("--vaults", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument(
+        "--profiles", nargs="+", choices=sorted(runtime.PROFILES), default=list(runtime.PROFILES)
+    )
+    args = parser.parse_args()
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    private_key, owner = account.generate_account()
+    algod.balances[owner] = 10**15
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [VaultSpec(owner, 10**12, deadline) for _ in range(args.vaults)]
+    with tempfile.TemporaryDirectory() as tmp:
+        BulkDeployer(
+            algod, owner, private_key, PROGRAMS, Manifest(Path(tmp) / "manifest.jsonl")
+        ).run(specs)
+    app_ids = sorted(algod.apps)
+    algod.latency = args.latency_ms / 1000
+
+    results = {
+        name: _run_profile(runtime.PROFILES[name], algod, owner, private_key, app_ids, args)
+        for name in args.profiles
+    }
+    print(
+        f"{args.txns} transactions and {args.failures} failing calls per path, "
+        f"{args.latency_ms:g} ms per algod request:"
+    )
+    print(
+        f"  {'profile':<8} {'payment µs':>11} {'failed call ms':>15} {'pooled µs':>10} "
+        f"{'log KB':>8} {'traces':>7} {'trace KB':>9}"
+    )
+    for name, result in results.items():
+        print(
+            f"  {name:<8} {result['payment_us']:>11.0f} {result['release_failure_ms']:>15.2f} "
+            f"{result['pooled_us']:>10.0f} {result['log_kb']:>8.1f} {result['trace_files']:>7} "
+            f"{result['trace_kb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
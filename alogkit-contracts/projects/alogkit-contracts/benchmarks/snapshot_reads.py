@@ -0,0 +1,119 @@
+"""
+Compares reading SavingsVault state by simulate batches with per-vault lookups.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.snapshot_reads [--vaults 1024] [--goals 12] \
+        [--latency-ms 5]
+
+Deploys and partly funds a fleet of vaults on a LocalNet stand-in with the given
+per-request latency, then reads one owner's goal list (--goals vaults) and the
+whole fleet twice: with VaultReader plus an account lookup per vault for its
+balance (what a client needs to show balance and remaining), and with
+SnapshotReader, which gets the same fields from get_state, 16 vaults per simulate
+request. Reports requests and wall time for each and checks both agree.
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.client_pool import VaultCall, VaultClientPool
+from smart_contracts.savings_vault.reader import VaultReader, algod_transport
+from smart_contracts.savings_vault.snapshot_reader import SnapshotReader, VaultSnapshot
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+
+def _lookups(algod: StandinAlgod, app_ids: list[int], max_in_flight: int) -> list[VaultSnapshot]:
+    """Global state through VaultReader, then the balance of every app account."""
+    transport = algod_transport(algod)
+    reader = VaultReader(transport, max_in_flight=max_in_flight)
+    snapshots = []
+    for vault in reader.read(app_ids):
+        balance = transport(f"/accounts/{get_application_address(vault.app_id)}")["amount"]
+        snapshots.append(
+            VaultSnapshot(
+                vault.app_id,
+                vault.goal_owner,
+                vault.target_amount,
+                vault.total_saved,
+                vault.deadline,
+                vault.goal_completed,
+                balance,
+                max(vault.target_amount - vault.total_saved, 0),
+                vault.round,
+            )
+        )
+    return snapshots
+
+
+def _measure(
+    algod: StandinAlgod, read: Callable[[], list[VaultSnapshot]]
+) -> tuple[dict[int, tuple[object, ...]], int, float]:
+    requests, started = algod.requests, time.perf_counter()
+    snapshots = read()
+    elapsed = time.perf_counter() - started
+    # The round is when each was read, not part of the vault's state.
+    by_app = {snapshot.app_id: snapshot[:-1] for snapshot in snapshots}
+    return by_app, algod.requests - requests, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=1024)
+    parser.add_argument("--goals", type=int, default=12, help="vaults in one owner's goal list")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    args = parser.parse_args()
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    private_key, owner = account.generate_account()
+    algod.balances[owner] = 10**15
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [VaultSpec(owner, 5_000_000, deadline) for _ in range(args.vaults)]
+    with tempfile.TemporaryDirectory() as tmp:
+        BulkDeployer(
+            algod, owner, private_key, PROGRAMS, Manifest(Path(tmp) / "manifest.jsonl")
+        ).run(specs)
+    app_ids = sorted(algod.apps)
+    with VaultClientPool(algod) as pool:
+        calls = [
+            VaultCall.deposit(app_id, owner, private_key, 1_000_000 * (i % 7))
+            for i, app_id in enumerate(app_ids)
+            if i % 7
+        ]
+        for future in pool.submit_many(calls):
+            future.result()
+    algod.latency = args.latency_ms / 1000
+
+    print(
+        f"Reading SavingsVault state, {args.latency_ms:g} ms per algod request "
+        f"(max {args.max_in_flight} in flight):"
+    )
+    print(f"  {'read':<30} {'vaults':>7} {'requests':>9} {'ms':>9}")
+    for label, selected in (("goal list", app_ids[: args.goals]), ("fleet", app_ids)):
+        lookups = _measure(algod, partial(_lookups, algod, selected, args.max_in_flight))
+        reader = SnapshotReader(algod, owner, max_in_flight=args.max_in_flight)
+        batched = _measure(algod, partial(list, reader.read(selected)))
+        if lookups[0] != batched[0] or len(batched[0]) != len(selected):
+            raise SystemExit(f"Snapshot mismatch reading the {label}")
+        for mode, (_, requests, elapsed) in (
+            ("lookups", lookups),
+            ("simulate get_state", batched),
+        ):
+            print(
+                f"  {label + ', ' + mode:<30} {len(selected):>7} {requests:>9} "
+                f"{elapsed * 1000:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Compares the classic one-key-per-field SavingsVault global-state layout with the
+packed single-key layout of PackedSavingsVault.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.state_layout [--records 100000]
+
+Reports global schema and minimum balance cost (from the built ARC-56 specs) and
+static opcode cost per method, when the contracts have been built, and the time to
+decode algod `global-state` arrays into VaultState records with each layout's decoder.
+"""
+
+import argparse
+import base64
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from smart_contracts._helpers.contract_metrics import (
+    GLOBAL_BYTES_MBR,
+    GLOBAL_UINT_MBR,
+    ContractMetrics,
+    measure_puya_artifacts,
+)
+from smart_contracts.packed_savings_vault import layout
+from smart_contracts.savings_vault import state
+from smart_contracts.savings_vault.state import VaultState
+
+ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / "smart_contracts" / "artifacts"
+
+# (artifact folder, contract name)
+LAYOUTS = {
+    "classic": ("savings_vault", "SavingsVault"),
+    "packed": ("packed_savings_vault", "PackedSavingsVault"),
+}
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _classic_entries(vault: VaultState) -> list[dict[str, Any]]:
+    def uint(key: str, value: int) -> dict[str, Any]:
+        return {"key": _b64(key.encode()), "value": {"type": 2, "bytes": "", "uint": value}}
+
+    owner = {"type": 1, "bytes": _b64(vault.goal_owner), "uint": 0}
+    return [
+        {"key": _b64(b"goal_owner"), "value": owner},
+        uint("target_amount", vault.target_amount),
+        uint("total_saved", vault.total_saved),
+        uint("deadline", vault.deadline),
+        uint("goal_completed", int(vault.goal_completed)),
+    ]
+
+
+def _packed_entries(vault: VaultState) -> list[dict[str, Any]]:
+    record = {"type": 1, "bytes": _b64(layout.encode_goal_record(vault)), "uint": 0}
+    return [{"key": _b64(layout.GOAL_KEY), "value": record}]
+
+
+def _time_decode(
+    decode: Callable[[int, list[dict[str, Any]]], VaultState],
+    arrays: list[list[dict[str, Any]]],
+    expected: list[VaultState],
+) -> float:
+    started = time.perf_counter()
+    decoded = [decode(app_id, entries) for app_id, entries in enumerate(arrays, start=1)]
+    elapsed = time.perf_counter() - started
+    if decoded != expected:
+        raise SystemExit(f"{decode.__module__} did not round-trip the generated vaults")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    measured: dict[str, ContractMetrics] = {}
+    for name, (folder, contract_name) in LAYOUTS.items():
+        output_dir = ARTIFACTS_DIR / folder
+        if (output_dir / f"{contract_name}.approval.teal").exists():
+            measured[name] = measure_puya_artifacts(output_dir, contract_name)
+
+    print(f"{'layout':<8} {'uints':>5} {'bytes':>5} {'schema MBR (µALGO)':>19}")
+    for name in LAYOUTS:
+        if name not in measured:
+            print(f"{name:<8} not built, run `algokit project run build` first")
+            continue
+        metrics = measured[name]
+        mbr = GLOBAL_UINT_MBR * metrics.global_ints + GLOBAL_BYTES_MBR * metrics.global_bytes
+        print(f"{name:<8} {metrics.global_ints:>5} {metrics.global_bytes:>5} {mbr:>19}")
+
+    print("\nStatic worst-case opcode cost per method:")
+    for name, metrics in measured.items():
+        for method, cost in sorted(metrics.method_costs.items()):
+            print(f"  {name:<8} {cost:>5} ops  {method}")
+
+    vaults = [
+        VaultState(
+            app_id=app_id,
+            goal_owner=os.urandom(32),
+            target_amount=5_000_000 + app_id,
+            total_saved=app_id * 1_000,
+            deadline=1_800_000_000 + app_id,
+            goal_completed=app_id % 7 == 0,
+        )
+        for app_id in range(1, args.records + 1)
+    ]
+    timings = {
+        "classic": _time_decode(
+            state.decode_global_state, [_classic_entries(vault) for vault in vaults], vaults
+        ),
+        "packed": _time_decode(
+            layout.decode_global_state, [_packed_entries(vault) for vault in vaults], vaults
+        ),
+    }
+    print(f"\nDecoding {args.records} global-state arrays into VaultState records:")
+    for name, elapsed in timings.items():
+        print(
+            f"  {name:<8} {elapsed:>8.3f} s  "
+            f"{elapsed / args.records * 1e6:>6.2f} µs/record  {args.records / elapsed:>10.0f} records/s"
+        )
+    print(f"  packed decode speedup: {timings['classic'] / timings['packed']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Measures fleet state reads with VaultReader against the LocalNet stand-in.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.state_reader [--vaults 1000] [--latency-ms 5]
+
+Deploys a cohort of vaults on a StandinAlgod with the given per-request latency,
+then reads the whole fleet three ways: one application lookup after another (as
+getGoalOnChainState does per goal), concurrently through VaultReader, and again
+through the same reader within the same round (served from its cache).
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import account
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.reader import VaultReader, algod_transport
+from smart_contracts.savings_vault.state import decode_global_state
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    args = parser.parse_args()
+
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    private_key, sender = account.generate_account()
+    algod.balances[sender] = 10**15
+    deadline = int(time.time()) + 30 * 24 * 3600
+    specs = [VaultSpec(sender, 1_000_000 + i, deadline) for i in range(args.vaults)]
+    with tempfile.TemporaryDirectory() as tmp:
+        BulkDeployer(
+            algod, sender, private_key, PROGRAMS, Manifest(Path(tmp) / "manifest.jsonl")
+        ).run(specs)
+    app_ids = sorted(algod.apps)
+    algod.latency = args.latency_ms / 1000
+
+    started = time.perf_counter()
+    sequential = [
+        decode_global_state(app_id, algod.application_info(app_id)["params"]["global-state"])
+        for app_id in app_ids
+    ]
+    timings = {"sequential": time.perf_counter() - started}
+
+    reader = VaultReader(algod_transport(algod), max_in_flight=args.max_in_flight)
+    for mode in ("pooled", "pooled, cached"):
+        started = time.perf_counter()
+        records = sum(1 for _ in reader.read(app_ids))
+        timings[mode] = time.perf_counter() - started
+        if records != len(sequential):
+            raise SystemExit(f"{mode}: read {records} of {len(sequential)} vaults")
+
+    print(
+        f"Reading {len(app_ids)} vaults, {args.latency_ms:g} ms per algod request "
+        f"(max {args.max_in_flight} in flight):"
+    )
+    for mode, elapsed in timings.items():
+        print(f"  {mode:<15} {elapsed:>8.3f} s  {len(app_ids) / elapsed:>10.0f} vaults/s")
+    print(f"  reader requests: {reader.requests}, cache hits: {reader.cache_hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Measures how fast the sweeper settles expired SavingsVaults on the LocalNet stand-in.
+
+Usage (from the project root):
+    poetry run python -m benchmarks.sweeper [--vaults 1024] [--expired-share 0.75] \
+        [--latency-ms 2]
+
+Deploys a cohort of funded vaults (a share of them already past their deadline)
+on a fresh StandinAlgod for each run, then releases every due vault once with a
+single release call per group and one group in flight at a time, and once packed
+16 per fee-pooled group and pipelined. Reports vaults settled/s, groups and fees,
+and checks that every released balance reached its owner and no active vault
+was touched.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from benchmarks.bulk_deploy import PROGRAMS
+from smart_contracts._helpers.localnet_standin import StandinAlgod
+from smart_contracts.savings_vault.bulk_deploy import BulkDeployer, Manifest, VaultSpec
+from smart_contracts.savings_vault.standin import savings_vault_handlers
+from smart_contracts.savings_vault.sweeper import Sweeper, SweepReport
+
+
+def _run(
+    specs: list[VaultSpec], latency: float, max_in_flight: int, group_size: int
+) -> SweepReport:
+    algod = StandinAlgod(handlers=savings_vault_handlers())
+    deployer_key, deployer = account.generate_account()
+    algod.balances[deployer] = 10**15
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Manifest(Path(tmp) / "manifest.jsonl")
+        BulkDeployer(algod, deployer, deployer_key, PROGRAMS, manifest).run(specs)
+        created = manifest.load()
+    app_ids = {entry["app_id"]: specs[index] for index, entry in created.items()}
+    owners_before = {spec.owner: algod.balances.get(spec.owner, 0) for spec in specs}
+
+    sweeper_key, sweeper = account.generate_account()
+    algod.balances[sweeper] = 10**12
+    algod.latency = latency
+    report = Sweeper(
+        algod, sweeper, sweeper_key, max_in_flight=max_in_flight, group_size=group_size
+    ).run(sorted(app_ids))
+
+    now = int(time.time())
+    for app_id, spec in app_ids.items():
+        expired = spec.deadline < now
+        remaining = algod.balances.get(get_application_address(app_id), 0)
+        if expired == bool(remaining):
+            raise SystemExit(f"Vault {app_id} (expired={expired}) holds {remaining} µALGO")
+    paid_out = sum(algod.balances.get(owner, 0) - before for owner, before in owners_before.items())
+    if paid_out != report.released or report.failed:
+        raise SystemExit(f"Owners received {paid_out} µALGO for {report}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vaults", type=int, default=1024)
+    parser.add_argument("--expired-share", type=float, default=0.75)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    now = int(time.time())
+    specs = [
+        VaultSpec(
+            account.generate_account()[1],
+            1_000_000,
+            now - 3600 if rng.random() < args.expired_share else now + 30 * 24 * 3600,
+        )
+        for _ in range(args.vaults)
+    ]
+    latency = args.latency_ms / 1000
+    runs = {
+        "one per group": _run(specs, latency, max_in_flight=1, group_size=1),
+        "16 per group, pipelined": _run(specs, latency, args.max_in_flight, group_size=16),
+    }
+
+    print(
+        f"Sweeping {args.vaults} vaults ({args.expired_share:.0%} expired), "
+        f"{args.latency_ms:g} ms per algod request:"
+    )
+    print(
+        f"  {'mode':<24} {'settled':>8} {'seconds':>8} {'vaults/s':>9} {'groups':>7} "
+        f"{'fees µALGO':>11}"
+    )
+    for mode, report in runs.items():
+        print(
+            f"  {mode:<24} {report.settled:>8} {report.elapsed:>8.2f} "
+            f"{report.vaults_per_second:>9.1f} {report.groups:>7} {report.fees:>11}"
+        )
+    single, packed = runs["one per group"], runs["16 per group, pipelined"]
+    print(f"  speedup: {single.elapsed / packed.elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,48 @@
+import argparse
 import dataclasses
+import functools
 import importlib
 import logging
+import os
 import subprocess
 import sys
 from collections.abc import Callable
 from pathlib import Path
 from shutil import rmtree
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
+from smart_contracts._helpers import profiling, runtime
+from smart_contracts._helpers.build_cache import BuildCache, compute_key
+from smart_contracts._helpers.inprocess_build import compile_contracts, generate_clients
+from smart_contracts._helpers.objectives import OBJECTIVES
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import write_program_cache
+from smart_contracts._helpers.scheduler import Job, run_jobs
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
 
+# Set up logging and failure tracing for the runtime profile (--runtime, or the
+# RUNTIME_PROFILE environment variable inherited by workers). The AlgoKit network
+# configuration and environment variables are only loaded once an action actually
+# needs them (see configure_network below), so build-only invocations don't pay
+# for importing algokit_utils.
+runtime_profile = runtime.apply(runtime.get_profile(), root_path.parent)
+
+
+@functools.cache
+def configure_network() -> None:
+    """Configures AlgoKit and loads environment variables before the first deploy."""
+    with span("configure network"):
+        from dotenv import load_dotenv
+
+        runtime.configure_algokit(runtime_profile)
+
+        logger.info("Loading .env")
+        load_dotenv()
+
+
 # ----------------------- Contract Configuration ----------------------- #
 
 
@@ -33,7 +50,11 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> Callable[[], None] | None:
+        """The folder's deploy function, imported on first access."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -47,9 +68,13 @@ def import_contract(folder: Path) -> Path:
 
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
     """Imports the deploy function from a folder if it exists."""
+    if not (folder / "deploy_config.py").exists():
+        return None
+    configure_network()
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
-        deploy_module = importlib.import_module(module_name)
+        with span("import deploy_config", contract=folder.name):
+            deploy_module = importlib.import_module(module_name)
         return deploy_module.deploy  # type: ignore[no-any-return, misc]
     except ImportError:
         return None
@@ -61,14 +86,14 @@ def has_contract_file(directory: Path) -> bool:
 
 
 # Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
+# folders that start with '_' (internal helpers). Discovery only looks at the file
+# system; deploy modules are imported lazily through SmartContract.deploy.
 contracts: list[SmartContract] = [
     SmartContract(
         path=import_contract(folder),
         name=folder.name,
-        deploy=import_deploy_if_exists(folder),
     )
-    for folder in root_path.iterdir()
+    for folder in sorted(root_path.iterdir())
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
 ]
 
@@ -76,6 +101,15 @@ contracts: list[SmartContract] = [
 
 deployment_extension = "py"
 
+# Flags passed to `algokit compile python`; part of the build cache key.
+# --output-bytecode writes the assembled programs, used to track program size and
+# deployed as they are (see program_cache).
+compile_flags = ["--output-source-map", "--output-bytecode"]
+
+# Persistent cache of the last successful build per contract, kept out of the
+# artifacts folder so it never shows up in the CI TEAL diff.
+build_cache = BuildCache(root_path.parent / ".algokit" / "build_cache")
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,17 +120,14 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
-    """
-    Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
-    """
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+def _find_client_or_output_dir(output_dir: Path) -> Path:
+    """Mirrors the return value of a fresh build for a cached output directory."""
+    app_spec_files = sorted(output_dir.glob("*.arc56.json"))
+    return output_dir / app_spec_files[-1].name if app_spec_files else output_dir
+
 
+def _compile(contract_path: Path, output_dir: Path, flags: list[str]) -> str:
+    """Compiles a contract with `algokit compile python`, returning its output."""
     build_result = subprocess.run(
         [
             "algokit",
@@ -105,18 +136,59 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
-            "--output-source-map",
+            *flags,
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
     )
-
-    if build_result.stdout:
-        print(build_result.stdout)
-
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    return build_result.stdout
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    use_cache: bool = True,
+    objective: str | None = None,
+) -> Path:
+    """
+    Builds the contract by exporting (compiling) its source and generating a client.
+    If the contract, its local imports, the tool versions and the compile flags are
+    unchanged since the last successful build, the existing artifacts are kept as-is.
+    Otherwise the output directory is cleared and rebuilt. With an `objective`
+    ("size" or "cost"), every optimisation variant is compiled and the best one
+    is kept (see variant_build).
+    """
+    output_dir = output_dir.resolve()
+    name = output_dir.name
+    key_flags = [*compile_flags, f"client:{deployment_extension}"]
+    if objective:
+        key_flags.append(f"optimize:{objective}")
+    cache_key = compute_key(contract_path, root_path.parent, key_flags)
+    with span("cache lookup", contract=name):
+        cache_hit = use_cache and build_cache.lookup(name, cache_key, output_dir)
+    if cache_hit:
+        logger.info(f"Skipping build of {contract_path}, artifacts are up to date")
+        return _find_client_or_output_dir(output_dir)
+
+    build_cache.invalidate(name)
+    if output_dir.exists():
+        rmtree(output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    logger.info(f"Exporting {contract_path} to {output_dir}")
+
+    with span("compile", contract=name):
+        if objective:
+            # Only --optimize needs the variant machinery (and its thread pool).
+            from smart_contracts._helpers.variant_build import build_best_variant
+
+            build_best_variant(contract_path, output_dir, compile_flags, objective, _compile)
+        else:
+            build_output = _compile(contract_path, output_dir, compile_flags)
+            if build_output:
+                print(build_output)
 
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
@@ -132,19 +204,20 @@ def build(output_dir: Path, contract_path: Path) -> Path:
         for file_name in app_spec_file_names:
             client_file = file_name
             print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
+            with span("generate client", contract=name):
+                generate_result = subprocess.run(
+                    [
+                        "algokit",
+                        "generate",
+                        "client",
+                        str(output_dir),
+                        "--output",
+                        str(_get_output_path(output_dir, deployment_extension)),
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
 
             if generate_result.stdout:
                 print(generate_result.stdout)
@@ -158,16 +231,121 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+    write_program_cache(output_dir, contract_path, root_path.parent)
+    with span("cache store", contract=name):
+        build_cache.store(name, cache_key, output_dir)
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+def build_in_process(
+    artifact_path: Path, selected: list[SmartContract], use_cache: bool = True
+) -> None:
+    """
+    Builds the selected contracts with a single in-process compiler call followed by
+    a single client generation pass, producing the same artifacts as build().
+    Contracts whose build cache entry is still valid are left untouched.
+    """
+    flags = [*compile_flags, f"client:{deployment_extension}"]
+    stale: dict[str, Path] = {}
+    cache_keys: dict[str, str] = {}
+    for contract in selected:
+        output_dir = (artifact_path / contract.name).resolve()
+        cache_keys[contract.name] = compute_key(contract.path, root_path.parent, flags)
+        if use_cache and build_cache.lookup(
+            contract.name, cache_keys[contract.name], output_dir
+        ):
+            logger.info(f"Skipping build of {contract.path}, artifacts are up to date")
+            continue
+        build_cache.invalidate(contract.name)
+        stale[contract.name] = contract.path
+
+    if not stale:
+        return
+    logger.info(f"Exporting {', '.join(str(path) for path in stale.values())} in-process")
+    with span("compile", contracts=sorted(stale)):
+        output_dirs = compile_contracts(stale, artifact_path, compile_flags)
+    with span("generate client", contracts=sorted(stale)):
+        generate_clients(list(output_dirs.values()), deployment_extension)
+    for name, output_dir in output_dirs.items():
+        write_program_cache(output_dir, stale[name], root_path.parent)
+    with span("cache store", contracts=sorted(stale)):
+        for name, output_dir in output_dirs.items():
+            build_cache.store(name, cache_keys[name], output_dir)
+
+
 # --------------------------- Main Logic --------------------------- #
 
+# Where --profile writes its Chrome trace unless given a path.
+default_profile_path = root_path.parent / ".algokit" / "profile" / "trace.json"
 
-def main(action: str, contract_name: str | None = None) -> None:
-    """Main entry point to build and/or deploy smart contracts."""
+
+def _deploy(contract: SmartContract, message: str = "Deploying") -> None:
+    if contract.deploy:
+        logger.info(f"{message} {contract.name}")
+        with span(f"deploy {contract.name}", contract=contract.name):
+            contract.deploy()
+
+
+def _build_and_deploy(
+    contract_name: str,
+    artifact_path: Path,
+    deploy: bool,
+    use_cache: bool,
+    objective: str | None = None,
+) -> bool | None:
+    """
+    Builds a single contract and, if requested, deploys it once its build has finished.
+    Runs inside a scheduler worker; returns whether the build was a cache hit.
+    """
+    contract = next(contract for contract in contracts if contract.name == contract_name)
+    logger.info(f"Building app at {contract.path}")
+    with span(f"build {contract.name}", contract=contract.name):
+        build(artifact_path / contract.name, contract.path, use_cache, objective)
+    if deploy:
+        _deploy(contract)
+    return build_cache.results.get(contract.name)
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    use_cache: bool = True,
+    jobs: int = 1,
+    in_process: bool = False,
+    profile: Path | None = None,
+    optimize: str | None = None,
+) -> None:
+    """
+    Main entry point to build and/or deploy smart contracts. With `profile`, every
+    phase and algod request is timed, written to that path as a Chrome trace and
+    summarised at the end of the run. With `optimize`, each contract is built under
+    every optimisation setting and the best variant for that objective is kept.
+    """
+    if profile is None:
+        _main(action, contract_name, use_cache, jobs, in_process, optimize=optimize)
+        return
+    tracer = profiling.enable()
+    try:
+        with span("main", action=action):
+            _main(
+                action, contract_name, use_cache, jobs, in_process, profile=True, optimize=optimize
+            )
+    finally:
+        tracer.write(profile)
+        logger.info(f"Profile of this run (trace written to {profile}):\n{tracer.summary()}")
+
+
+def _main(
+    action: str,
+    contract_name: str | None,
+    use_cache: bool,
+    jobs: int,
+    in_process: bool,
+    profile: bool = False,
+    optimize: str | None = None,
+) -> None:
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
     filtered_contracts = [
@@ -177,10 +355,33 @@ def main(action: str, contract_name: str | None = None) -> None:
     ]
 
     match action:
-        case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+        case "build" | "all" if in_process:
+            build_in_process(artifact_path, filtered_contracts, use_cache)
+            if action == "all":
+                for contract in filtered_contracts:
+                    _deploy(contract)
+        case "build" | "all":
+            scheduled = [
+                Job(
+                    name=contract.name,
+                    func=_build_and_deploy,
+                    args=(contract.name, artifact_path, action == "all", use_cache, optimize),
+                    profile=profile,
+                )
+                for contract in filtered_contracts
+            ]
+            failed: list[str] = []
+            for result in run_jobs(scheduled, jobs):
+                if result.output:
+                    print(result.output, end="")
+                profiling.merge(result.spans)
+                if result.value is not None:
+                    build_cache.results[result.name] = result.value
+                if result.error:
+                    logger.error(f"{result.name} failed:\n{result.error}")
+                    failed.append(result.name)
+            if failed:
+                raise Exception(f"Could not {action} contracts: {', '.join(failed)}")
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -194,24 +395,75 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
-        case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+                _deploy(contract, "Deploying app")
         case _:
             logger.error(f"Unknown action: {action}")
 
+    if build_cache.results:
+        logger.info(build_cache.summary())
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="smart_contracts")
+    parser.add_argument("action", nargs="?", default="all")
+    parser.add_argument("contract_name", nargs="?", default=None)
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Ignore the build cache and rebuild every selected contract",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of contracts to build (and deploy) in parallel; 1 runs serially",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Compile all selected contracts and generate their clients in this process",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=default_profile_path,
+        default=None,
+        metavar="TRACE_PATH",
+        help="Time every phase and algod request, write a Chrome trace and print a summary",
+    )
+    parser.add_argument(
+        "--optimize",
+        choices=OBJECTIVES,
+        default=None,
+        help="Build every optimisation level/coalescing variant and keep the smallest "
+        "programs (size) or cheapest methods (cost)",
+    )
+    parser.add_argument(
+        "--runtime",
+        choices=sorted(runtime.PROFILES),
+        default=None,
+        help="Logging and failure tracing profile (default: $RUNTIME_PROFILE or dev); "
+        "prod turns off algokit debug mode and samples failure traces in the background",
+    )
+    args = parser.parse_args(argv)
+    if args.optimize and args.in_process:
+        parser.error("--optimize builds each contract separately and cannot be combined with --in-process")
+    return args
+
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    args = parse_args(sys.argv[1:])
+    if args.runtime:
+        runtime_profile = runtime.apply(runtime.get_profile(args.runtime), root_path.parent)
+    main(
+        args.action,
+        args.contract_name,
+        args.use_cache,
+        args.jobs,
+        args.in_process,
+        args.profile,
+        args.optimize,
+    )
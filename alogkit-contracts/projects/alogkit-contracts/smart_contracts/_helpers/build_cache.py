@@ -0,0 +1,166 @@
+"""
+Content-hash build cache for smart contract artifacts.
+
+A build is keyed on the contract source, every project-local module it imports
+(followed transitively), the compiler and client generator versions and the
+compile flags. When the key matches the last successful build and the recorded
+artifacts are still byte-identical on disk, the build can be skipped entirely,
+which leaves the artifacts (and their mtimes) untouched.
+"""
+
+import ast
+import functools
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Python distributions whose version changes the compiled output.
+_TOOL_DISTRIBUTIONS = ("puyapy", "algorand-python", "algokit-client-generator")
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _module_path(module_name: str, project_root: Path) -> Path | None:
+    """Resolves a dotted module name to a source file inside the project, if any."""
+    base = project_root.joinpath(*module_name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_module_names(source_path: Path, project_root: Path) -> set[str]:
+    """Lists the dotted names of every module imported by a source file."""
+    tree = ast.parse(source_path.read_bytes(), filename=str(source_path))
+    package = ".".join(source_path.parent.relative_to(project_root).parts)
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split(".") if package else []
+                parts = parts[: len(parts) - (node.level - 1)]
+                base = ".".join([*parts, node.module] if node.module else parts)
+            else:
+                base = node.module or ""
+            if base:
+                names.add(base)
+            # `from pkg import name` may import a submodule rather than an attribute.
+            names.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+    return names
+
+
+def local_dependencies(source_path: Path, project_root: Path) -> list[Path]:
+    """
+    Returns the project-local source files a contract depends on, including itself.
+    Third-party imports (algopy etc.) are covered by the tool versions instead.
+    """
+    source_path = source_path.resolve()
+    project_root = project_root.resolve()
+    seen: set[Path] = set()
+    pending = [source_path]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for name in _imported_module_names(path, project_root):
+            module_path = _module_path(name, project_root)
+            if module_path is not None and module_path not in seen:
+                pending.append(module_path)
+    return sorted(seen)
+
+
+@functools.cache
+def tool_versions() -> dict[str, str]:
+    """Collects the versions of the tools that produce the artifacts."""
+    # Imported here as importlib.metadata is slow to import and only needed for builds.
+    import importlib.metadata
+    import subprocess
+
+    versions: dict[str, str] = {}
+    for distribution in _TOOL_DISTRIBUTIONS:
+        try:
+            versions[distribution] = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            versions[distribution] = "missing"
+    try:
+        result = subprocess.run(
+            ["algokit", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        versions["algokit"] = result.stdout.strip()
+    except FileNotFoundError:
+        versions["algokit"] = "missing"
+    return versions
+
+
+def compute_key(contract_path: Path, project_root: Path, flags: list[str]) -> str:
+    """Computes the cache key for building a contract with the given flags."""
+    project_root = project_root.resolve()
+    sources = {
+        str(path.relative_to(project_root)): _hash_bytes(path.read_bytes())
+        for path in local_dependencies(contract_path, project_root)
+    }
+    payload = {"sources": sources, "tools": tool_versions(), "flags": flags}
+    return _hash_bytes(json.dumps(payload, sort_keys=True).encode())
+
+
+def _hash_outputs(output_dir: Path) -> dict[str, str]:
+    return {
+        str(path.relative_to(output_dir)): _hash_bytes(path.read_bytes())
+        for path in sorted(output_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+class BuildCache:
+    """Records the key and artifact hashes of the last successful build per contract."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.results: dict[str, bool] = {}
+
+    def _entry_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.json"
+
+    def lookup(self, name: str, key: str, output_dir: Path) -> bool:
+        """Returns True if the artifacts in output_dir were built from this key and are intact."""
+        hit = False
+        try:
+            entry = json.loads(self._entry_path(name).read_text())
+        except (OSError, ValueError):
+            entry = None
+        if entry and entry.get("key") == key and output_dir.is_dir():
+            try:
+                hit = _hash_outputs(output_dir) == entry.get("files")
+            except OSError:
+                hit = False
+        self.results[name] = hit
+        logger.info(f"Build cache {'hit' if hit else 'miss'} for {name}")
+        return hit
+
+    def store(self, name: str, key: str, output_dir: Path) -> None:
+        """Records a successful build of output_dir under the given key."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"key": key, "files": _hash_outputs(output_dir)}
+        self._entry_path(name).write_text(json.dumps(entry, indent=2, sort_keys=True))
+
+    def invalidate(self, name: str) -> None:
+        self._entry_path(name).unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        hits = sorted(name for name, hit in self.results.items() if hit)
+        misses = sorted(name for name, hit in self.results.items() if not hit)
+        return (
+            f"Build cache: {len(hits)} hit(s) [{', '.join(hits)}], "
+            f"{len(misses)} miss(es) [{', '.join(misses)}]"
+        )
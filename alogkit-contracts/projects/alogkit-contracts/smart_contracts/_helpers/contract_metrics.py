@@ -0,0 +1,105 @@
+"""
+Cost and size metrics of compiled contracts.
+
+Collects, per contract: approval/clear program sizes, the global state schema, the
+minimum balance the creator and the app account have to hold, and the static
+worst-case opcode cost of each ABI method (see teal_cost).
+"""
+
+import dataclasses
+import json
+import math
+from pathlib import Path
+
+from smart_contracts._helpers.teal_cost import TealProgram
+
+# Protocol constants (microALGOs).
+PAGE_SIZE = 2048
+APP_PAGE_MBR = 100_000
+GLOBAL_UINT_MBR = 28_500
+GLOBAL_BYTES_MBR = 50_000
+ACCOUNT_MBR = 100_000
+
+
+def extra_pages(approval_size: int, clear_size: int) -> int:
+    """Extra program pages an application with these program sizes must request."""
+    return max(0, math.ceil((approval_size + clear_size) / PAGE_SIZE) - 1)
+
+
+@dataclasses.dataclass
+class ContractMetrics:
+    approval_size: int | None
+    clear_size: int | None
+    global_ints: int
+    global_bytes: int
+    method_costs: dict[str, int]
+    methods_with_loops: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def extra_pages(self) -> int:
+        if self.approval_size is None or self.clear_size is None:
+            return 0
+        return extra_pages(self.approval_size, self.clear_size)
+
+    @property
+    def creator_mbr(self) -> int:
+        """Minimum balance increase for the account that creates the application."""
+        return (
+            APP_PAGE_MBR * (1 + self.extra_pages)
+            + GLOBAL_UINT_MBR * self.global_ints
+            + GLOBAL_BYTES_MBR * self.global_bytes
+        )
+
+    def as_dict(self) -> dict[str, object]:
+        """Flat, JSON-friendly view; every numeric value is a tracked metric."""
+        return {
+            "approval_size": self.approval_size,
+            "clear_size": self.clear_size,
+            "extra_pages": self.extra_pages,
+            "global_ints": self.global_ints,
+            "global_bytes": self.global_bytes,
+            "creator_mbr": self.creator_mbr,
+            "app_account_mbr": ACCOUNT_MBR,
+            "method_costs": dict(sorted(self.method_costs.items())),
+            "methods_with_loops": sorted(self.methods_with_loops),
+        }
+
+
+def measure_teal(
+    approval_teal: str,
+    approval_size: int | None,
+    clear_size: int | None,
+    global_ints: int,
+    global_bytes: int,
+) -> ContractMetrics:
+    """Measures a contract given its approval TEAL source and known sizes/schema."""
+    costs = TealProgram(approval_teal).method_costs()
+    return ContractMetrics(
+        approval_size=approval_size,
+        clear_size=clear_size,
+        global_ints=global_ints,
+        global_bytes=global_bytes,
+        method_costs={signature: cost.cost for signature, cost in costs.items()},
+        methods_with_loops=[signature for signature, cost in costs.items() if cost.has_loop],
+    )
+
+
+def measure_puya_artifacts(output_dir: Path, contract_name: str) -> ContractMetrics:
+    """
+    Measures a contract from the artifacts puyapy wrote for it (TEAL, ARC-56 spec and,
+    when built with --output-bytecode, the assembled programs).
+    """
+    app_spec = json.loads((output_dir / f"{contract_name}.arc56.json").read_text())
+    global_schema = app_spec["state"]["schema"]["global"]
+
+    def program_size(kind: str) -> int | None:
+        path = output_dir / f"{contract_name}.{kind}.bin"
+        return path.stat().st_size if path.exists() else None
+
+    return measure_teal(
+        (output_dir / f"{contract_name}.approval.teal").read_text(),
+        program_size("approval"),
+        program_size("clear"),
+        global_schema["ints"],
+        global_schema["bytes"],
+    )
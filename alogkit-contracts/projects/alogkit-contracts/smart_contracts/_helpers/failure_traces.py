@@ -0,0 +1,166 @@
+"""
+Sampled, budgeted AVM traces of failed transaction groups.
+
+algokit_utils' debug mode simulates every failed group and writes its trace
+before the error reaches the caller, so each failure costs an extra simulate
+round-trip and a file write on the sending thread, with no limit on how many.
+The pipelines that submit groups themselves (bulk_deploy, sweeper, client_pool)
+report failures here instead: `record()` decides on the calling thread whether the
+failure is sampled (one random draw) and hands it to a background writer, which
+simulates the group with execution tracing and writes the response to
+`debug_traces/` in the AVM debugger's `.trace.avm.json` format. Once the file
+count or byte budget is spent, or while the writer is behind, failures are only
+counted.
+
+Until `enable()` is called (see runtime.apply), `record()` is a no-op.
+"""
+
+import atexit
+import dataclasses
+import json
+import logging
+import queue
+import random
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Where algokit_utils writes its debug traces, so the AVM debugger finds both.
+TRACES_DIR = "debug_traces"
+TRACES_FILE_EXT = ".trace.avm.json"
+
+_writer: "FailureTraceWriter | None" = None
+
+
+@dataclasses.dataclass
+class TraceStats:
+    failures: int = 0
+    sampled: int = 0
+    written: int = 0
+    bytes_written: int = 0
+    # Sampled but not written: budget spent, writer queue full, or simulate failed.
+    dropped: int = 0
+
+
+class FailureTraceWriter:
+    """Simulates and writes sampled failed groups on a background thread."""
+
+    def __init__(
+        self,
+        directory: Path,
+        sample_rate: float = 1.0,
+        max_files: int = 100,
+        max_bytes: int = 64 * 2**20,
+        queue_size: int = 16,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.rng = rng
+        self.stats = TraceStats()
+        self._queue: queue.Queue[tuple[Any, list[Any]] | None] = queue.Queue(queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def record(self, algod: Any, signed: list[Any]) -> None:
+        """Queues a failed group for tracing if it is sampled; never blocks."""
+        with self._lock:
+            self.stats.failures += 1
+            if self.rng() >= self.sample_rate:
+                return
+            self.stats.sampled += 1
+            if self.stats.written >= self.max_files or self.stats.bytes_written >= self.max_bytes:
+                self.stats.dropped += 1
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="failure-traces", daemon=True
+                )
+                self._thread.start()
+        try:
+            self._queue.put_nowait((algod, list(signed)))
+        except queue.Full:
+            with self._lock:
+                self.stats.dropped += 1
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            try:
+                self._write(*item)
+            except Exception as exc:
+                with self._lock:
+                    self.stats.dropped += 1
+                logger.warning(f"Could not trace failed group: {exc}")
+
+    def _write(self, algod: Any, signed: list[Any]) -> None:
+        from algosdk.v2client.models import (
+            SimulateRequest,
+            SimulateRequestTransactionGroup,
+            SimulateTraceConfig,
+        )
+
+        response = algod.simulate_transactions(
+            SimulateRequest(
+                txn_groups=[SimulateRequestTransactionGroup(txns=signed)],
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                allow_more_logs=True,
+                exec_trace_config=SimulateTraceConfig(
+                    enable=True, stack_change=True, scratch_change=True, state_change=True
+                ),
+            )
+        )
+        data = json.dumps(response).encode()
+        with self._lock:
+            if (
+                self.stats.written >= self.max_files
+                or self.stats.bytes_written + len(data) > self.max_bytes
+            ):
+                self.stats.dropped += 1
+                return
+            self.stats.written += 1
+            self.stats.bytes_written += len(data)
+            sequence = self.stats.written
+        timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
+        name = f"{timestamp}_lr{response.get('last-round', 0)}_{sequence}_{len(signed)}txn"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{name}{TRACES_FILE_EXT}").write_bytes(data)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Waits until the queued failures are written and stops the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+def record(algod: Any, signed: list[Any]) -> None:
+    """Reports a failed group; traced according to the enabled writer, if any."""
+    if _writer is not None:
+        _writer.record(algod, signed)
+
+
+def enable(writer: FailureTraceWriter) -> FailureTraceWriter:
+    global _writer
+    _writer = writer
+    return writer
+
+
+def disable() -> FailureTraceWriter | None:
+    """Stops tracing failures, flushing and returning the writer that was enabled."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.flush()
+    return writer
+
+
+# Let queued failures finish writing before the interpreter exits.
+atexit.register(disable)
@@ -0,0 +1,133 @@
+"""
+Builds several contracts with a single, in-process compiler invocation.
+
+The subprocess build path starts one `algokit compile python` process per contract
+and one `algokit generate client` process per app spec, so most of its wall time is
+interpreter and CLI startup. This module instead runs puyapy once, in the current
+interpreter, over every selected `contract.py`, then generates all typed clients
+with the client generator's Python API. The resulting artifacts are the same as the
+ones produced by `build()`.
+"""
+
+import ast
+import contextlib
+import io
+import logging
+import re
+import runpy
+import sys
+import uuid
+from pathlib import Path
+from shutil import rmtree
+
+logger = logging.getLogger(__name__)
+
+# Base classes that mark a class as a compilable contract.
+_CONTRACT_BASES = {"ARC4Contract", "Contract"}
+
+
+def contract_class_names(contract_path: Path) -> set[str]:
+    """Returns the names of the contract classes defined in a contract.py file."""
+    tree = ast.parse(contract_path.read_bytes(), filename=str(contract_path))
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            for base in node.bases:
+                base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+                if base_name in _CONTRACT_BASES:
+                    names.add(node.name)
+    return names
+
+
+def snake_case(name: str) -> str:
+    """Converts an app spec name (e.g. SavingsVault) to the client module stem."""
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    return re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name).replace("-", "_").lower()
+
+
+def _run_module(module: str, argv: list[str]) -> tuple[int, str]:
+    """Runs a module's CLI in this interpreter, returning its exit code and output."""
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = argv
+    exit_code = 0
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    finally:
+        sys.argv = saved_argv
+    return exit_code, output.getvalue()
+
+
+def compile_contracts(
+    contracts: dict[str, Path], artifact_path: Path, flags: list[str]
+) -> dict[str, Path]:
+    """
+    Compiles every contract in one puyapy call and moves each contract's artifacts
+    into artifact_path/<name>. Returns the output directory per contract name.
+
+    The compiler writes into a staging directory that sits next to the final output
+    directories, so relative paths recorded in the artifacts (e.g. source maps) are
+    the same as when each contract is compiled straight into its own folder.
+    """
+    if not contracts:
+        return {}
+    artifact_path = artifact_path.resolve()
+    staging_dir = artifact_path / f".staging-{uuid.uuid4().hex}"
+    staging_dir.mkdir(parents=True)
+    try:
+        exit_code, output = _run_module(
+            "puyapy",
+            [
+                "puyapy",
+                *(str(path.resolve()) for path in contracts.values()),
+                f"--out-dir={staging_dir}",
+                *flags,
+            ],
+        )
+        if output:
+            print(output)
+        if exit_code:
+            raise Exception(f"Could not build contracts:\n{output}")
+
+        output_dirs: dict[str, Path] = {}
+        for name, contract_path in contracts.items():
+            output_dir = artifact_path / name
+            if output_dir.exists():
+                rmtree(output_dir)
+            output_dir.mkdir(parents=True)
+            for class_name in contract_class_names(contract_path):
+                for artifact in staging_dir.glob(f"{class_name}.*"):
+                    artifact.rename(output_dir / artifact.name)
+            output_dirs[name] = output_dir
+        return output_dirs
+    finally:
+        rmtree(staging_dir, ignore_errors=True)
+
+
+def generate_clients(output_dirs: list[Path], deployment_extension: str) -> dict[Path, Path]:
+    """
+    Generates a typed client for every app spec in the given directories in a single
+    pass. Returns the generated client path per app spec.
+    """
+    if deployment_extension != "py":
+        raise Exception("In-process client generation only supports Python clients")
+    from algokit_client_generator import generate_client
+
+    clients: dict[Path, Path] = {}
+    for output_dir in output_dirs:
+        app_spec_files = sorted(output_dir.glob("*.arc56.json"))
+        if not app_spec_files:
+            logger.warning(
+                f"No '*.arc56.json' file found in {output_dir} (likely a logic signature being compiled). "
+                "Skipping client generation."
+            )
+        for app_spec_file in app_spec_files:
+            print(app_spec_file.name)
+            contract_name = snake_case(app_spec_file.name.removesuffix(".arc56.json"))
+            client_path = output_dir / f"{contract_name}_client.py"
+            generate_client(app_spec_file, client_path)
+            clients[app_spec_file] = client_path
+    return clients
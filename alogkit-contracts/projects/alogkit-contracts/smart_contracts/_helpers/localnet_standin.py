@@ -0,0 +1,504 @@
+"""
+In-process stand-in for an Algorand LocalNet algod.
+
+StandinAlgod exposes the subset of algosdk's `AlgodClient` the bulk tooling uses
+(suggested params, sending and simulating signed groups, pending transaction info,
+round status, compile and application/box/account lookups, box listings), so pipelines written
+against algod can be exercised and benchmarked without Docker. It can simulate per-request latency
+and block time. Application logic is provided by Python handlers registered per ABI
+method selector; a handler rejects a call by raising StandinReject, which fails the
+whole group atomically, as on a real network.
+"""
+
+import base64
+import copy
+import dataclasses
+import hashlib
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from typing import Any
+
+from algosdk import logic, transaction
+from algosdk.error import AlgodHTTPError
+
+# Prefix of an ARC-4 return value log.
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+# Minimum fee per transaction, as on LocalNet.
+MIN_FEE = 1_000
+
+
+class StandinReject(Exception):
+    """Raised by a handler to reject the call (the equivalent of a failed assert)."""
+
+
+class _FeeShortfall(Exception):
+    """The group's fees do not cover its transactions plus their inner transactions."""
+
+
+class _GroupFailure(Exception):
+    """A group was rejected (and rolled back); `failed_at` is the failing transaction."""
+
+    def __init__(self, message: str, failed_at: int) -> None:
+        super().__init__(message)
+        self.failed_at = failed_at
+
+
+@dataclasses.dataclass
+class StandinApp:
+    app_id: int
+    creator: str
+    approval_program: bytes
+    clear_program: bytes
+    global_state: dict[bytes, int | bytes] = dataclasses.field(default_factory=dict)
+    boxes: dict[bytes, bytes] = dataclasses.field(default_factory=dict)
+    deleted: bool = False
+
+    @property
+    def address(self) -> str:
+        return logic.get_application_address(self.app_id)
+
+
+@dataclasses.dataclass
+class CallContext:
+    """What a handler can see and do while executing one app call."""
+
+    algod: "StandinAlgod"
+    app: StandinApp
+    txn: transaction.ApplicationCallTxn
+    group: list[transaction.Transaction]
+    index: int
+    round: int
+    latest_timestamp: int
+    # The calling application of an inner app call (Global.caller_application_id).
+    caller_app_id: int = 0
+    logs: list[bytes] = dataclasses.field(default_factory=list)
+
+    @property
+    def args(self) -> list[bytes]:
+        return list(self.txn.app_args or [])
+
+    def require(self, condition: bool, message: str) -> None:
+        if not condition:
+            raise StandinReject(message)
+
+    def pay(self, receiver: str, amount: int, close_remainder_to: str | None = None) -> None:
+        """Inner payment from the application account; its fee comes from the group's pool."""
+        self.algod.inner_txns += 1
+        self.algod.transfer(self.app.address, receiver, amount, close_remainder_to)
+
+    def call(self, app_id: int, args: list[bytes]) -> list[bytes]:
+        """Inner NoOp call to another application; returns its logs. Fee as for pay."""
+        self.algod.inner_txns += 1
+        return self.algod._inner_call(self.app, app_id, args, self.round)
+
+    def log(self, data: bytes) -> None:
+        self.logs.append(data)
+
+    def returns(self, value: bytes) -> None:
+        self.logs.append(RETURN_PREFIX + value)
+
+
+Handler = Callable[[CallContext], None]
+
+
+class StandinAlgod:
+    """A single-node, in-memory algod good enough for pipeline and load tests."""
+
+    def __init__(
+        self,
+        handlers: dict[bytes, Handler] | None = None,
+        latency: float = 0.0,
+        block_time: float = 0.0,
+        genesis_id: str = "standin-v1",
+    ) -> None:
+        self.handlers = dict(handlers or {})
+        self.latency = latency
+        self.block_time = block_time
+        self.genesis_id = genesis_id
+        genesis_digest = hashlib.sha256(genesis_id.encode()).digest()
+        self.genesis_hash = base64.b64encode(genesis_digest).decode()
+        self.apps: dict[int, StandinApp] = {}
+        self.balances: dict[str, int] = {}
+        self.clock: Callable[[], int] = lambda: int(time.time())
+        self.requests = 0
+        # Inner transactions issued by the group being executed, paid from its fee pool.
+        self.inner_txns = 0
+        self._lock = threading.RLock()
+        self._next_app_id = 1001
+        self._round = 1
+        self._started = time.monotonic()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._journal: dict[str, int | None] | None = None
+        self._touched_apps: dict[int, StandinApp | None] = {}
+        self.blocks: dict[int, list[dict[str, Any]]] = {}
+
+    # ── Rounds ─────────────────────────────────────────────────────────────────
+
+    def _current_round(self) -> int:
+        if self.block_time:
+            return self._round + int((time.monotonic() - self._started) / self.block_time)
+        return self._round
+
+    def _request(self) -> None:
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    # ── Ledger ─────────────────────────────────────────────────────────────────
+
+    def _set_balance(self, address: str, amount: int) -> None:
+        if self._journal is not None and address not in self._journal:
+            self._journal[address] = self.balances.get(address)
+        self.balances[address] = amount
+
+    def transfer(
+        self, sender: str, receiver: str, amount: int, close_remainder_to: str | None = None
+    ) -> None:
+        self._set_balance(sender, self.balances.get(sender, 0) - amount)
+        self._set_balance(receiver, self.balances.get(receiver, 0) + amount)
+        if close_remainder_to:
+            remainder = self.balances.get(sender, 0)
+            self._set_balance(sender, 0)
+            self._set_balance(
+                close_remainder_to, self.balances.get(close_remainder_to, 0) + remainder
+            )
+
+    def _execute(
+        self,
+        txn: transaction.Transaction,
+        group: list[transaction.Transaction],
+        index: int,
+        round_: int,
+        touched_apps: dict[int, StandinApp | None],
+        caller_app_id: int = 0,
+    ) -> dict[str, Any]:
+        self._set_balance(txn.sender, self.balances.get(txn.sender, 0) - txn.fee)
+        if isinstance(txn, transaction.PaymentTxn):
+            self.transfer(txn.sender, txn.receiver, txn.amt, txn.close_remainder_to)
+            return {}
+        if not isinstance(txn, transaction.ApplicationCallTxn):
+            return {}
+        if txn.index == 0:
+            app = StandinApp(
+                app_id=self._next_app_id,
+                creator=txn.sender,
+                approval_program=txn.approval_program or b"",
+                clear_program=txn.clear_program or b"",
+            )
+            self._next_app_id += 1
+            self.apps[app.app_id] = app
+            touched_apps.setdefault(app.app_id, None)
+        else:
+            app = self.apps.get(txn.index)
+            if app is None or app.deleted:
+                raise StandinReject(f"application {txn.index} does not exist")
+            touched_apps.setdefault(app.app_id, copy.deepcopy(app))
+        context = CallContext(
+            algod=self,
+            app=app,
+            txn=txn,
+            group=group,
+            index=index,
+            round=round_,
+            latest_timestamp=self.clock(),
+            caller_app_id=caller_app_id,
+        )
+        selector = context.args[0][:4] if context.args else b""
+        handler = self.handlers.get(selector)
+        if handler is not None:
+            handler(context)
+        elif context.args or txn.index != 0:
+            raise StandinReject(f"no handler for selector 0x{selector.hex()}")
+        if txn.on_complete == transaction.OnComplete.DeleteApplicationOC:
+            app.deleted = True
+        result: dict[str, Any] = {
+            "logs": [base64.b64encode(entry).decode() for entry in context.logs]
+        }
+        if txn.index == 0:
+            result["application-index"] = app.app_id
+        return result
+
+    def _inner_call(
+        self, caller: StandinApp, app_id: int, args: list[bytes], round_: int
+    ) -> list[bytes]:
+        params = transaction.SuggestedParams(
+            fee=0, first=round_, last=round_, gh=self.genesis_hash, flat_fee=True
+        )
+        txn = transaction.ApplicationCallTxn(
+            caller.address, params, app_id, transaction.OnComplete.NoOpOC, app_args=args
+        )
+        result = self._execute(
+            txn, [txn], 0, round_, self._touched_apps, caller_app_id=caller.app_id
+        )
+        return [base64.b64decode(entry) for entry in result["logs"]]
+
+    @staticmethod
+    def _check_group(txns: list[transaction.Transaction]) -> None:
+        if len(txns) > 1:
+            group_ids = {txn.group for txn in txns}
+            if len(group_ids) != 1 or None in group_ids:
+                raise AlgodHTTPError("transaction group is not well formed", 400)
+        fees = sum(txn.fee for txn in txns)
+        if fees < MIN_FEE * len(txns):
+            raise AlgodHTTPError(f"transaction group fee {fees} below minimum", 400)
+
+    def _run_group(
+        self, txns: list[transaction.Transaction], round_: int, commit: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Executes a group under the lock. A failing group is rolled back and raises
+        _GroupFailure; without `commit` the group is rolled back either way.
+        """
+        # Undo information: balances before the group and copies of touched apps.
+        self._journal = {}
+        self.inner_txns = 0
+        touched_apps: dict[int, StandinApp | None] = {}
+        self._touched_apps = touched_apps
+        index = 0
+        try:
+            results = []
+            for index, txn in enumerate(txns):
+                results.append(self._execute(txn, txns, index, round_, touched_apps))
+            fees = sum(txn.fee for txn in txns)
+            required = MIN_FEE * (len(txns) + self.inner_txns)
+            if fees < required:
+                raise _FeeShortfall(
+                    f"txgroup had {fees} in fees, which is less than the minimum {required}"
+                )
+        except (StandinReject, _FeeShortfall) as exc:
+            self._roll_back(touched_apps)
+            if isinstance(exc, _FeeShortfall):
+                raise _GroupFailure(str(exc), 0) from exc
+            raise _GroupFailure(f"logic eval error: assert failed // {exc}", index) from exc
+        else:
+            if not commit:
+                self._roll_back(touched_apps)
+        finally:
+            self._journal = None
+        return results
+
+    def _roll_back(self, touched_apps: dict[int, StandinApp | None]) -> None:
+        for address, balance in (self._journal or {}).items():
+            if balance is None:
+                self.balances.pop(address, None)
+            else:
+                self.balances[address] = balance
+        for app_id, original in touched_apps.items():
+            if original is None:
+                self.apps.pop(app_id, None)
+            else:
+                self.apps[app_id] = original
+        self._next_app_id -= sum(1 for original in touched_apps.values() if original is None)
+
+    def _submit(self, signed: list[Any]) -> str:
+        """Executes a signed group atomically and records it in the next block."""
+        txns = [stxn.transaction for stxn in signed]
+        txids = [stxn.get_txid() for stxn in signed]
+        self._check_group(txns)
+
+        with self._lock:
+            for txid in txids:
+                if txid in self._pending:
+                    raise AlgodHTTPError(f"transaction already in ledger: {txid}", 400)
+            round_ = self._current_round() + 1
+            try:
+                results = self._run_group(txns, round_)
+            except _GroupFailure as exc:
+                raise AlgodHTTPError(f"transaction {txids[0]}: {exc}", 400) from exc
+
+            block = self.blocks.setdefault(round_, [])
+            for txid, txn, result in zip(txids, txns, results):
+                self._pending[txid] = {"confirmed-round": round_, "pool-error": "", **result}
+                block.append({"txid": txid, "txn": txn, **result})
+            if not self.block_time:
+                self._round = round_
+        return txids[0]
+
+    # ── algosdk AlgodClient subset ─────────────────────────────────────────────
+
+    def suggested_params(self, **kwargs: Any) -> transaction.SuggestedParams:
+        self._request()
+        first = self._current_round()
+        return transaction.SuggestedParams(
+            fee=MIN_FEE,
+            first=first,
+            last=first + 1000,
+            gh=self.genesis_hash,
+            gen=self.genesis_id,
+            flat_fee=True,
+            min_fee=MIN_FEE,
+        )
+
+    def send_transaction(self, txn: Any, **kwargs: Any) -> str:
+        return self.send_transactions([txn])
+
+    def send_transactions(self, txns: list[Any], **kwargs: Any) -> str:
+        self._request()
+        return self._submit(list(txns))
+
+    def simulate_transactions(self, request: Any, **kwargs: Any) -> dict[str, Any]:
+        """
+        Executes the request's (single) group against the current ledger and rolls it
+        back, answering in the shape of algod's simulate response. Signatures are
+        never checked, as with allow-empty-signatures.
+        """
+        self._request()
+        if len(request.txn_groups) != 1:
+            raise AlgodHTTPError("expected 1 transaction group", 400)
+        txns = [stxn.transaction for stxn in request.txn_groups[0].txns]
+        self._check_group(txns)
+        with self._lock:
+            round_ = self._current_round()
+            # Each result echoes its transaction, as algod does (only type and sender).
+            echoed = [{"txn": {"txn": {"type": txn.type, "snd": txn.sender}}} for txn in txns]
+            group: dict[str, Any]
+            try:
+                results = self._run_group(txns, round_ + 1, commit=False)
+                group = {
+                    "txn-results": [
+                        {"txn-result": {**echo, **result}} for echo, result in zip(echoed, results)
+                    ]
+                }
+            except _GroupFailure as exc:
+                txid = txns[exc.failed_at].get_txid()
+                group = {
+                    "failure-message": f"transaction {txid}: {exc}",
+                    "failed-at": [exc.failed_at],
+                    "txn-results": [{"txn-result": echo} for echo in echoed],
+                }
+        return {"last-round": round_, "txn-groups": [group], "version": 2}
+
+    def pending_transaction_info(self, transaction_id: str, **kwargs: Any) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            info = self._pending.get(transaction_id)
+            if info is None:
+                raise AlgodHTTPError("txn does not exist", 404)
+            if info["confirmed-round"] > self._current_round():
+                return {"confirmed-round": 0, "pool-error": ""}
+            return info
+
+    def status(self, **kwargs: Any) -> dict[str, Any]:
+        self._request()
+        return {"last-round": self._current_round()}
+
+    def status_after_block(self, block_num: int, **kwargs: Any) -> dict[str, Any]:
+        self._request()
+        if self.block_time:
+            while self._current_round() <= block_num:
+                time.sleep(self.block_time / 10)
+        return {"last-round": self._current_round()}
+
+    def compile(self, source: str, source_map: bool = False, **kwargs: Any) -> dict[str, Any]:
+        """Stands in for TEAL assembly: the 'program' is a digest of the source."""
+        self._request()
+        program = hashlib.sha512(source.encode()).digest()
+        return {
+            "hash": logic.address(program),
+            "result": base64.b64encode(program).decode(),
+        }
+
+    def application_info(self, application_id: int, **kwargs: Any) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            app = self.apps.get(application_id)
+            if app is None or app.deleted:
+                raise AlgodHTTPError("application does not exist", 404)
+            return {"id": app.app_id, "params": self._app_params(app)}
+
+    def application_box_by_name(
+        self, application_id: int, box_name: bytes, **kwargs: Any
+    ) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            app = self.apps.get(application_id)
+            if app is None or app.deleted or box_name not in app.boxes:
+                raise AlgodHTTPError("box not found", 404)
+            return {
+                "name": base64.b64encode(box_name).decode(),
+                "round": self._current_round(),
+                "value": base64.b64encode(app.boxes[box_name]).decode(),
+            }
+
+    def application_boxes(
+        self, application_id: int, limit: int = 0, **kwargs: Any
+    ) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            app = self.apps.get(application_id)
+            if app is None or app.deleted:
+                raise AlgodHTTPError("application does not exist", 404)
+            names = list(app.boxes)[:limit] if limit else list(app.boxes)
+            return {"boxes": [{"name": base64.b64encode(name).decode()} for name in names]}
+
+    def account_info(self, address: str, **kwargs: Any) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            return {
+                "address": address,
+                "amount": self.balances.get(address, 0),
+                "round": self._current_round(),
+            }
+
+    def block_info(
+        self, block: int | None = None, round_num: int | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """A block in algod's JSON shape, limited to the fields followers read."""
+        self._request()
+        round_ = block if block is not None else round_num
+        with self._lock:
+            if round_ is None or round_ > self._current_round():
+                raise AlgodHTTPError("failed to retrieve information from the ledger", 404)
+            txns = []
+            for entry in self.blocks.get(round_, []):
+                txn = entry["txn"]
+                body: dict[str, Any] = {"type": txn.type, "snd": txn.sender}
+                signed: dict[str, Any] = {"txn": body}
+                if isinstance(txn, transaction.ApplicationCallTxn):
+                    if txn.index:
+                        body["apid"] = txn.index
+                    else:
+                        signed["apid"] = entry["application-index"]
+                if entry.get("logs"):
+                    signed["dt"] = {"lg": entry["logs"]}
+                txns.append(signed)
+            return {"block": {"rnd": round_, "txns": txns}}
+
+    def algod_request(self, method: str, requrl: str, **kwargs: Any) -> dict[str, Any]:
+        """The GET routes the readers use, for code written against raw API paths."""
+        path, _, query = requrl.partition("?")
+        parts = path.strip("/").split("/")
+        if method == "GET" and parts == ["status"]:
+            return self.status()
+        if method == "GET" and len(parts) == 2 and parts[0] == "applications":
+            return self.application_info(int(parts[1]))
+        if method == "GET" and len(parts) == 3 and parts[::2] == ["applications", "box"]:
+            name = urllib.parse.parse_qs(query).get("name", [""])[0]
+            encoding, _, value = name.partition(":")
+            box_name = base64.b64decode(value) if encoding == "b64" else value.encode()
+            return self.application_box_by_name(int(parts[1]), box_name)
+        if method == "GET" and len(parts) == 3 and parts[::2] == ["applications", "boxes"]:
+            return self.application_boxes(int(parts[1]))
+        if method == "GET" and len(parts) == 2 and parts[0] == "accounts":
+            return self.account_info(parts[1])
+        raise AlgodHTTPError(f"{method} {requrl} is not supported by the stand-in", 404)
+
+    @staticmethod
+    def _app_params(app: StandinApp) -> dict[str, Any]:
+        global_state = []
+        for key, value in app.global_state.items():
+            if isinstance(value, bytes):
+                teal_value = {"type": 1, "bytes": base64.b64encode(value).decode(), "uint": 0}
+            else:
+                teal_value = {"type": 2, "bytes": "", "uint": value}
+            global_state.append({"key": base64.b64encode(key).decode(), "value": teal_value})
+        return {
+            "creator": app.creator,
+            "approval-program": base64.b64encode(app.approval_program).decode(),
+            "clear-state-program": base64.b64encode(app.clear_program).decode(),
+            "global-state": global_state,
+        }
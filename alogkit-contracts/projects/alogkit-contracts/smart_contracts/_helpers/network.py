@@ -0,0 +1,193 @@
+"""
+Shared helpers for high-volume tooling that talks to algod directly.
+
+The clients here are algosdk `AlgodClient`s (or anything exposing the same
+methods, such as the LocalNet stand-in in localnet_standin.py).
+"""
+
+import http.client
+import itertools
+import json
+import queue
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+from algosdk import constants
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+
+T = TypeVar("T")
+
+# Maximum number of transactions in an atomic group.
+MAX_GROUP_SIZE = 16
+
+# Average block time; suggested params are only refreshed once per round.
+ROUND_SECONDS = 2.8
+
+# GETs an algod API path (without the /v2 prefix, as in AlgodClient.algod_request)
+# and returns the decoded JSON body.
+Transport = Callable[[str], dict[str, Any]]
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yields consecutive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class SuggestedParamsCache:
+    """
+    Thread-safe cache of algod's suggested params.
+
+    Suggested params only change from one round to the next, so they are fetched at
+    most once per `max_age` seconds instead of once per transaction.
+    """
+
+    def __init__(self, algod: Any, max_age: float = ROUND_SECONDS) -> None:
+        self.algod = algod
+        self.max_age = max_age
+        self.fetches = 0
+        self._params: Any = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        with self._lock:
+            now = time.monotonic()
+            if self._params is None or now - self._fetched_at >= self.max_age:
+                self._params = self.algod.suggested_params()
+                self._fetched_at = now
+                self.fetches += 1
+            return self._params
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._params = None
+
+
+class AlgodConnectionPool:
+    """
+    Keep-alive HTTP connections to algod shared by many threads.
+
+    Each request borrows an idle connection (opening one if fewer than `size` exist)
+    and returns it afterwards, so a fleet of requests pays for at most `size` TCP/TLS
+    handshakes instead of one per request. An instance is a Transport.
+    """
+
+    def __init__(self, algod_address: str, algod_token: str = "", size: int = 8) -> None:
+        url = urllib.parse.urlsplit(algod_address)
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = url.netloc
+        self._base_path = url.path.rstrip("/")
+        self._headers = {"X-Algo-API-Token": algod_token, "Accept": "application/json"}
+        self.size = size
+        self.opened = 0
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.opened += 1
+            return self._connection_class(self._host, timeout=30)
+
+    def _release(self, connection: http.client.HTTPConnection | None) -> None:
+        if connection is not None:
+            self._idle.put(connection)
+        self._slots.release()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bytes:
+        """Sends a request for a full API path (e.g. /v2/status) and returns the body."""
+        connection: http.client.HTTPConnection | None = self._acquire()
+        try:
+            for attempt in range(2):
+                try:
+                    connection.request(
+                        method,
+                        self._base_path + path,
+                        body=body,
+                        headers={**self._headers, **(headers or {})},
+                    )
+                    response = connection.getresponse()
+                    data = response.read()
+                    break
+                except (http.client.HTTPException, OSError):
+                    # A kept-alive connection the server has since closed; retry once.
+                    connection.close()
+                    if attempt:
+                        connection = None
+                        raise
+            if response.status >= 400:
+                try:
+                    message = json.loads(data).get("message", "")
+                except ValueError:
+                    message = data.decode(errors="replace")
+                raise AlgodHTTPError(message, response.status)
+            return data
+        finally:
+            self._release(connection)
+
+    def __call__(self, path: str) -> dict[str, Any]:
+        return json.loads(self.request("GET", "/v2" + path))
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class PooledAlgodClient(AlgodClient):
+    """
+    An AlgodClient whose requests go through an AlgodConnectionPool instead of a
+    new urllib connection each, for tooling (and generated clients) that make many
+    calls from many threads.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        pool_size: int = 8,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self.pool = AlgodConnectionPool(algod_address, algod_token, size=pool_size)
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Any = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> Any:
+        request_headers = {"User-Agent": "py-algorand-sdk", **(self.headers or {})}
+        request_headers.update(headers or {})
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl += "?" + urllib.parse.urlencode(params)
+        body = self.pool.request(method, requrl, data, request_headers)
+        if response_format == "json":
+            return json.loads(body) if body else {}
+        return body
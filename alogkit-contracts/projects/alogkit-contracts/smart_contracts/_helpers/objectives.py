@@ -0,0 +1,11 @@
+"""
+Objectives `--optimize` can select a contract build variant by (see variant_build).
+
+Kept apart from variant_build so the command line can offer them without importing
+the variant machinery on every invocation:
+
+    size  smallest approval + clear programs, then lowest total method cost;
+    cost  lowest total worst-case method cost, then smallest programs.
+"""
+
+OBJECTIVES = ("size", "cost")
@@ -0,0 +1,146 @@
+"""
+Opt-in timing spans for the build/deploy pipeline.
+
+Code marks its phases with `with span("compile", contract=name): ...`. Until
+`enable()` is called (the `--profile` flag), `span()` hands back one shared no-op
+context manager and nothing is recorded, so instrumented code costs a function
+call per phase. Once enabled, every span is recorded as a Chrome trace "complete"
+event, and every algod HTTP request is timed as a `network` span, which separates
+TEAL compiles, suggested params, submissions and confirmation waits.
+
+Load the written trace in chrome://tracing or https://ui.perfetto.dev; `summary()`
+renders the same spans as a table aggregated by name.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+_NO_OP = contextlib.nullcontext()
+_tracer: "Tracer | None" = None
+
+# Numeric path segments (app IDs, rounds) and transaction IDs, folded out of
+# algod routes so that repeated requests aggregate under one name.
+_ROUTE_ID = re.compile(r"/(\d+|[A-Z2-7]{52})(?=/|$)")
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, args: dict[str, Any]) -> Iterator[None]:
+        started = time.time_ns() // 1_000
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started,
+                "dur": time.time_ns() // 1_000 - started,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def summary(self) -> str:
+        totals: dict[tuple[str, str], list[int]] = {}
+        for event in self.events:
+            totals.setdefault((event["cat"], event["name"]), []).append(event["dur"])
+        rows = sorted(totals.items(), key=lambda item: -sum(item[1]))
+        width = max((len(name) for _, name in totals), default=4)
+        lines = [
+            f"{'phase':<{width}}  {'category':<8} {'count':>5} {'total ms':>9} "
+            f"{'mean ms':>8} {'max ms':>8}"
+        ]
+        for (category, name), durations in rows:
+            total = sum(durations) / 1000
+            lines.append(
+                f"{name:<{width}}  {category:<8} {len(durations):>5} {total:>9.1f} "
+                f"{total / len(durations):>8.1f} {max(durations) / 1000:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}))
+
+
+def span(
+    name: str, category: str = "phase", **args: Any
+) -> contextlib.AbstractContextManager[Any]:
+    """Times the enclosed block when profiling is enabled; a no-op otherwise."""
+    if _tracer is None:
+        return _NO_OP
+    return _tracer.span(name, category, args)
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def enable() -> Tracer:
+    """Starts recording spans (once per process) and timing algod requests."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+        _instrument_algod()
+    return _tracer
+
+
+def drain() -> list[dict[str, Any]]:
+    """Hands over the spans recorded so far, e.g. from a worker process to the parent."""
+    if _tracer is None:
+        return []
+    with _tracer._lock:
+        events, _tracer.events = _tracer.events, []
+    return events
+
+
+def merge(events: list[dict[str, Any]]) -> None:
+    if _tracer is not None and events:
+        with _tracer._lock:
+            _tracer.events.extend(events)
+
+
+def _instrument_algod() -> None:
+    """
+    Wraps AlgodClient.algod_request, which every algosdk/algokit_utils call goes
+    through, and PooledAlgodClient's override of it.
+    """
+    from algosdk.v2client.algod import AlgodClient
+
+    from smart_contracts._helpers.network import PooledAlgodClient
+
+    for client_class in (AlgodClient, PooledAlgodClient):
+        # Looked up in the class's own namespace, so a subclass without an override
+        # is covered by its base's wrapper and not wrapped twice.
+        original = vars(client_class).get("algod_request")
+        if original is None or getattr(original, "__profiled__", False):
+            continue
+        client_class.algod_request = _profiled_request(original)  # type: ignore[method-assign]
+
+
+def _profiled_request(original: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(original)
+    def algod_request(
+        self: Any, method: str, requrl: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        route = _ROUTE_ID.sub("/{id}", requrl)
+        with span(f"algod {method} {route}", "network", path=requrl):
+            return original(self, method, requrl, *args, **kwargs)
+
+    algod_request.__profiled__ = True  # type: ignore[attr-defined]
+    return algod_request
@@ -0,0 +1,143 @@
+"""
+Compiled program cache shared by the build and every deploy path.
+
+The build already assembles each contract's programs (--output-bytecode writes
+`<Name>.approval.bin` and `<Name>.clear.bin`). Next to them it records
+`<Name>.programs.json`:
+
+    {"source_hash": ..., "approval": {"sha256": ..., "size": ...}, "clear": {...}}
+
+where source_hash covers the contract and every project-local module it imports
+(see build_cache.local_dependencies). Deploy paths load the programs with
+load_cached_programs instead of sending the TEAL to algod's compile endpoint; it
+raises StaleProgramsError unless the bytes match the recorded hashes and the
+sources still hash to source_hash, i.e. the artifacts were built from the code
+being deployed. CachedPrograms.install() puts the bytes into an app spec in place
+of its TEAL source, so algokit_utils factories deploy them as they are.
+"""
+
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from smart_contracts._helpers.build_cache import local_dependencies
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_PROGRAMS = ("approval", "clear")
+
+
+class StaleProgramsError(Exception):
+    """The cached programs are missing or were not built from the current sources."""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def source_hash(contract_path: Path, project_root: Path = PROJECT_ROOT) -> str:
+    """Hashes a contract's source together with every project-local module it imports."""
+    project_root = project_root.resolve()
+    sources = {
+        path.relative_to(project_root).as_posix(): _sha256(path.read_bytes())
+        for path in local_dependencies(contract_path, project_root)
+    }
+    return _sha256(json.dumps(sources, sort_keys=True).encode())
+
+
+def _manifest_path(artifact_dir: Path, contract_name: str) -> Path:
+    return artifact_dir / f"{contract_name}.programs.json"
+
+
+def write_program_cache(
+    output_dir: Path, contract_path: Path, project_root: Path = PROJECT_ROOT
+) -> list[str]:
+    """
+    Records the hashes of every assembled program in a build's output directory.
+    Returns the contracts recorded; contracts without .bin programs (built without
+    --output-bytecode) are skipped.
+    """
+    recorded: list[str] = []
+    digest = source_hash(contract_path, project_root)
+    for app_spec in sorted(output_dir.glob("*.arc56.json")):
+        name = app_spec.name.removesuffix(".arc56.json")
+        programs = {kind: output_dir / f"{name}.{kind}.bin" for kind in _PROGRAMS}
+        if not all(path.is_file() for path in programs.values()):
+            logger.warning(f"No assembled programs for {name}, not caching them")
+            continue
+        manifest = {"source_hash": digest}
+        for kind, path in programs.items():
+            program = path.read_bytes()
+            manifest[kind] = {"sha256": _sha256(program), "size": len(program)}
+        _manifest_path(output_dir, name).write_text(json.dumps(manifest, indent=2) + "\n")
+        recorded.append(name)
+    return recorded
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedPrograms:
+    approval: bytes
+    clear: bytes
+    source_hash: str
+
+    def install(self, app_spec: Any) -> None:
+        """
+        Replaces an ARC-56 app spec's TEAL source with these programs, in place.
+        algokit_utils only compiles specs that carry source, so factories and
+        clients built on the spec (e.g. a generated typed factory's app_spec)
+        deploy the cached bytes without a compile request.
+        """
+        from algokit_utils import ByteCode
+
+        app_spec.source = None
+        app_spec.byte_code = ByteCode(
+            approval=base64.b64encode(self.approval).decode(),
+            clear=base64.b64encode(self.clear).decode(),
+        )
+
+
+def load_cached_programs(
+    artifact_dir: Path,
+    contract_name: str,
+    contract_path: Path,
+    project_root: Path = PROJECT_ROOT,
+) -> CachedPrograms:
+    """Loads a contract's built programs, refusing them if they are stale or corrupt."""
+    rebuild = "rebuild with `algokit project run build`"
+    try:
+        manifest = json.loads(_manifest_path(artifact_dir, contract_name).read_text())
+        programs = {
+            kind: (artifact_dir / f"{contract_name}.{kind}.bin").read_bytes()
+            for kind in _PROGRAMS
+        }
+    except (OSError, ValueError) as exc:
+        raise StaleProgramsError(f"No cached programs for {contract_name}, {rebuild}: {exc}") from exc
+
+    for kind, program in programs.items():
+        if _sha256(program) != manifest[kind]["sha256"]:
+            raise StaleProgramsError(
+                f"{contract_name}.{kind}.bin does not match its recorded hash, {rebuild}"
+            )
+    current = source_hash(contract_path, project_root)
+    if current != manifest["source_hash"]:
+        raise StaleProgramsError(
+            f"Cached programs for {contract_name} were built from different sources "
+            f"(built {manifest['source_hash'][:12]}, current {current[:12]}), {rebuild}"
+        )
+    return CachedPrograms(programs["approval"], programs["clear"], current)
+
+
+def load_contract_programs(contract_dir: Path, contract_name: str) -> CachedPrograms:
+    """load_cached_programs for a contract folder under smart_contracts/, as built by __main__."""
+    contract_dir = contract_dir.resolve()
+    return load_cached_programs(
+        contract_dir.parent / "artifacts" / contract_dir.name,
+        contract_name,
+        contract_dir / "contract.py",
+    )
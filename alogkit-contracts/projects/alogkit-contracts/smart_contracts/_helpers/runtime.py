@@ -0,0 +1,155 @@
+"""
+Runtime profiles for the build/deploy pipeline: logging and failure tracing.
+
+    dev   DEBUG logging, algokit_utils debug mode: every failed group is simulated
+          and its AVM trace written before the error is raised.
+    ci    INFO logging, algokit_utils debug mode as in dev, with a smaller trace
+          buffer, so failed CI deploys still leave traces to inspect.
+    prod  algokit_utils debug mode off, so failures cost no extra simulate or
+          write on the sending thread; failures of the bulk pipelines are traced
+          by failure_traces instead, sampled, within a file/byte budget and on a
+          background thread. Records are handed to a queue and formatted and
+          written by a listener thread, and algokit_utils' own logger is raised to
+          WARNING, so it skips its per-send DEBUG/INFO records.
+
+The profile is picked with `--runtime` or the RUNTIME_PROFILE environment
+variable (dev by default). `apply()` exports the name so worker processes and
+subprocesses run under the same profile.
+"""
+
+import atexit
+import dataclasses
+import logging
+import logging.handlers
+import os
+import queue
+from pathlib import Path
+from typing import TextIO
+
+from smart_contracts._helpers import failure_traces
+
+ENV_VAR = "RUNTIME_PROFILE"
+LOG_FORMAT = "%(asctime)s %(levelname)-10s: %(message)s"
+
+
+@dataclasses.dataclass(frozen=True)
+class RuntimeProfile:
+    name: str
+    log_level: int
+    # Level of algokit_utils' logger; configure(debug=...) resets it to DEBUG.
+    algokit_log_level: int
+    # algokit_utils debug mode: simulate and trace every failed group inline.
+    debug: bool
+    trace_buffer_size_mb: float = 256
+    # Sampled failure traces of the bulk pipelines (failure_traces); rate 0 = off.
+    failure_sample_rate: float = 0.0
+    max_trace_files: int = 0
+    max_trace_mb: float = 0
+    # Format and write log records on a listener thread instead of the caller's.
+    queued_logging: bool = False
+
+
+PROFILES = {
+    "dev": RuntimeProfile(
+        name="dev", log_level=logging.DEBUG, algokit_log_level=logging.DEBUG, debug=True
+    ),
+    "ci": RuntimeProfile(
+        name="ci",
+        log_level=logging.INFO,
+        algokit_log_level=logging.INFO,
+        debug=True,
+        trace_buffer_size_mb=32,
+    ),
+    "prod": RuntimeProfile(
+        name="prod",
+        log_level=logging.INFO,
+        algokit_log_level=logging.WARNING,
+        debug=False,
+        failure_sample_rate=0.1,
+        max_trace_files=20,
+        max_trace_mb=16,
+        queued_logging=True,
+    ),
+}
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records as they are; the listener's handler formats them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def get_profile(name: str | None = None) -> RuntimeProfile:
+    name = name or os.environ.get(ENV_VAR) or "dev"
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown runtime profile {name!r}, expected one of {', '.join(PROFILES)}"
+        ) from None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(profile: RuntimeProfile, stream: TextIO | None = None) -> None:
+    _stop_listener()
+    formatter = logging.Formatter(LOG_FORMAT)
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(formatter)
+    handler: logging.Handler = stream_handler
+    if profile.queued_logging:
+        global _listener
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, stream_handler)
+        _listener.start()
+        atexit.register(_stop_listener)
+        handler = _DeferredQueueHandler(records)
+        # Not used to format; copied by scheduler.run_captured for captured output.
+        handler.setFormatter(formatter)
+    logging.basicConfig(level=profile.log_level, handlers=[handler], force=True)
+
+
+def configure_algokit(profile: RuntimeProfile, project_root: Path | None = None) -> None:
+    """Applies the profile to algokit_utils' global config."""
+    from algokit_utils.config import config
+
+    # algokit_utils' default logger has no handlers; log through ours instead.
+    # Set trace_all=True to capture every transaction instead of only failed ones.
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(
+        logger=logging.getLogger("algokit_utils"),
+        debug=profile.debug,
+        project_root=project_root,
+        trace_all=False,
+        trace_buffer_size_mb=profile.trace_buffer_size_mb,
+    )
+    config.logger.setLevel(profile.algokit_log_level)
+
+
+def apply(
+    profile: RuntimeProfile, project_root: Path, stream: TextIO | None = None
+) -> RuntimeProfile:
+    """Configures logging (to stderr unless given a stream) and failure tracing."""
+    os.environ[ENV_VAR] = profile.name
+    configure_logging(profile, stream)
+    if profile.failure_sample_rate:
+        failure_traces.enable(
+            failure_traces.FailureTraceWriter(
+                project_root / failure_traces.TRACES_DIR,
+                sample_rate=profile.failure_sample_rate,
+                max_files=profile.max_trace_files,
+                max_bytes=int(profile.max_trace_mb * 2**20),
+            )
+        )
+    else:
+        failure_traces.disable()
+    return profile
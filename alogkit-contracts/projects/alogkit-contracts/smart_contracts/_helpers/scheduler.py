@@ -0,0 +1,89 @@
+"""
+Runs independent per-contract jobs across a process pool.
+
+Each job's stdout, stderr and log records are captured in the worker and handed
+back with its result, so the caller can print them in submission order instead
+of letting concurrent jobs interleave their output. When profiling, the spans a
+job records in a worker are handed back the same way.
+"""
+
+import contextlib
+import dataclasses
+import io
+import logging
+import traceback
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from smart_contracts._helpers import profiling
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+@dataclasses.dataclass
+class Job:
+    name: str
+    func: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    profile: bool = False
+
+
+@dataclasses.dataclass
+class JobResult:
+    name: str
+    output: str = ""
+    value: Any = None
+    error: str | None = None
+    spans: list[dict[str, Any]] = dataclasses.field(default_factory=list)
+
+
+def run_captured(job: Job) -> JobResult:
+    """Runs a job, capturing everything it prints or logs."""
+    buffer = io.StringIO()
+    root_logger = logging.getLogger()
+    handler = logging.StreamHandler(buffer)
+    if root_logger.handlers:
+        handler.setFormatter(root_logger.handlers[0].formatter)
+    saved_handlers = root_logger.handlers
+    root_logger.handlers = [handler]
+    result = JobResult(name=job.name)
+    if job.profile:
+        profiling.enable()
+        profiling.drain()  # drop spans inherited from a forked parent
+    try:
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            result.value = job.func(*job.args)
+    except Exception:
+        result.error = traceback.format_exc()
+    finally:
+        root_logger.handlers = saved_handlers
+    result.output = buffer.getvalue()
+    result.spans = profiling.drain()
+    return result
+
+
+def run_jobs(jobs: Sequence[Job], max_workers: int) -> Iterator[JobResult]:
+    """
+    Runs jobs concurrently and yields their results in submission order, each as
+    soon as it and every job before it have finished. With a single worker the
+    jobs run in-process one after another and print directly, as before.
+    """
+    if max_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            result = JobResult(name=job.name)
+            try:
+                result.value = job.func(*job.args)
+            except Exception:
+                result.error = traceback.format_exc()
+            yield result
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures: "list[Future[JobResult]]" = [
+            executor.submit(run_captured, job) for job in jobs
+        ]
+        for future in futures:
+            yield future.result()
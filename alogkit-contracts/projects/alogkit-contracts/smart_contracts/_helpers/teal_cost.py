@@ -0,0 +1,309 @@
+"""
+Static opcode-cost analysis of TEAL approval programs.
+
+Measures, without a network, the worst-case opcode budget an ABI method can use:
+the most expensive successful path from the start of the program to the method's
+routing target, plus the most expensive successful path from there to the end of
+the call (paths that end in `err` are ignored, subroutines are costed at their most
+expensive path to `retsub`, and a `return` inside a subroutine, as in puya's -O0
+routing wrappers, ends the call there). Loops are costed as a single iteration and
+flagged.
+
+Both puya output (`pushbytess`/`method` selectors dispatched with `match`) and
+hand-written or Beaker output (`method "sig"` / `==` / `bnz label`) are understood.
+"""
+
+import dataclasses
+import re
+from collections.abc import Collection
+from pathlib import Path
+
+# Opcodes whose cost differs from the default of 1 (AVM v10).
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "bn256_add": 70,
+    "bn256_scalar_mul": 970,
+    "bn256_pairing": 8700,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+}
+
+_BRANCHES = {"b", "bz", "bnz"}
+_MULTI_BRANCHES = {"match", "switch"}
+_TERMINATORS = {"return", "err", "retsub"}
+_METHOD_IN_COMMENT = re.compile(r'method "([^"]+)"')
+
+# Sentinel for "no successful path".
+_FAILS = -1
+
+
+@dataclasses.dataclass
+class Instruction:
+    op: str
+    args: list[str]
+    comment: str
+    line: int
+
+
+@dataclasses.dataclass
+class MethodCost:
+    signature: str
+    label: str
+    cost: int
+    has_loop: bool
+
+
+def _split_line(line: str) -> tuple[list[str], str]:
+    """Splits a TEAL line into tokens and its trailing comment, honouring quoted strings."""
+    tokens: list[str] = []
+    current = ""
+    in_string = False
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_string:
+            current += char
+            if char == "\\" and i + 1 < len(line):
+                current += line[i + 1]
+                i += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            current += char
+        elif line.startswith("//", i):
+            if current:
+                tokens.append(current)
+            return tokens, line[i + 2 :].strip()
+        elif char.isspace():
+            if current:
+                tokens.append(current)
+            current = ""
+        else:
+            current += char
+        i += 1
+    if current:
+        tokens.append(current)
+    return tokens, ""
+
+
+class TealProgram:
+    """A parsed TEAL program with its control flow graph."""
+
+    def __init__(self, source: str) -> None:
+        self.instructions: list[Instruction] = []
+        self.labels: dict[str, int] = {}
+        for line_number, line in enumerate(source.splitlines(), start=1):
+            tokens, comment = _split_line(line)
+            while tokens and tokens[0].endswith(":"):
+                self.labels[tokens.pop(0)[:-1]] = len(self.instructions)
+            if not tokens or tokens[0].startswith("#"):
+                continue
+            self.instructions.append(Instruction(tokens[0], tokens[1:], comment, line_number))
+        self._block_starts = self._find_block_starts()
+        self._dist_memo: dict[int, tuple[int, int]] = {}
+        self._loops: set[int] = set()
+        self._skipped: Collection[str] = ()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TealProgram":
+        return cls(path.read_text())
+
+    # ── Control flow ───────────────────────────────────────────────────────────
+
+    def _find_block_starts(self) -> list[int]:
+        starts = {0, *self.labels.values()}
+        for index, instruction in enumerate(self.instructions):
+            if (
+                instruction.op in _BRANCHES
+                or instruction.op in _MULTI_BRANCHES
+                or instruction.op in _TERMINATORS
+                or instruction.op == "callsub"
+            ):
+                starts.add(index + 1)
+        return sorted(start for start in starts if start <= len(self.instructions))
+
+    def _block_end(self, start: int) -> int:
+        for candidate in self._block_starts:
+            if candidate > start:
+                return candidate
+        return len(self.instructions)
+
+    def _successors(self, start: int) -> tuple[list[int], bool]:
+        """Returns the blocks a block can continue to and whether it can exit successfully."""
+        end = self._block_end(start)
+        if end == start:
+            return [], True  # fell off the end of the program
+        last = self.instructions[end - 1]
+        if last.op in ("return", "retsub"):
+            return [], True
+        if last.op == "err":
+            return [], False
+        if last.op == "b":
+            return [self.labels[last.args[0]]], False
+        if last.op in ("bz", "bnz"):
+            return [end, self.labels[last.args[0]]], False
+        if last.op in _MULTI_BRANCHES:
+            return [end, *(self.labels[label] for label in last.args)], False
+        return [end], False
+
+    def _subroutine_costs(self, label: str) -> tuple[int, int]:
+        """Most expensive paths through a subroutine: (to `retsub`, to `return`)."""
+        if label in self._skipped:
+            return 0, _FAILS
+        return self._exit_costs(self.labels[label])
+
+    def _block_cost(self, start: int) -> int:
+        cost = 0
+        for instruction in self.instructions[start : self._block_end(start)]:
+            cost += OPCODE_COSTS.get(instruction.op, 1)
+            if instruction.op == "callsub":
+                cost += max(self._subroutine_costs(instruction.args[0])[0], 0)
+        return cost
+
+    def _exit_costs(self, start: int, _active: set[int] | None = None) -> tuple[int, int]:
+        """
+        Most expensive successful paths from a block: (to `retsub`, to `return` or
+        the end of the program).
+        """
+        if start in self._dist_memo:
+            return self._dist_memo[start]
+        active = _active if _active is not None else set()
+        active.add(start)
+        end = self._block_end(start)
+        last_op = self.instructions[end - 1].op if end > start else "return"
+        successors, _ = self._successors(start)
+        to_retsub = 0 if last_op == "retsub" else _FAILS
+        to_return = 0 if last_op == "return" else _FAILS
+        for successor in successors:
+            if successor in active:
+                # Back edge: count the loop body once and stop following it.
+                self._loops.add(successor)
+                to_retsub, to_return = max(to_retsub, 0), max(to_return, 0)
+                continue
+            successor_retsub, successor_return = self._exit_costs(successor, active)
+            to_retsub = max(to_retsub, successor_retsub)
+            to_return = max(to_return, successor_return)
+        active.discard(start)
+
+        # Walk the block itself: a called subroutine either returns to it or ends
+        # the program with `return`.
+        cost, ended = 0, _FAILS
+        for instruction in self.instructions[start:end]:
+            cost += OPCODE_COSTS.get(instruction.op, 1)
+            if instruction.op != "callsub":
+                continue
+            sub_retsub, sub_return = self._subroutine_costs(instruction.args[0])
+            if sub_return != _FAILS:
+                ended = max(ended, cost + sub_return)
+            if sub_retsub == _FAILS:
+                to_retsub = to_return = _FAILS
+                break
+            cost += sub_retsub
+        result = (
+            _FAILS if to_retsub == _FAILS else cost + to_retsub,
+            max(ended, _FAILS if to_return == _FAILS else cost + to_return),
+        )
+        self._dist_memo[start] = result
+        return result
+
+    def cost_to_exit(self, start: int) -> int:
+        """Most expensive successful path from a block to return/retsub/end of program."""
+        return max(self._exit_costs(start))
+
+    def cost_to_reach(self, target: int) -> int:
+        """
+        Most expensive path from the start of the program to a block (excluding it).
+        Only loops on a path to the block are flagged, not those in other methods' bodies.
+        """
+        memo: dict[int, int] = {}
+        loop_heads: set[int] = set()
+
+        def visit(start: int, active: set[int]) -> int:
+            if start == target:
+                return 0
+            if start in memo:
+                return memo[start]
+            active.add(start)
+            best = _FAILS
+            for successor in self._successors(start)[0]:
+                if successor in active:
+                    loop_heads.add(successor)
+                    continue
+                best = max(best, visit(successor, active))
+            active.discard(start)
+            memo[start] = _FAILS if best == _FAILS else self._block_cost(start) + best
+            return memo[start]
+
+        cost = visit(0, set())
+        # Every block of a loop reaches the target if its head does.
+        self._loops.update(head for head in loop_heads if memo.get(head, _FAILS) != _FAILS)
+        return cost
+
+    # ── ABI methods ────────────────────────────────────────────────────────────
+
+    def method_entries(self) -> dict[str, str]:
+        """Maps each ABI method signature to the label its call is routed to."""
+        entries: dict[str, str] = {}
+        selectors: list[str] = []
+        for index, instruction in enumerate(self.instructions):
+            if instruction.op == "method":
+                signature = instruction.args[0].strip('"')
+                selectors.append(signature)
+                # Hand-written / Beaker dispatch: method "sig"; ==; bnz label
+                following = self.instructions[index + 1 : index + 3]
+                if (
+                    len(following) == 2
+                    and following[0].op == "=="
+                    and following[1].op == "bnz"
+                ):
+                    entries.setdefault(signature, following[1].args[0])
+                    selectors.clear()
+            elif instruction.op in ("pushbytess", "pushbytes") and "method" in instruction.comment:
+                selectors.extend(_METHOD_IN_COMMENT.findall(instruction.comment))
+            elif instruction.op == "match" and selectors:
+                # puya dispatch: selectors pushed in order, then match label...
+                for signature, label in zip(selectors[-len(instruction.args) :], instruction.args):
+                    entries.setdefault(signature, label)
+                selectors.clear()
+        return entries
+
+    def method_costs(self, skip_subroutines: Collection[str] = ()) -> dict[str, MethodCost]:
+        """
+        Worst-case opcode cost of every ABI method. Calls to `skip_subroutines`
+        cost only the callsub itself, which isolates the cost of an optional path.
+        """
+        self._skipped = skip_subroutines
+        costs: dict[str, MethodCost] = {}
+        for signature, label in self.method_entries().items():
+            # Start from a clean slate so loops are attributed to the right method.
+            self._loops.clear()
+            self._dist_memo.clear()
+            entry = self.labels[label]
+            prefix = self.cost_to_reach(entry)
+            body = self.cost_to_exit(entry)
+            costs[signature] = MethodCost(
+                signature=signature,
+                label=label,
+                cost=max(prefix, 0) + max(body, 0),
+                has_loop=bool(self._loops),
+            )
+        return costs
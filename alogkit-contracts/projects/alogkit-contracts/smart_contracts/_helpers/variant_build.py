@@ -0,0 +1,179 @@
+"""
+Compiles a contract under every optimisation setting and publishes the best variant.
+
+A contract that is deployed once per goal pays for its program size and opcode
+budget again on every create and call, so it is worth trying every compiler
+setting that changes the emitted bytecode: puyapy's --optimization-level and
+--locals-coalescing-strategy (--debug-level only changes debug output). Each
+variant is compiled next to the final output directory, measured with
+contract_metrics (assembled program sizes and the static worst-case opcode cost
+of every ABI method, see teal_cost), and the best one under the chosen objective
+becomes the published artifact:
+
+    size  smallest approval + clear programs, then lowest total method cost;
+    cost  lowest total worst-case method cost, then smallest programs.
+
+The metrics of every variant are written next to the artifacts in
+optimization_report.json.
+"""
+
+import dataclasses
+import json
+import logging
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from smart_contracts._helpers.contract_metrics import ContractMetrics, measure_puya_artifacts
+from smart_contracts._helpers.objectives import OBJECTIVES
+from smart_contracts._helpers.profiling import span
+
+logger = logging.getLogger(__name__)
+
+OPTIMIZATION_LEVELS = (0, 1, 2)
+COALESCING_STRATEGIES = ("root-operand", "root-operand-excluding-args", "aggressive")
+REPORT_FILE_NAME = "optimization_report.json"
+
+# Compiles a contract into a directory with extra flags, raising on failure.
+Compiler = Callable[[Path, Path, list[str]], object]
+
+
+@dataclasses.dataclass(frozen=True)
+class Variant:
+    optimization_level: int
+    coalescing_strategy: str
+
+    @property
+    def name(self) -> str:
+        return f"O{self.optimization_level}-{self.coalescing_strategy}"
+
+    @property
+    def flags(self) -> list[str]:
+        return [
+            f"--optimization-level={self.optimization_level}",
+            f"--locals-coalescing-strategy={self.coalescing_strategy}",
+        ]
+
+
+VARIANTS = tuple(
+    Variant(level, strategy)
+    for level in OPTIMIZATION_LEVELS
+    for strategy in COALESCING_STRATEGIES
+)
+
+
+@dataclasses.dataclass
+class VariantResult:
+    variant: Variant
+    output_dir: Path
+    contracts: dict[str, ContractMetrics]
+
+    @property
+    def program_size(self) -> int:
+        return sum(
+            (metrics.approval_size or 0) + (metrics.clear_size or 0)
+            for metrics in self.contracts.values()
+        )
+
+    @property
+    def total_cost(self) -> int:
+        return sum(
+            sum(metrics.method_costs.values()) for metrics in self.contracts.values()
+        )
+
+    def score(self, objective: str) -> tuple[int, int]:
+        if objective == "size":
+            return self.program_size, self.total_cost
+        return self.total_cost, self.program_size
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "variant": self.variant.name,
+            "flags": self.variant.flags,
+            "program_size": self.program_size,
+            "total_method_cost": self.total_cost,
+            "contracts": {name: metrics.as_dict() for name, metrics in self.contracts.items()},
+        }
+
+
+def _measure(variant: Variant, output_dir: Path) -> VariantResult:
+    contracts = {
+        spec.name.removesuffix(".arc56.json"): measure_puya_artifacts(
+            output_dir, spec.name.removesuffix(".arc56.json")
+        )
+        for spec in sorted(output_dir.glob("*.arc56.json"))
+    }
+    return VariantResult(variant, output_dir, contracts)
+
+
+def format_report(results: list[VariantResult], objective: str, best: VariantResult) -> str:
+    lines = [
+        f"{'variant':<32} {'program bytes':>13} {'total method cost':>17}",
+        *(
+            f"{result.variant.name:<32} {result.program_size:>13} {result.total_cost:>17}"
+            + ("  <- selected" if result is best else "")
+            for result in sorted(results, key=lambda result: result.score(objective))
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def build_best_variant(
+    contract_path: Path,
+    output_dir: Path,
+    flags: list[str],
+    objective: str,
+    compile_contract: Compiler,
+    variants: tuple[Variant, ...] = VARIANTS,
+) -> VariantResult:
+    """
+    Compiles every variant, moves the best one's artifacts into `output_dir` and
+    writes the comparison report there. `flags` must include --output-bytecode so
+    program sizes can be measured.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}, expected one of {OBJECTIVES}")
+    if "--output-bytecode" not in flags:
+        raise ValueError("Selecting a variant needs --output-bytecode to measure program sizes")
+    name = output_dir.name
+    # Siblings of output_dir, so relative paths recorded in the artifacts (e.g.
+    # source maps) are the same as for a direct build.
+    staging = {variant: output_dir.parent / f".{name}.{variant.name}" for variant in variants}
+
+    def compile_variant(variant: Variant) -> VariantResult | None:
+        variant_dir = staging[variant]
+        shutil.rmtree(variant_dir, ignore_errors=True)
+        variant_dir.mkdir(parents=True)
+        try:
+            with span("compile variant", contract=name, variant=variant.name):
+                compile_contract(contract_path, variant_dir, [*flags, *variant.flags])
+        except Exception as exc:
+            logger.warning(f"Variant {variant.name} of {name} failed to compile: {exc}")
+            return None
+        return _measure(variant, variant_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+            results = [result for result in executor.map(compile_variant, variants) if result]
+        if not results:
+            raise Exception(f"No variant of {contract_path} compiled")
+        best = min(results, key=lambda result: result.score(objective))
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for artifact in best.output_dir.iterdir():
+            artifact.rename(output_dir / artifact.name)
+        report = {
+            "objective": objective,
+            "selected": best.variant.name,
+            "variants": [result.as_dict() for result in results],
+        }
+        (output_dir / REPORT_FILE_NAME).write_text(json.dumps(report, indent=2) + "\n")
+        logger.info(
+            f"Selected {best.variant.name} for {name} by {objective}:\n"
+            f"{format_report(results, objective, best)}"
+        )
+        return best
+    finally:
+        for variant_dir in staging.values():
+            shutil.rmtree(variant_dir, ignore_errors=True)
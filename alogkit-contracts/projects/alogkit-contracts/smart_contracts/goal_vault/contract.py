@@ -0,0 +1,155 @@
+"""
+GoalVault Smart Contract
+========================
+A multi-goal variant of SavingsVault: one application holds any number of
+savings goals, each stored in its own box keyed by (owner, goal id), instead of
+deploying one application per goal.
+
+Box storage:
+    "g" ‖ owner (32 bytes) ‖ goal_id (uint64)  →  Goal
+        target_amount  (uint64)  — savings target in microALGOs
+        total_saved    (uint64)  — running total of deposits in microALGOs
+        deadline       (uint64)  — Unix timestamp after which withdrawal is always allowed
+        goal_completed (bool)    — set once the target is reached
+
+On-chain commitment logic (identical to SavingsVault, per goal):
+    • Deposits are accepted only before the deadline and until the goal is met.
+    • Withdrawal is gated: funds are only released when the goal is completed
+      OR the deadline has passed.
+    • No admin override — the contract creator cannot bypass these rules.
+
+Each goal's box minimum balance is paid by its owner when the goal is created
+and refunded together with the savings on withdrawal, when the box is deleted.
+"""
+
+from algopy import ARC4Contract, BoxMap, Global, Txn, UInt64, arc4, gtxn, itxn
+
+# Box MBR: 2500 + 400 × (name bytes + value bytes).
+# Name = 1-byte prefix + 32-byte owner + 8-byte goal id; value = 3 × uint64 + bool.
+GOAL_BOX_MBR = 2_500 + 400 * ((1 + 32 + 8) + (8 + 8 + 8 + 1))
+
+
+class GoalKey(arc4.Struct, frozen=True):
+    owner: arc4.Address
+    goal_id: arc4.UInt64
+
+
+class Goal(arc4.Struct):
+    target_amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    deadline: arc4.UInt64
+    goal_completed: arc4.Bool
+
+
+class GoalVault(ARC4Contract):
+    """Holds many savings goals in boxes, with the same commitment rules as SavingsVault."""
+
+    def __init__(self) -> None:
+        self.goals = BoxMap(GoalKey, Goal, key_prefix=b"g")
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────────
+
+    @arc4.baremethod(create="require")
+    def create(self) -> None:
+        """Create the (empty) vault. Goals are added with create_goal."""
+
+    # ── Core methods ───────────────────────────────────────────────────────────
+
+    @arc4.abimethod
+    def create_goal(
+        self,
+        goal_id: arc4.UInt64,
+        target: arc4.UInt64,
+        deadline_ts: arc4.UInt64,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Open a new savings goal owned by the caller.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address, exactly GOAL_BOX_MBR
+            [1] This app call
+
+        Args:
+            goal_id:     Caller-chosen identifier, unique per owner.
+            target:      Savings target in microALGOs.
+            deadline_ts: Unix timestamp after which funds are always withdrawable.
+            mbr_payment: Payment funding the goal box's minimum balance.
+        """
+        key = GoalKey(arc4.Address(Txn.sender), goal_id)
+        assert key not in self.goals, "Goal already exists"
+        assert mbr_payment.receiver == Global.current_application_address, "Payment must go to contract"
+        # Exactly the box MBR, which is all withdraw refunds; any excess would be stranded.
+        assert mbr_payment.amount == GOAL_BOX_MBR, "Payment must equal goal storage cost"
+
+        self.goals[key] = Goal(
+            target_amount=target,
+            total_saved=arc4.UInt64(0),
+            deadline=deadline_ts,
+            goal_completed=arc4.Bool(False),
+        )
+
+    @arc4.abimethod
+    def deposit(self, goal_id: arc4.UInt64, payment: gtxn.PaymentTransaction) -> None:
+        """
+        Accept a deposit towards one of the caller's goals.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address
+            [1] This app call
+
+        Commitment enforcement:
+            • Only the goal owner may deposit (goals are looked up by sender).
+            • Deposits are rejected after the deadline.
+            • Deposits are rejected once the goal is already completed.
+            • Payment receiver must be this contract's account.
+        """
+        key = GoalKey(arc4.Address(Txn.sender), goal_id)
+        assert key in self.goals, "Goal not found"
+        goal = self.goals[key].copy()
+        assert Global.latest_timestamp < goal.deadline.native, "Cannot deposit after deadline"
+        assert not goal.goal_completed.native, "Goal already completed"
+        assert payment.receiver == Global.current_application_address, "Payment must go to contract"
+
+        # Update running total and check if target has been reached.
+        total_saved = goal.total_saved.native + payment.amount
+        goal.total_saved = arc4.UInt64(total_saved)
+        if total_saved >= goal.target_amount.native:
+            goal.goal_completed = arc4.Bool(True)
+
+        self.goals[key] = goal.copy()
+
+    @arc4.abimethod
+    def withdraw(self, goal_id: arc4.UInt64) -> None:
+        """
+        Withdraw a goal's savings, plus its refunded box minimum balance, to its owner
+        and delete the goal.
+
+        Commitment enforcement:
+            • Only the goal owner can call this (goals are looked up by sender).
+            • Withdrawal is only permitted when the goal is completed
+              OR the deadline has passed — the contract cannot be bypassed.
+        """
+        key = GoalKey(arc4.Address(Txn.sender), goal_id)
+        assert key in self.goals, "Goal not found"
+        goal = self.goals[key].copy()
+        assert (
+            goal.goal_completed.native
+            or Global.latest_timestamp >= goal.deadline.native
+        ), "Withdrawal conditions not met: goal incomplete and deadline not reached"
+
+        del self.goals[key]
+
+        # Inner transaction: send the goal's savings and freed box MBR back to the owner.
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=goal.total_saved.native + UInt64(GOAL_BOX_MBR),
+            fee=0,
+        ).submit()
+
+    @arc4.abimethod(readonly=True)
+    def get_goal(self, owner: arc4.Address, goal_id: arc4.UInt64) -> Goal:
+        """Return the state of a single goal."""
+        key = GoalKey(owner, goal_id)
+        assert key in self.goals, "Goal not found"
+        return self.goals[key]
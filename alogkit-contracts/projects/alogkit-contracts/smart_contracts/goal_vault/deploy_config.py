@@ -0,0 +1,98 @@
+"""
+Deployment configuration for the GoalVault contract.
+
+Deploys a single GoalVault application to the configured Algorand network and
+opens a demo goal in it. Further goals for any owner go into the same app ID,
+so the frontend only needs to track one application.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import algokit_utils
+from algosdk.encoding import decode_address
+
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import load_contract_programs
+from smart_contracts.goal_vault.contract import GOAL_BOX_MBR
+
+logger = logging.getLogger(__name__)
+
+
+def goal_box_name(owner: str, goal_id: int) -> bytes:
+    """Box name of a goal: "g" ‖ owner public key ‖ big-endian goal id."""
+    return b"g" + decode_address(owner) + goal_id.to_bytes(8, "big")
+
+
+def deploy() -> None:
+    from smart_contracts.artifacts.goal_vault.goal_vault_client import (
+        CreateGoalArgs,
+        GoalVaultFactory,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        GoalVaultFactory, default_sender=deployer.address
+    )
+
+    # Deploy the programs assembled by the build, without an algod compile round-trip.
+    with span("load cached programs"):
+        load_contract_programs(Path(__file__).parent, "GoalVault").install(factory.app_spec)
+
+    with span("factory.deploy"):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        )
+
+    logger.info(
+        f"GoalVault deployed — App ID: {app_client.app_id} | "
+        f"App Address: {app_client.app_address}"
+    )
+
+    if result.operation_performed not in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        return
+
+    # Fund the contract's minimum balance (0.1 ALGO).
+    with span("fund app account"):
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=0.1),
+                sender=deployer.address,
+                receiver=app_client.app_address,
+            )
+        )
+    logger.info("Funded contract minimum balance (0.1 ALGO).")
+
+    # Open a demo goal — goal: 5 ALGO, deadline: 30 days from now.
+    goal_id = 1
+    with span("create demo goal"):
+        app_client.send.create_goal(
+            args=CreateGoalArgs(
+                goal_id=goal_id,
+                target=5_000_000,  # 5 ALGO in microALGOs
+                deadline_ts=int(time.time()) + 30 * 24 * 60 * 60,
+                mbr_payment=algorand.create_transaction.payment(
+                    algokit_utils.PaymentParams(
+                        amount=algokit_utils.AlgoAmount(micro_algo=GOAL_BOX_MBR),
+                        sender=deployer.address,
+                        receiver=app_client.app_address,
+                    )
+                ),
+            ),
+            params=algokit_utils.CommonAppCallParams(
+                box_references=[goal_box_name(deployer.address, goal_id)]
+            ),
+        )
+
+    logger.info(
+        f"✅  GoalVault is live with demo goal #{goal_id}!\n"
+        f"    App ID  : {app_client.app_id}\n"
+        f"    Explorer: https://testnet.explorer.perawallet.app/application/{app_client.app_id}"
+    )
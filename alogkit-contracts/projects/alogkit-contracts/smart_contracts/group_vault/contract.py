@@ -0,0 +1,182 @@
+"""
+GroupVault Smart Contract
+=========================
+A group variant of SavingsVault: many members save toward one shared goal in a
+single application, instead of deploying one vault per member. Each member's
+contribution is kept in its own box, so a group dashboard needs one application
+read for the totals and one box read per member.
+
+Global State:
+    organizer      (bytes)   — 32-byte address of the account that created the group
+    target_amount  (uint64)  — shared savings target in microALGOs
+    total_saved    (uint64)  — running total of all members' deposits in microALGOs
+    deadline       (uint64)  — Unix timestamp after which withdrawal is always allowed
+    goal_completed (uint64)  — 0 = active, 1 = shared target reached
+    payout_pool    (uint64)  — funds still to be paid out, fixed at the first withdrawal
+    payout_basis   (uint64)  — contributions still to be paid out, fixed at the first withdrawal
+    settling       (uint64)  — 1 once the first member has withdrawn
+
+Box storage:
+    "m" ‖ member (32 bytes)  →  contributed (uint64), microALGOs deposited by the member
+
+On-chain commitment logic (SavingsVault's rules, for the group as a whole):
+    • Anyone may join the group before the deadline and until the goal is met.
+    • Deposits are accepted only from members, before the deadline and until
+      the shared target is met.
+    • Withdrawal is gated: funds are only released when the shared goal is
+      completed OR the deadline has passed.
+    • Each member withdraws their pro-rata share of the pooled funds (everything
+      above the application's minimum balance, so payments sent to the vault
+      outside deposit are shared too), plus their refunded box minimum balance.
+    • No admin override — the organizer has no more rights than any member.
+"""
+
+from algopy import (
+    Account,
+    ARC4Contract,
+    BoxMap,
+    Global,
+    GlobalState,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+)
+
+# Box MBR: 2500 + 400 × (name bytes + value bytes).
+# Name = 1-byte prefix + 32-byte member address; value = uint64 contribution.
+MEMBER_BOX_MBR = 2_500 + 400 * ((1 + 32) + 8)
+
+
+class GroupVault(ARC4Contract):
+    """One application per savings group, with each member's contribution in a box."""
+
+    # ── Global state ───────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        self.organizer = GlobalState(Account)
+        self.target_amount = GlobalState(UInt64)
+        self.total_saved = GlobalState(UInt64)
+        self.deadline = GlobalState(UInt64)
+        self.goal_completed = GlobalState(UInt64)
+        self.payout_pool = GlobalState(UInt64)
+        self.payout_basis = GlobalState(UInt64)
+        self.settling = GlobalState(UInt64)
+        self.members = BoxMap(Account, UInt64, key_prefix=b"m")
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────────
+
+    @arc4.abimethod(create="require")
+    def create_group(self, target: arc4.UInt64, deadline_ts: arc4.UInt64) -> None:
+        """
+        Initialise the group vault.  Called exactly once at application creation.
+
+        Args:
+            target:      Shared savings target in microALGOs.
+            deadline_ts: Unix timestamp after which funds are always withdrawable.
+        """
+        self.organizer.value = Txn.sender
+        self.target_amount.value = target.native
+        self.deadline.value = deadline_ts.native
+        self.total_saved.value = UInt64(0)
+        self.goal_completed.value = UInt64(0)
+        self.payout_pool.value = UInt64(0)
+        self.payout_basis.value = UInt64(0)
+        self.settling.value = UInt64(0)
+
+    # ── Core methods ───────────────────────────────────────────────────────────
+
+    @arc4.abimethod
+    def join(self, mbr_payment: gtxn.PaymentTransaction) -> None:
+        """
+        Add the caller to the group.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address, of exactly MEMBER_BOX_MBR
+            [1] This app call, with a reference to the caller's member box
+        """
+        assert Txn.sender not in self.members, "Already a member"
+        assert Global.latest_timestamp < self.deadline.value, "Cannot join after deadline"
+        assert self.goal_completed.value == UInt64(0), "Goal already completed"
+        assert mbr_payment.receiver == Global.current_application_address, "Payment must go to contract"
+        assert mbr_payment.amount == MEMBER_BOX_MBR, "Payment must equal member storage cost"
+
+        self.members[Txn.sender] = UInt64(0)
+
+    @arc4.abimethod
+    def deposit(self, payment: gtxn.PaymentTransaction) -> None:
+        """
+        Accept a member's deposit towards the shared goal.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address
+            [1] This app call, with a reference to the caller's member box
+
+        Commitment enforcement:
+            • Only members may deposit.
+            • Deposits are rejected after the deadline.
+            • Deposits are rejected once the shared goal is already completed.
+            • Payment receiver must be this contract's account.
+        """
+        assert Txn.sender in self.members, "Sender must be a member"
+        assert Global.latest_timestamp < self.deadline.value, "Cannot deposit after deadline"
+        assert self.goal_completed.value == UInt64(0), "Goal already completed"
+        assert payment.receiver == Global.current_application_address, "Payment must go to contract"
+
+        self.members[Txn.sender] += payment.amount
+        self.total_saved.value += payment.amount
+        if self.total_saved.value >= self.target_amount.value:
+            self.goal_completed.value = UInt64(1)
+
+    @arc4.abimethod
+    def withdraw(self) -> None:
+        """
+        Pay the caller their pro-rata share of the pooled funds, plus their refunded
+        box minimum balance, and remove them from the group.
+
+        The first withdrawal fixes the pool (the application's balance above its
+        minimum balance) and the contributions it is shared over. Every payout is
+        then contributed × remaining pool ÷ remaining contributions, so rounding
+        never strands funds: the last member receives exactly what is left.
+
+        Commitment enforcement:
+            • Only members can call this.
+            • Withdrawal is only permitted when the shared goal is completed
+              OR the deadline has passed — the contract cannot be bypassed.
+        """
+        assert Txn.sender in self.members, "Sender must be a member"
+        assert (
+            self.goal_completed.value == UInt64(1)
+            or Global.latest_timestamp >= self.deadline.value
+        ), "Withdrawal conditions not met: goal incomplete and deadline not reached"
+
+        if self.settling.value == UInt64(0):
+            app = Global.current_application_address
+            self.payout_pool.value = app.balance - app.min_balance
+            self.payout_basis.value = self.total_saved.value
+            self.settling.value = UInt64(1)
+
+        contributed = self.members[Txn.sender]
+        share = UInt64(0)
+        if contributed:
+            high, low = op.mulw(contributed, self.payout_pool.value)
+            share = op.divw(high, low, self.payout_basis.value)
+            self.payout_pool.value -= share
+            self.payout_basis.value -= contributed
+
+        del self.members[Txn.sender]
+
+        # Inner transaction: send the member's share and freed box MBR back to them.
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=share + MEMBER_BOX_MBR,
+            fee=0,
+        ).submit()
+
+    @arc4.abimethod(readonly=True)
+    def get_contribution(self, member: arc4.Address) -> arc4.UInt64:
+        """Return how much a member has deposited."""
+        assert member.native in self.members, "Member not found"
+        return arc4.UInt64(self.members[member.native])
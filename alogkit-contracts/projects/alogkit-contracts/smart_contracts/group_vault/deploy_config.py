@@ -0,0 +1,101 @@
+"""
+Deployment configuration for the GroupVault contract.
+
+Deploys a demo GroupVault application to the configured Algorand network and
+joins it as the deployer. Other members join and deposit into the same app ID,
+so the frontend tracks one application per group instead of one per member.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import algokit_utils
+from algosdk.encoding import decode_address
+
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import load_contract_programs
+from smart_contracts.group_vault.contract import MEMBER_BOX_MBR
+
+logger = logging.getLogger(__name__)
+
+
+def member_box_name(member: str) -> bytes:
+    """Box name of a member's contribution: "m" ‖ member public key."""
+    return b"m" + decode_address(member)
+
+
+def deploy() -> None:
+    from smart_contracts.artifacts.group_vault.group_vault_client import (
+        CreateGroupArgs,
+        GroupVaultFactory,
+        JoinArgs,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        GroupVaultFactory, default_sender=deployer.address
+    )
+
+    # Deploy the programs assembled by the build, without an algod compile round-trip.
+    with span("load cached programs"):
+        load_contract_programs(Path(__file__).parent, "GroupVault").install(factory.app_spec)
+
+    # Deploy a demo group vault — shared goal: 20 ALGO, deadline: 30 days from now.
+    with span("factory.deploy"):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            create_args=algokit_utils.DeployCallArgs(
+                args=CreateGroupArgs(
+                    target=20_000_000,  # 20 ALGO in microALGOs
+                    deadline_ts=int(time.time()) + 30 * 24 * 60 * 60,
+                )
+            ),
+        )
+
+    logger.info(
+        f"GroupVault deployed — App ID: {app_client.app_id} | "
+        f"App Address: {app_client.app_address}"
+    )
+
+    if result.operation_performed not in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        return
+
+    # Fund the contract's minimum balance (0.1 ALGO).
+    with span("fund app account"):
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=0.1),
+                sender=deployer.address,
+                receiver=app_client.app_address,
+            )
+        )
+    logger.info("Funded contract minimum balance (0.1 ALGO).")
+
+    with span("join demo group"):
+        app_client.send.join(
+            args=JoinArgs(
+                mbr_payment=algorand.create_transaction.payment(
+                    algokit_utils.PaymentParams(
+                        amount=algokit_utils.AlgoAmount(micro_algo=MEMBER_BOX_MBR),
+                        sender=deployer.address,
+                        receiver=app_client.app_address,
+                    )
+                ),
+            ),
+            params=algokit_utils.CommonAppCallParams(
+                box_references=[member_box_name(deployer.address)]
+            ),
+        )
+
+    logger.info(
+        f"✅  GroupVault is live with the deployer as its first member!\n"
+        f"    App ID  : {app_client.app_id}\n"
+        f"    Explorer: https://testnet.explorer.perawallet.app/application/{app_client.app_id}"
+    )
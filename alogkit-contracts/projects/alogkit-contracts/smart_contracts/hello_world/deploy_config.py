@@ -1,7 +1,11 @@
 import logging
+from pathlib import Path
 
 import algokit_utils
 
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import load_contract_programs
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,25 +23,32 @@ def deploy() -> None:
         HelloWorldFactory, default_sender=deployer_.address
     )
 
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-    )
+    # Deploy the programs assembled by the build, without an algod compile round-trip.
+    with span("load cached programs"):
+        load_contract_programs(Path(__file__).parent, "HelloWorld").install(factory.app_spec)
+
+    with span("factory.deploy"):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        )
 
     if result.operation_performed in [
         algokit_utils.OperationPerformed.Create,
         algokit_utils.OperationPerformed.Replace,
     ]:
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=1),
-                sender=deployer_.address,
-                receiver=app_client.app_address,
+        with span("fund app account"):
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(algo=1),
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
             )
-        )
 
     name = "world"
-    response = app_client.send.hello(args=HelloArgs(name=name))
+    with span("call hello"):
+        response = app_client.send.hello(args=HelloArgs(name=name))
     logger.info(
         f"Called hello on {app_client.app_name} ({app_client.app_id}) "
         f"with name={name}, received: {response.abi_return}"
@@ -0,0 +1,109 @@
+"""
+PackedSavingsVault Smart Contract
+=================================
+Opt-in variant of SavingsVault with the same methods and commitment rules, but
+the whole goal record kept in a single fixed-layout global-state value instead
+of five separate keys. Readers fetch and decode one entry per app, and the app
+only needs one byte-slice slot in its global schema.
+
+Global State:
+    goal (bytes, 57) — ARC-4 encoded GoalRecord:
+        [ 0:32] goal_owner     — 32-byte address of the savings goal creator
+        [32:40] target_amount  — savings target in microALGOs (uint64)
+        [40:48] total_saved    — running total of deposits in microALGOs (uint64)
+        [48:56] deadline       — Unix timestamp after which withdrawal is always allowed (uint64)
+        [56:57] goal_completed — 0x80 once the goal is reached, 0x00 while active (bool)
+
+See layout.py for the matching Python encoder/decoder.
+"""
+
+from algopy import ARC4Contract, Global, GlobalState, Txn, arc4, gtxn, itxn
+
+
+class GoalRecord(arc4.Struct):
+    goal_owner: arc4.Address
+    target_amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    deadline: arc4.UInt64
+    goal_completed: arc4.Bool
+
+
+class PackedSavingsVault(ARC4Contract):
+    """On-chain savings vault storing its goal as one packed global-state value."""
+
+    def __init__(self) -> None:
+        self.goal = GlobalState(GoalRecord, key="goal")
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────────
+
+    @arc4.abimethod(create="require")
+    def create_goal(
+        self,
+        owner: arc4.Address,
+        target: arc4.UInt64,
+        deadline_ts: arc4.UInt64,
+    ) -> None:
+        """
+        Initialise the vault.  Called exactly once at application creation.
+
+        Args:
+            owner:       Algorand address that owns this savings goal.
+            target:      Savings target in microALGOs.
+            deadline_ts: Unix timestamp after which funds are always withdrawable.
+        """
+        self.goal.value = GoalRecord(
+            goal_owner=owner,
+            target_amount=target,
+            total_saved=arc4.UInt64(0),
+            deadline=deadline_ts,
+            goal_completed=arc4.Bool(False),
+        )
+
+    # ── Core methods ───────────────────────────────────────────────────────────
+
+    @arc4.abimethod
+    def deposit(self, payment: gtxn.PaymentTransaction) -> None:
+        """
+        Accept a deposit towards the savings goal.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address
+            [1] This app call
+
+        Commitment enforcement is identical to SavingsVault.deposit.
+        """
+        goal = self.goal.value.copy()
+        assert Txn.sender == goal.goal_owner.native, "Sender must be goal owner"
+        assert Global.latest_timestamp < goal.deadline.native, "Cannot deposit after deadline"
+        assert not goal.goal_completed.native, "Goal already completed"
+        assert payment.receiver == Global.current_application_address, "Payment must go to contract"
+
+        # Update running total and check if target has been reached.
+        total_saved = goal.total_saved.native + payment.amount
+        goal.total_saved = arc4.UInt64(total_saved)
+        if total_saved >= goal.target_amount.native:
+            goal.goal_completed = arc4.Bool(True)
+
+        self.goal.value = goal.copy()
+
+    @arc4.abimethod
+    def withdraw(self) -> None:
+        """
+        Withdraw the entire vault balance to the goal owner.
+
+        Commitment enforcement is identical to SavingsVault.withdraw.
+        """
+        goal = self.goal.value.copy()
+        assert Txn.sender == goal.goal_owner.native, "Only goal owner can withdraw"
+        assert (
+            goal.goal_completed.native
+            or Global.latest_timestamp >= goal.deadline.native
+        ), "Withdrawal conditions not met: goal incomplete and deadline not reached"
+
+        # Inner transaction: send entire balance (including MBR) back to owner.
+        itxn.Payment(
+            receiver=goal.goal_owner.native,
+            amount=0,
+            close_remainder_to=goal.goal_owner.native,
+            fee=0,
+        ).submit()
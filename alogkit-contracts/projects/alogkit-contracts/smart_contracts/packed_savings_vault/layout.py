@@ -0,0 +1,59 @@
+"""
+Python encoder/decoder for the PackedSavingsVault goal record.
+
+The record is the ARC-4 encoding of GoalRecord in contract.py, stored under the
+single global-state key "goal":
+
+    goal_owner (32) ‖ target_amount (8) ‖ total_saved (8) ‖ deadline (8) ‖ goal_completed (1)
+"""
+
+import base64
+import struct
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from smart_contracts.savings_vault.state import VaultState
+
+GOAL_KEY = b"goal"
+RECORD_SIZE = 57
+
+_RECORD = struct.Struct(">32sQQQB")
+_TRUE = 0x80
+
+
+def encode_goal_record(state: VaultState) -> bytes:
+    """Encodes a vault's state the way PackedSavingsVault stores it."""
+    return _RECORD.pack(
+        state.goal_owner,
+        state.target_amount,
+        state.total_saved,
+        state.deadline,
+        _TRUE if state.goal_completed else 0,
+    )
+
+
+def decode_goal_record(app_id: int, record: bytes, round: int = 0) -> VaultState:
+    """Decodes the packed goal record of a PackedSavingsVault application."""
+    if len(record) != RECORD_SIZE:
+        raise ValueError(f"Goal record must be {RECORD_SIZE} bytes, got {len(record)}")
+    goal_owner, target_amount, total_saved, deadline, completed = _RECORD.unpack(record)
+    return VaultState(
+        app_id=app_id,
+        goal_owner=goal_owner,
+        target_amount=target_amount,
+        total_saved=total_saved,
+        deadline=deadline,
+        goal_completed=completed & _TRUE != 0,
+        round=round,
+    )
+
+
+def decode_global_state(
+    app_id: int, global_state: Iterable[Mapping[str, Any]], round: int = 0
+) -> VaultState:
+    """Decodes the `global-state` array algod returns for a PackedSavingsVault application."""
+    encoded_key = base64.b64encode(GOAL_KEY).decode()
+    for entry in global_state:
+        if entry["key"] == encoded_key:
+            return decode_goal_record(app_id, base64.b64decode(entry["value"]["bytes"]), round)
+    raise ValueError(f"App {app_id} has no packed goal record")
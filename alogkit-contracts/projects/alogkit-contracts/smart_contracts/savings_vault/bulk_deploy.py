@@ -0,0 +1,402 @@
+"""
+Bulk deployment of SavingsVault applications.
+
+Where deploy_config.deploy() creates one demo vault and funds it in a separate
+round-trip, this pipeline pre-provisions vaults for a whole cohort:
+
+    • the programs are the build's assembled bytes (see program_cache), so no
+      TEAL is sent to algod's compile endpoint;
+    • suggested params are fetched once per round, not once per transaction;
+    • app-creates are packed into atomic groups of up to 16, and the funding
+      payments for confirmed vaults into groups of their own (an app's address
+      is only known once its create has been confirmed);
+    • groups are submitted pipelined with a bounded number in flight, and their
+      confirmations are awaited concurrently;
+    • every confirmed create/funding is appended to a JSON-lines manifest, so an
+      interrupted run picks up where it stopped;
+    • with --registry, vaults are registered with that VaultRegistry in their
+      funding group (a fund and a register call per vault), so a vault is listed
+      by deadline as soon as it is funded. The registry account must hold
+      ENTRY_MBR per new entry, and --registry must be the same on every resumed run.
+
+Usage (from the project root):
+    poetry run python -m smart_contracts.savings_vault.bulk_deploy cohort.csv \
+        --manifest cohort.manifest.jsonl [--max-in-flight 8]
+
+The records file is a CSV with `owner,target,deadline` columns (or a JSON list of
+objects with those keys); target is in microALGOs, deadline a Unix timestamp.
+"""
+
+import argparse
+import csv
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from algosdk import abi, transaction
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers import failure_traces, runtime
+from smart_contracts._helpers.contract_metrics import extra_pages
+from smart_contracts._helpers.network import MAX_GROUP_SIZE, SuggestedParamsCache, chunked
+from smart_contracts._helpers.program_cache import load_cached_programs
+from smart_contracts.vault_registry.query import REGISTER, entry_name
+
+logger = logging.getLogger(__name__)
+
+CREATE_GOAL = abi.Method.from_signature("create_goal(address,uint64,uint64)void")
+_ADDRESS = abi.AddressType()
+_UINT64 = abi.UintType(64)
+
+# Minimum balance of the vault's app account (0.1 ALGO), as in deploy_config.deploy().
+DEFAULT_FUNDING = 100_000
+
+ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / "artifacts" / "savings_vault"
+CONTRACT_PATH = Path(__file__).resolve().parent / "contract.py"
+
+
+@dataclasses.dataclass(frozen=True)
+class VaultSpec:
+    owner: str
+    target: int
+    deadline: int
+
+
+@dataclasses.dataclass(frozen=True)
+class VaultPrograms:
+    approval: bytes
+    clear: bytes
+    global_ints: int
+    global_bytes: int
+    extra_pages: int = 0
+
+
+@dataclasses.dataclass
+class BulkDeployReport:
+    requested: int
+    created: int = 0
+    funded: int = 0
+    failed_groups: int = 0
+    params_fetches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def vaults_per_second(self) -> float:
+        return self.created / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.created}/{self.requested} vaults created, {self.funded} funded, "
+            f"{self.failed_groups} failed group(s), {self.params_fetches} params fetch(es) "
+            f"in {self.elapsed:.2f}s ({self.vaults_per_second:.1f} vaults/s)"
+        )
+
+
+def load_specs(path: Path) -> list[VaultSpec]:
+    """Reads vault records from a CSV (owner,target,deadline) or JSON file."""
+    if path.suffix == ".json":
+        rows: Iterable[dict[str, Any]] = json.loads(path.read_text())
+    else:
+        rows = list(csv.DictReader(path.read_text().splitlines()))
+    return [VaultSpec(row["owner"], int(row["target"]), int(row["deadline"])) for row in rows]
+
+
+def load_programs(artifact_dir: Path = ARTIFACTS_DIR) -> VaultPrograms:
+    """
+    Loads the SavingsVault programs assembled by the build, without asking algod to
+    compile; raises StaleProgramsError if they were not built from the current sources.
+    """
+    app_spec = json.loads((artifact_dir / "SavingsVault.arc56.json").read_text())
+    global_schema = app_spec["state"]["schema"]["global"]
+    programs = load_cached_programs(artifact_dir, "SavingsVault", CONTRACT_PATH)
+
+    return VaultPrograms(
+        approval=programs.approval,
+        clear=programs.clear,
+        global_ints=global_schema["ints"],
+        global_bytes=global_schema["bytes"],
+        extra_pages=extra_pages(len(programs.approval), len(programs.clear)),
+    )
+
+
+class Manifest:
+    """
+    Append-only JSON-lines record of the pipeline's progress. Each line is either
+    {"index", "owner", "target", "deadline", "app_id", "confirmed_round"} for a confirmed
+    create or {"index", "funded": true} for a confirmed funding payment.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[int, dict[str, Any]]:
+        entries: dict[int, dict[str, Any]] = {}
+        if not self.path.exists():
+            return entries
+        for line in self.path.read_text().splitlines():
+            if line.strip():
+                record = json.loads(line)
+                entries.setdefault(record["index"], {}).update(record)
+        return entries
+
+    def append(self, records: Sequence[dict[str, Any]]) -> None:
+        with self._lock, self.path.open("a") as manifest:
+            for record in records:
+                manifest.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+class BulkDeployer:
+    """Creates and funds many vaults with pipelined atomic groups."""
+
+    def __init__(
+        self,
+        algod: Any,
+        sender: str,
+        private_key: str,
+        programs: VaultPrograms,
+        manifest: Manifest,
+        max_in_flight: int = 8,
+        group_size: int = MAX_GROUP_SIZE,
+        funding: int = DEFAULT_FUNDING,
+        wait_rounds: int = 10,
+        registry_app_id: int = 0,
+    ) -> None:
+        self.algod = algod
+        self.sender = sender
+        self.private_key = private_key
+        self.programs = programs
+        self.manifest = manifest
+        self.max_in_flight = max_in_flight
+        self.group_size = min(group_size, MAX_GROUP_SIZE)
+        self.funding = funding
+        self.wait_rounds = wait_rounds
+        self.registry_app_id = registry_app_id
+        # Vaults per funding group: each is registered in the same group when listed.
+        self.fund_group_size = self.group_size // 2 if registry_app_id else self.group_size
+        if not self.fund_group_size:
+            raise ValueError("group_size must be at least 2 to register vaults")
+        self.params = SuggestedParamsCache(algod)
+
+    # ── Transactions ───────────────────────────────────────────────────────────
+
+    def _create_txn(self, index: int, spec: VaultSpec, params: Any) -> transaction.Transaction:
+        app_args = [
+            CREATE_GOAL.get_selector(),
+            _ADDRESS.encode(spec.owner),
+            _UINT64.encode(spec.target),
+            _UINT64.encode(spec.deadline),
+        ]
+        return transaction.ApplicationCreateTxn(
+            sender=self.sender,
+            sp=params,
+            on_complete=transaction.OnComplete.NoOpOC,
+            approval_program=self.programs.approval,
+            clear_program=self.programs.clear,
+            global_schema=transaction.StateSchema(
+                num_uints=self.programs.global_ints,
+                num_byte_slices=self.programs.global_bytes,
+            ),
+            local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+            app_args=app_args,
+            extra_pages=self.programs.extra_pages,
+            # Identical records would otherwise be identical (duplicate) transactions.
+            note=f"bulk_deploy:{index}".encode(),
+        )
+
+    def _funding_txn(self, app_id: int, params: Any) -> transaction.Transaction:
+        return transaction.PaymentTxn(
+            sender=self.sender,
+            sp=params,
+            receiver=get_application_address(app_id),
+            amt=self.funding,
+        )
+
+    def _register_txn(self, app_id: int, deadline: int, params: Any) -> transaction.Transaction:
+        return transaction.ApplicationCallTxn(
+            sender=self.sender,
+            sp=params,
+            index=self.registry_app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            # The vault's app ID, by value; it is also a foreign app so it can be read.
+            app_args=[REGISTER.get_selector(), _UINT64.encode(app_id)],
+            foreign_apps=[app_id],
+            boxes=[(0, entry_name(deadline, app_id))],
+        )
+
+    def _funding_txns(
+        self, batch: list[tuple[int, int]], specs: Sequence[VaultSpec], params: Any
+    ) -> list[transaction.Transaction]:
+        txns = []
+        for index, app_id in batch:
+            txns.append(self._funding_txn(app_id, params))
+            if self.registry_app_id:
+                txns.append(self._register_txn(app_id, specs[index].deadline, params))
+        return txns
+
+    def _sign_group(self, txns: list[transaction.Transaction]) -> list[Any]:
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        return [txn.sign(self.private_key) for txn in txns]
+
+    def _send_and_confirm(self, signed: list[Any]) -> list[dict[str, Any]]:
+        """Submits a group and waits for it; runs on a pipeline worker thread."""
+        try:
+            self.algod.send_transactions(signed)
+        except Exception:
+            failure_traces.record(self.algod, signed)
+            raise
+        transaction.wait_for_confirmation(self.algod, signed[-1].get_txid(), self.wait_rounds)
+        return [self.algod.pending_transaction_info(stxn.get_txid()) for stxn in signed]
+
+    # ── Pipeline ───────────────────────────────────────────────────────────────
+
+    def run(self, specs: Sequence[VaultSpec]) -> BulkDeployReport:
+        report = BulkDeployReport(requested=len(specs))
+        started = time.perf_counter()
+        progress = self.manifest.load()
+        report.created = sum(1 for entry in progress.values() if "app_id" in entry)
+        report.funded = sum(1 for entry in progress.values() if entry.get("funded"))
+
+        to_create = [
+            index for index in range(len(specs)) if "app_id" not in progress.get(index, {})
+        ]
+        # Vaults created by an earlier run but never funded.
+        to_fund: list[tuple[int, int]] = [
+            (index, entry["app_id"])
+            for index, entry in sorted(progress.items())
+            if "app_id" in entry and not entry.get("funded")
+        ]
+        if to_create or to_fund:
+            logger.info(
+                f"Bulk deploy: {len(to_create)} vault(s) to create, {len(to_fund)} to fund "
+                f"({report.created} already created)"
+            )
+
+        create_groups = chunked(to_create, self.group_size)
+        creates_exhausted = False
+        in_flight: dict[Future[list[dict[str, Any]]], tuple[str, list[Any]]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+
+            def submit(kind: str, items: list[Any], txns: list[transaction.Transaction]) -> None:
+                future = executor.submit(self._send_and_confirm, self._sign_group(txns))
+                in_flight[future] = (kind, items)
+
+            def fill_pipeline() -> None:
+                nonlocal creates_exhausted
+                while len(in_flight) < self.max_in_flight:
+                    creates_pending = not creates_exhausted or any(
+                        kind == "create" for kind, _ in in_flight.values()
+                    )
+                    # Funding goes out in full groups while creates can still top them
+                    # up, and as a final partial group once they can't.
+                    if len(to_fund) >= self.fund_group_size or (to_fund and not creates_pending):
+                        batch = to_fund[: self.fund_group_size]
+                        del to_fund[: self.fund_group_size]
+                        txns = self._funding_txns(batch, specs, self.params.get())
+                        submit("fund", batch, txns)
+                        continue
+                    group = None if creates_exhausted else next(create_groups, None)
+                    if group is None:
+                        if creates_exhausted:
+                            return
+                        # Re-check: the last funding group may be able to go out now.
+                        creates_exhausted = True
+                        continue
+                    params = self.params.get()
+                    txns = [self._create_txn(i, specs[i], params) for i in group]
+                    submit("create", group, txns)
+
+            fill_pipeline()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, items = in_flight.pop(future)
+                    try:
+                        confirmations = future.result()
+                    except Exception as exc:
+                        report.failed_groups += 1
+                        logger.error(f"Bulk deploy {kind} group for {items} failed: {exc}")
+                        continue
+                    if kind == "create":
+                        records = [
+                            {
+                                "index": index,
+                                "owner": specs[index].owner,
+                                "target": specs[index].target,
+                                "deadline": specs[index].deadline,
+                                "app_id": info["application-index"],
+                                "confirmed_round": info["confirmed-round"],
+                            }
+                            for index, info in zip(items, confirmations)
+                        ]
+                        self.manifest.append(records)
+                        to_fund.extend((record["index"], record["app_id"]) for record in records)
+                        report.created += len(records)
+                    else:
+                        funded = [{"index": index, "funded": True} for index, _ in items]
+                        self.manifest.append(funded)
+                        report.funded += len(items)
+                fill_pipeline()
+
+        report.params_fetches = self.params.fetches
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+def main() -> None:
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Bulk-deploy SavingsVault applications.")
+    parser.add_argument("records", type=Path, help="CSV or JSON file of owner,target,deadline")
+    parser.add_argument("--manifest", type=Path, default=None)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--group-size", type=int, default=MAX_GROUP_SIZE)
+    parser.add_argument(
+        "--funding", type=int, default=DEFAULT_FUNDING, help="microALGOs per vault"
+    )
+    parser.add_argument(
+        "--registry", type=int, default=0, help="VaultRegistry app ID to list the vaults in"
+    )
+    args = parser.parse_args()
+
+    # Under a runtime profile (RUNTIME_PROFILE=prod), failed groups are traced as sampled.
+    if runtime.ENV_VAR in os.environ:
+        runtime.apply(runtime.get_profile(), Path.cwd())
+    else:
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+        )
+    load_dotenv()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+    algod = algorand.client.algod
+
+    specs = load_specs(args.records)
+    manifest = Manifest(args.manifest or args.records.with_suffix(".manifest.jsonl"))
+    report = BulkDeployer(
+        algod,
+        deployer.address,
+        deployer.private_key,
+        load_programs(),
+        manifest,
+        max_in_flight=args.max_in_flight,
+        group_size=args.group_size,
+        funding=args.funding,
+        registry_app_id=args.registry,
+    ).run(specs)
+    logger.info(f"Bulk deploy finished: {report}")
+    logger.info(f"Manifest: {manifest.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+High-throughput SavingsVault calls for service-side use.
+
+The generated typed client sends one call at a time: it fetches suggested params,
+composes the payment + app-call group and blocks until the group is confirmed.
+VaultClientPool is meant for services pushing deposit/withdraw traffic for many
+vaults at once:
+
+    • suggested params are fetched once per round (network.SuggestedParamsCache);
+    • requests reuse keep-alive connections when algod is a PooledAlgodClient;
+    • calls handed over together are composed and signed in one batch;
+    • groups are submitted from a worker pool, with at most `max_in_flight` groups
+      between submission and confirmation (further calls wait for a slot);
+    • confirmations are awaited by a single background thread that sweeps all
+      pending groups once per round and resolves each call's Future; a failed
+      lookup leaves the call pending until its last valid round has passed (if
+      algod stays unreachable, the pending calls fail instead of waiting forever);
+    • per-call latency and throughput counters are kept in `stats`.
+
+Usage:
+    with VaultClientPool(algod) as pool:
+        futures = pool.submit_many(VaultCall.deposit(app_id, owner, key, amount) for ...)
+        results = [future.result() for future in futures]
+"""
+
+import copy
+import dataclasses
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from algosdk import abi, transaction
+from algosdk.error import ConfirmationTimeoutError, TransactionRejectedError
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers import failure_traces
+from smart_contracts._helpers.network import SuggestedParamsCache, chunked
+from smart_contracts.savings_vault.history import HISTORY_BOX
+from smart_contracts.vault_registry.query import deregister_txn
+
+logger = logging.getLogger(__name__)
+
+DEPOSIT = abi.Method.from_signature("deposit(pay)void")
+WITHDRAW = abi.Method.from_signature("withdraw()void")
+
+# Every call references the deposit history box, which vaults with history enabled
+# need and the others ignore.
+_HISTORY_BOXES = [(0, HISTORY_BOX)]
+
+# The confirmer retries a failing algod status request with exponential backoff,
+# and after this many failures in a row fails every pending call with the error.
+STATUS_RETRIES = 5
+STATUS_BACKOFF = 0.5
+
+
+def _unique_note() -> bytes:
+    # Identical calls within one params window would otherwise share a txid and be
+    # rejected by algod as duplicates.
+    return os.urandom(8)
+
+
+@dataclasses.dataclass(frozen=True)
+class VaultCall:
+    method: str  # "deposit" or "withdraw"
+    app_id: int
+    sender: str
+    private_key: str
+    amount: int = 0
+    # For a withdraw from a vault listed in a VaultRegistry: the vault's deadline
+    # names its entry, which is removed in the same group.
+    registry: int = 0
+    deadline: int = 0
+
+    @classmethod
+    def deposit(cls, app_id: int, sender: str, private_key: str, amount: int) -> "VaultCall":
+        return cls("deposit", app_id, sender, private_key, amount)
+
+    @classmethod
+    def withdraw(
+        cls, app_id: int, sender: str, private_key: str, registry: int = 0, deadline: int = 0
+    ) -> "VaultCall":
+        return cls("withdraw", app_id, sender, private_key, registry=registry, deadline=deadline)
+
+
+@dataclasses.dataclass
+class CallStats:
+    """
+    Counters for calls made through a pool; latencies are submit-to-confirmed and
+    fees (microALGOs) are those of confirmed groups, as rejected groups pay none.
+    """
+
+    submitted: int = 0
+    confirmed: int = 0
+    failed: int = 0
+    fees: int = 0
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    first_submit: float | None = None
+    last_confirm: float | None = None
+
+    def percentile(self, percent: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    @property
+    def throughput(self) -> float:
+        """Confirmed calls per second since the first submission."""
+        if self.first_submit is None or self.last_confirm is None:
+            return 0.0
+        elapsed = self.last_confirm - self.first_submit
+        return self.confirmed / elapsed if elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.confirmed}/{self.submitted} confirmed, {self.failed} failed, "
+            f"{self.throughput:.0f} calls/s, latency p50 {self.percentile(50) * 1000:.1f} ms "
+            f"p99 {self.percentile(99) * 1000:.1f} ms"
+        )
+
+
+@dataclasses.dataclass
+class _Pending:
+    future: Future[dict[str, Any]]
+    txid: str
+    last_valid: int
+    started: float
+    fee: int
+
+
+class VaultClientPool:
+    """Pipelines deposit/withdraw groups to many vaults; see the module docstring."""
+
+    def __init__(
+        self,
+        algod: Any,
+        max_in_flight: int = 256,
+        submit_workers: int = 8,
+        sign_batch: int = 64,
+    ) -> None:
+        self.algod = algod
+        self.params = SuggestedParamsCache(algod)
+        self.sign_batch = sign_batch
+        self.stats = CallStats()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._submitter = ThreadPoolExecutor(submit_workers, thread_name_prefix="vault-submit")
+        self._checker = ThreadPoolExecutor(submit_workers, thread_name_prefix="vault-confirm")
+        self._pending: dict[str, _Pending] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._closed = False
+        self._confirmer = threading.Thread(
+            target=self._confirm_loop, name="vault-confirmer", daemon=True
+        )
+        self._confirmer.start()
+
+    def __enter__(self) -> "VaultClientPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ── Calls ──────────────────────────────────────────────────────────────────
+
+    def deposit(
+        self, app_id: int, sender: str, private_key: str, amount: int
+    ) -> Future[dict[str, Any]]:
+        return self.submit_many([VaultCall.deposit(app_id, sender, private_key, amount)])[0]
+
+    def withdraw(
+        self, app_id: int, sender: str, private_key: str, registry: int = 0, deadline: int = 0
+    ) -> Future[dict[str, Any]]:
+        call = VaultCall.withdraw(app_id, sender, private_key, registry, deadline)
+        return self.submit_many([call])[0]
+
+    def submit_many(self, calls: Iterable[VaultCall]) -> list[Future[dict[str, Any]]]:
+        """
+        Submits calls in signing batches. Each Future resolves to the app call's
+        pending transaction info (with its logs) once confirmed.
+        """
+        futures: list[Future[dict[str, Any]]] = []
+        for batch in chunked(calls, self.sign_batch):
+            params = self.params.get()
+            signed_groups = [self._sign(self._compose(call, params), call) for call in batch]
+            for signed in signed_groups:
+                futures.append(self._dispatch(signed))
+        return futures
+
+    def _compose(self, call: VaultCall, params: Any) -> list[transaction.Transaction]:
+        if call.method == "deposit":
+            payment = transaction.PaymentTxn(
+                sender=call.sender,
+                sp=params,
+                receiver=get_application_address(call.app_id),
+                amt=call.amount,
+            )
+            app_call = transaction.ApplicationCallTxn(
+                sender=call.sender,
+                sp=params,
+                index=call.app_id,
+                on_complete=transaction.OnComplete.NoOpOC,
+                app_args=[DEPOSIT.get_selector()],
+                boxes=_HISTORY_BOXES,
+                note=_unique_note(),
+            )
+            return transaction.assign_group_id([payment, app_call])
+        if call.method == "withdraw":
+            # The call covers the fee of the inner payment closing the vault.
+            fee_params = copy.copy(params)
+            fee_params.flat_fee = True
+            fee_params.fee = 2 * max(params.min_fee or 0, params.fee or 0)
+            withdraw = transaction.ApplicationCallTxn(
+                sender=call.sender,
+                sp=fee_params,
+                index=call.app_id,
+                on_complete=transaction.OnComplete.NoOpOC,
+                app_args=[WITHDRAW.get_selector()],
+                boxes=_HISTORY_BOXES,
+                note=_unique_note(),
+            )
+            if not call.registry:
+                return [withdraw]
+            # Remove the vault's registry entry once the withdraw has closed it.
+            deregister = deregister_txn(
+                call.sender, params, call.registry, call.app_id, call.deadline
+            )
+            return transaction.assign_group_id([withdraw, deregister])
+        raise ValueError(f"Unknown vault method {call.method!r}")
+
+    @staticmethod
+    def _sign(txns: list[transaction.Transaction], call: VaultCall) -> list[Any]:
+        return [txn.sign(call.private_key) for txn in txns]
+
+    # ── Pipeline ───────────────────────────────────────────────────────────────
+
+    def _dispatch(self, signed: list[Any]) -> Future[dict[str, Any]]:
+        if self._closed:
+            raise RuntimeError("VaultClientPool is closed")
+        self._slots.acquire()
+        future: Future[dict[str, Any]] = Future()
+        started = time.perf_counter()
+        with self._lock:
+            self.stats.submitted += 1
+            if self.stats.first_submit is None:
+                self.stats.first_submit = started
+        self._submitter.submit(self._send, signed, future, started)
+        return future
+
+    def _send(self, signed: list[Any], future: Future[dict[str, Any]], started: float) -> None:
+        try:
+            self.algod.send_transactions(signed)
+        except Exception as exc:
+            failure_traces.record(self.algod, signed)
+            self._resolve(future, started, error=exc)
+            return
+        # Track the vault's own app call: a withdraw's deregister call comes after it.
+        call = next(
+            stxn for stxn in signed if isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+        )
+        with self._wake:
+            self._pending[call.get_txid()] = _Pending(
+                future,
+                call.get_txid(),
+                call.transaction.last_valid_round,
+                started,
+                sum(stxn.transaction.fee for stxn in signed),
+            )
+            self._wake.notify()
+
+    def _resolve(
+        self,
+        future: Future[dict[str, Any]],
+        started: float,
+        result: dict[str, Any] | None = None,
+        error: Exception | None = None,
+        fee: int = 0,
+    ) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            if error is None:
+                self.stats.confirmed += 1
+                self.stats.fees += fee
+                self.stats.latencies.append(now - started)
+                self.stats.last_confirm = now
+            else:
+                self.stats.failed += 1
+        self._slots.release()
+        if error is None:
+            future.set_result(result or {})
+        else:
+            future.set_exception(error)
+
+    def _check(self, pending: _Pending) -> tuple[_Pending, Any]:
+        try:
+            return pending, self.algod.pending_transaction_info(pending.txid)
+        except Exception as exc:
+            return pending, exc
+
+    def _confirm_loop(self) -> None:
+        last_round = 0
+        while True:
+            with self._wake:
+                while not self._pending and not self._closed:
+                    self._wake.wait()
+                if not self._pending:
+                    return
+                sweep = list(self._pending.values())
+            for pending, info in self._checker.map(self._check, sweep):
+                # A failed request says nothing about the transaction, which may still
+                # confirm: it is checked again next sweep, until it can no longer.
+                unknown = isinstance(info, Exception)
+                if not unknown and info.get("confirmed-round"):
+                    error: Exception | None = None
+                elif not unknown and info.get("pool-error"):
+                    error = TransactionRejectedError(info["pool-error"])
+                elif last_round > pending.last_valid:
+                    error = ConfirmationTimeoutError(
+                        f"{pending.txid} expired at round {pending.last_valid}"
+                        + (f", last check failed: {info}" if unknown else "")
+                    )
+                else:
+                    continue
+                with self._lock:
+                    self._pending.pop(pending.txid, None)
+                if error is None:
+                    self._resolve(pending.future, pending.started, result=info, fee=pending.fee)
+                else:
+                    self._resolve(pending.future, pending.started, error=error)
+            # Nothing can change before the next round, and expiry is judged against it.
+            last_round = self._next_round(last_round)
+
+    def _next_round(self, last_round: int) -> int:
+        """
+        Waits for the round after `last_round`. Transient algod errors are retried;
+        if they persist, every pending call is failed so callers and close() never
+        wait on a confirmer that cannot make progress.
+        """
+        failure: Exception | None = None
+        for attempt in range(STATUS_RETRIES):
+            try:
+                if not last_round:
+                    last_round = self.algod.status()["last-round"]
+                return self.algod.status_after_block(last_round)["last-round"]
+            except Exception as exc:
+                failure = exc
+                logger.warning(f"algod status failed ({attempt + 1}/{STATUS_RETRIES}): {exc}")
+                time.sleep(STATUS_BACKOFF * 2**attempt)
+        with self._lock:
+            failed = list(self._pending.values())
+            self._pending.clear()
+        logger.error(f"Failing {len(failed)} pending call(s), algod is unavailable: {failure}")
+        for pending in failed:
+            self._resolve(pending.future, pending.started, error=failure)
+        return last_round
+
+    def close(self) -> None:
+        """Waits for every submitted call to be confirmed or fail, then stops the workers."""
+        self._submitter.shutdown(wait=True)
+        with self._wake:
+            self._closed = True
+            self._wake.notify()
+        self._confirmer.join()
+        self._checker.shutdown(wait=True)
@@ -11,15 +11,98 @@ Global State:
     total_saved    (uint64)  — running total of deposits in microALGOs
     deadline       (uint64)  — Unix timestamp after which withdrawal is always allowed
     goal_completed (uint64)  — 0 = active, 1 = goal reached
+    history_capacity (uint64) — deposit history entries kept, 0 = history disabled
+
+Box storage (only once the owner opts in with enable_history):
+    "h"  →  deposit count (uint64) ‖ history_capacity × (timestamp uint64 ‖ amount uint64)
+        A ring buffer of the most recent deposits: deposit number n is written to
+        slot n % history_capacity. At most 63 entries, so the box fits in the
+        1 KiB I/O budget of a single box reference.
 
 On-chain commitment logic:
     • Deposits are accepted only before the deadline and until the goal is met.
+    • Several payments can be folded into one app call with deposit_batch.
     • Withdrawal is gated: funds are only released when the goal is completed
       OR the deadline has passed.
+    • Once released funds may be paid out by anyone (release), but only ever
+      to goal_owner, so expired vaults can be settled in bulk.
     • No admin override — the contract owner (creator) cannot bypass these rules.
+    • The history box minimum balance is paid by the owner and refunded with the
+      savings, as the box is deleted when the vault is paid out.
+    • The vault keeps no trace of a VaultRegistry (see vault_registry/contract.py)
+      listing it: once it is paid out, anyone can remove its entry with
+      VaultRegistry.deregister(vault), e.g. in the same group as the payout.
+
+ARC-28 events (so indexers can follow vaults from blocks instead of polling state):
+    Deposited(owner, amount, total_saved, completed)      — every deposit / batch
+    GoalCompleted(owner, amount, total_saved, completed)  — the deposit reaching the target
+    Withdrawn(owner, amount, total_saved, completed)      — withdraw or release; amount = balance paid out
 """
 
-from algopy import ARC4Contract, Asset, Global, GlobalState, Txn, UInt64, arc4, gtxn, itxn
+from algopy import (
+    ARC4Contract,
+    Asset,
+    BoxRef,
+    Global,
+    GlobalState,
+    TransactionType,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
+)
+
+# Deposit history ring buffer: a uint64 deposit count, then (timestamp, amount) entries.
+HISTORY_HEADER_SIZE = 8
+HISTORY_ENTRY_SIZE = 16
+HISTORY_MAX_CAPACITY = 63
+
+# Box MBR: 2500 + 400 × (name bytes + value bytes), per history entry and for the rest.
+HISTORY_BOX_BASE_MBR = 2_500 + 400 * (1 + HISTORY_HEADER_SIZE)
+HISTORY_ENTRY_MBR = 400 * HISTORY_ENTRY_SIZE
+
+
+# ── Events ─────────────────────────────────────────────────────────────────────
+
+
+class Deposited(arc4.Struct):
+    owner: arc4.Address
+    amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    completed: arc4.Bool
+
+
+class GoalCompleted(arc4.Struct):
+    owner: arc4.Address
+    amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    completed: arc4.Bool
+
+
+class Withdrawn(arc4.Struct):
+    owner: arc4.Address
+    amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    completed: arc4.Bool
+
+
+class DepositRecord(arc4.Struct):
+    timestamp: arc4.UInt64
+    amount: arc4.UInt64
+
+
+class VaultSnapshot(arc4.Struct):
+    owner: arc4.Address
+    target_amount: arc4.UInt64
+    total_saved: arc4.UInt64
+    deadline: arc4.UInt64
+    completed: arc4.Bool
+    balance: arc4.UInt64
+    remaining: arc4.UInt64
 
 
 class SavingsVault(ARC4Contract):
@@ -27,11 +110,14 @@ class SavingsVault(ARC4Contract):
 
     # ── Global state ───────────────────────────────────────────────────────────
 
-    goal_owner: GlobalState[arc4.Address]
-    target_amount: GlobalState[UInt64]
-    total_saved: GlobalState[UInt64]
-    deadline: GlobalState[UInt64]
-    goal_completed: GlobalState[UInt64]
+    def __init__(self) -> None:
+        self.goal_owner = GlobalState(arc4.Address)
+        self.target_amount = GlobalState(UInt64)
+        self.total_saved = GlobalState(UInt64)
+        self.deadline = GlobalState(UInt64)
+        self.goal_completed = GlobalState(UInt64)
+        self.history_capacity = GlobalState(UInt64)
+        self.history = BoxRef(key=b"h")
 
     # ── Lifecycle ──────────────────────────────────────────────────────────────
 
@@ -50,14 +136,48 @@ class SavingsVault(ARC4Contract):
             target:      Savings target in microALGOs.
             deadline_ts: Unix timestamp after which funds are always withdrawable.
         """
-        self.goal_owner = GlobalState(owner)
-        self.target_amount = GlobalState(target.native)
-        self.deadline = GlobalState(deadline_ts.native)
-        self.total_saved = GlobalState(UInt64(0))
-        self.goal_completed = GlobalState(UInt64(0))
+        self.goal_owner.value = owner
+        self.target_amount.value = target.native
+        self.deadline.value = deadline_ts.native
+        self.total_saved.value = UInt64(0)
+        self.goal_completed.value = UInt64(0)
+        self.history_capacity.value = UInt64(0)
 
     # ── Core methods ───────────────────────────────────────────────────────────
 
+    @arc4.abimethod
+    def enable_history(
+        self, capacity: arc4.UInt64, mbr_payment: gtxn.PaymentTransaction
+    ) -> None:
+        """
+        Start recording the last `capacity` deposits in the "h" box.
+
+        Must be submitted as a grouped transaction:
+            [0] Payment txn — sender → contract address, covering the box MBR
+                (HISTORY_BOX_BASE_MBR + capacity × HISTORY_ENTRY_MBR)
+            [1] This app call, with a reference to box "h"
+
+        Once enabled, deposit, deposit_batch, withdraw and release calls must
+        reference box "h" too; vaults without history never touch the box, so
+        their calls need no box reference.
+        """
+        assert Txn.sender == self.goal_owner.value.native, "Sender must be goal owner"
+        assert self.history_capacity.value == UInt64(0), "History already enabled"
+        assert Global.latest_timestamp < self.deadline.value, "Cannot enable history after deadline"
+        assert self.goal_completed.value == UInt64(0), "Goal already completed"
+        assert (
+            capacity.native > 0 and capacity.native <= HISTORY_MAX_CAPACITY
+        ), "History capacity must be between 1 and 63"
+        assert mbr_payment.receiver == Global.current_application_address, "Payment must go to contract"
+        assert (
+            mbr_payment.amount >= HISTORY_BOX_BASE_MBR + capacity.native * HISTORY_ENTRY_MBR
+        ), "Payment must cover history storage"
+
+        self.history_capacity.value = capacity.native
+        assert self.history.create(
+            size=HISTORY_HEADER_SIZE + capacity.native * HISTORY_ENTRY_SIZE
+        ), "History already enabled"
+
     @arc4.abimethod
     def deposit(self, payment: gtxn.PaymentTransaction) -> None:
         """
@@ -78,12 +198,39 @@ class SavingsVault(ARC4Contract):
         assert self.goal_completed.value == UInt64(0), "Goal already completed"
         assert payment.receiver == Global.current_application_address, "Payment must go to contract"
 
-        # Update running total.
-        self.total_saved.value = self.total_saved.value + payment.amount
+        self._record_deposit(payment.amount)
 
-        # Check if target has been reached.
-        if self.total_saved.value >= self.target_amount.value:
-            self.goal_completed.value = UInt64(1)
+    @arc4.abimethod
+    def deposit_batch(self) -> None:
+        """
+        Accept every payment to this contract in the surrounding group as one deposit.
+
+        Must be submitted as a grouped transaction:
+            [0..n-1] Payment txns — sender → contract address
+            [n]      This app call
+
+        Totals are folded in with a single state update, so n deposits cost one
+        app call instead of n. Same commitment enforcement as deposit, and this
+        must be the only call to the vault in the group so no payment is counted twice.
+        """
+        assert Txn.sender == self.goal_owner.value.native, "Sender must be goal owner"
+        assert Global.latest_timestamp < self.deadline.value, "Cannot deposit after deadline"
+        assert self.goal_completed.value == UInt64(0), "Goal already completed"
+
+        batch_total = UInt64(0)
+        payment_count = UInt64(0)
+        for i in urange(Global.group_size):
+            txn = gtxn.Transaction(i)
+            if txn.type == TransactionType.Payment:
+                if txn.receiver == Global.current_application_address:
+                    batch_total += txn.amount
+                    payment_count += 1
+            elif txn.type == TransactionType.ApplicationCall and i != Txn.group_index:
+                assert txn.app_id != Global.current_application_id, "Batch must be the only vault call in group"
+        assert payment_count > 0, "No payments to contract in group"
+
+        # Update running total once for the whole batch.
+        self._record_deposit(batch_total)
 
     @arc4.abimethod
     def withdraw(self) -> None:
@@ -101,6 +248,101 @@ class SavingsVault(ARC4Contract):
             or Global.latest_timestamp >= self.deadline.value
         ), "Withdrawal conditions not met: goal incomplete and deadline not reached"
 
+        self._pay_out()
+
+    @arc4.abimethod
+    def release(self) -> None:
+        """
+        Release the entire vault balance to the goal owner; callable by anyone.
+
+        Lets a third party settle vaults whose owner has not withdrawn. The
+        funds can only ever go to goal_owner, so the caller gains nothing but
+        pays the fees: the call must cover the inner payment (fee pooling), and
+        goal_owner must be in the group's accounts.
+
+        Commitment enforcement:
+            • Same conditions as withdraw: goal completed OR deadline passed.
+            • The vault must still hold a balance (not already released).
+        """
+        assert (
+            self.goal_completed.value == UInt64(1)
+            or Global.latest_timestamp >= self.deadline.value
+        ), "Release conditions not met: goal incomplete and deadline not reached"
+        assert Global.current_application_address.balance > 0, "Vault already released"
+
+        self._pay_out()
+
+    @arc4.abimethod(readonly=True)
+    def get_state(self) -> VaultSnapshot:
+        """
+        Return the whole vault state as one ARC-4 tuple, together with the app
+        account balance and the amount still missing to reach the target, so a
+        client (or a simulate request batching many vaults) needs no decoding of
+        the global-state array and no separate balance lookup.
+        """
+        remaining = UInt64(0)
+        if self.total_saved.value < self.target_amount.value:
+            remaining = self.target_amount.value - self.total_saved.value
+        return VaultSnapshot(
+            owner=self.goal_owner.value,
+            target_amount=arc4.UInt64(self.target_amount.value),
+            total_saved=arc4.UInt64(self.total_saved.value),
+            deadline=arc4.UInt64(self.deadline.value),
+            completed=arc4.Bool(self.goal_completed.value == UInt64(1)),
+            balance=arc4.UInt64(Global.current_application_address.balance),
+            remaining=arc4.UInt64(remaining),
+        )
+
+    @arc4.abimethod(readonly=True)
+    def recent_deposits(self, count: arc4.UInt64) -> arc4.DynamicArray[DepositRecord]:
+        """Return up to `count` of the most recent deposits, newest first."""
+        capacity = self.history_capacity.value
+        assert capacity > 0, "History not enabled"
+        recorded = op.btoi(self.history.extract(0, HISTORY_HEADER_SIZE))
+
+        available = recorded if recorded < capacity else capacity
+        n = count.native if count.native < available else available
+        # ABI encoding of a dynamic array of static structs: uint16 length ‖ entries.
+        encoded = op.extract(op.itob(n), 6, 2)
+        for i in urange(n):
+            slot = (recorded - 1 - i) % capacity
+            encoded += self.history.extract(
+                HISTORY_HEADER_SIZE + slot * HISTORY_ENTRY_SIZE, HISTORY_ENTRY_SIZE
+            )
+        return arc4.DynamicArray[DepositRecord].from_bytes(encoded)
+
+    # ── Internal ───────────────────────────────────────────────────────────────
+
+    # Not inlined, so its cost can be told apart from the rest of a deposit
+    # (benchmarks/deposit_history.py).
+    @subroutine(inline=False)
+    def _append_history(self, amount: UInt64) -> None:
+        """Writes a deposit over the oldest entry of the history ring buffer."""
+        recorded = op.btoi(self.history.extract(0, HISTORY_HEADER_SIZE))
+        slot = recorded % self.history_capacity.value
+        self.history.replace(
+            HISTORY_HEADER_SIZE + slot * HISTORY_ENTRY_SIZE,
+            op.itob(Global.latest_timestamp) + op.itob(amount),
+        )
+        self.history.replace(0, op.itob(recorded + 1))
+
+    @subroutine
+    def _pay_out(self) -> None:
+        """Closes the app account out to the goal owner and emits Withdrawn."""
+        # The history box must go first: an account holding boxes cannot be closed.
+        if self.history_capacity.value:
+            assert self.history.delete(), "History box missing"
+            self.history_capacity.value = UInt64(0)
+
+        arc4.emit(
+            Withdrawn(
+                owner=self.goal_owner.value,
+                amount=arc4.UInt64(Global.current_application_address.balance),
+                total_saved=arc4.UInt64(self.total_saved.value),
+                completed=arc4.Bool(self.goal_completed.value == UInt64(1)),
+            )
+        )
+
         # Inner transaction: send entire balance (including MBR) back to owner.
         itxn.Payment(
             receiver=self.goal_owner.value.native,
@@ -108,3 +350,35 @@ class SavingsVault(ARC4Contract):
             close_remainder_to=self.goal_owner.value.native,
             fee=0,
         ).submit()
+
+    @subroutine
+    def _record_deposit(self, amount: UInt64) -> None:
+        """Adds a deposit to the running total, completes the goal and emits events."""
+        # Update running total.
+        self.total_saved.value = self.total_saved.value + amount
+
+        # Check if target has been reached.
+        completed = self.total_saved.value >= self.target_amount.value
+        if completed:
+            self.goal_completed.value = UInt64(1)
+
+        if self.history_capacity.value:
+            self._append_history(amount)
+
+        arc4.emit(
+            Deposited(
+                owner=self.goal_owner.value,
+                amount=arc4.UInt64(amount),
+                total_saved=arc4.UInt64(self.total_saved.value),
+                completed=arc4.Bool(completed),
+            )
+        )
+        if completed:
+            arc4.emit(
+                GoalCompleted(
+                    owner=self.goal_owner.value,
+                    amount=arc4.UInt64(amount),
+                    total_saved=arc4.UInt64(self.total_saved.value),
+                    completed=arc4.Bool(True),
+                )
+            )
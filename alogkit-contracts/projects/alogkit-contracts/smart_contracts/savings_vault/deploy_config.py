@@ -8,9 +8,13 @@ It creates a sample goal so the App ID can be noted for the frontend.
 
 import logging
 import time
+from pathlib import Path
 
 import algokit_utils
 
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import load_contract_programs
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,21 +31,26 @@ def deploy() -> None:
         SavingsVaultFactory, default_sender=deployer.address
     )
 
+    # Deploy the programs assembled by the build, without an algod compile round-trip.
+    with span("load cached programs"):
+        load_contract_programs(Path(__file__).parent, "SavingsVault").install(factory.app_spec)
+
     # Deploy a demo savings vault — goal: 5 ALGO, deadline: 30 days from now.
     target_micro_algos = 5_000_000  # 5 ALGO in microALGOs
     deadline_ts = int(time.time()) + 30 * 24 * 60 * 60  # 30 days from now
 
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        create_args=algokit_utils.DeployCallArgs(
-            args=CreateGoalArgs(
-                owner=deployer.address,
-                target=target_micro_algos,
-                deadline_ts=deadline_ts,
-            )
-        ),
-    )
+    with span("factory.deploy"):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            create_args=algokit_utils.DeployCallArgs(
+                args=CreateGoalArgs(
+                    owner=deployer.address,
+                    target=target_micro_algos,
+                    deadline_ts=deadline_ts,
+                )
+            ),
+        )
 
     logger.info(
         f"SavingsVault deployed — App ID: {app_client.app_id} | "
@@ -53,13 +62,14 @@ def deploy() -> None:
         algokit_utils.OperationPerformed.Create,
         algokit_utils.OperationPerformed.Replace,
     ]:
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=0.1),
-                sender=deployer.address,
-                receiver=app_client.app_address,
+        with span("fund app account"):
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(algo=0.1),
+                    sender=deployer.address,
+                    receiver=app_client.app_address,
+                )
             )
-        )
         logger.info("Funded contract minimum balance (0.1 ALGO).")
 
     logger.info(
@@ -0,0 +1,51 @@
+"""
+ARC-28 events emitted by SavingsVault (see the Events section of contract.py).
+
+An event is logged as the first four bytes of sha512_256("Name(types)") followed by
+the ABI-encoded fields; all three events share the same fields.
+"""
+
+import dataclasses
+
+from algosdk import abi
+from algosdk.encoding import checksum
+
+EVENT_TYPES = "(address,uint64,uint64,bool)"
+EVENT_NAMES = ("Deposited", "GoalCompleted", "Withdrawn")
+
+_FIELDS = abi.TupleType.from_string(EVENT_TYPES)
+
+
+def _selector(name: str) -> bytes:
+    # Unlike a method selector, the signature carries no return type.
+    return checksum(f"{name}{EVENT_TYPES}".encode())[:4]
+
+
+SELECTORS = {_selector(name): name for name in EVENT_NAMES}
+_SELECTOR_BY_NAME = {name: selector for selector, name in SELECTORS.items()}
+
+
+@dataclasses.dataclass(frozen=True)
+class VaultEvent:
+    name: str
+    app_id: int
+    round: int
+    position: int  # index of the emitting transaction within its block
+    owner: str
+    amount: int
+    total_saved: int
+    completed: bool
+
+
+def encode_event(name: str, owner: str, amount: int, total_saved: int, completed: bool) -> bytes:
+    """The log line the contract writes for an event."""
+    return _SELECTOR_BY_NAME[name] + _FIELDS.encode([owner, amount, total_saved, completed])
+
+
+def decode_event(app_id: int, round_: int, position: int, log: bytes) -> VaultEvent | None:
+    """Decodes a log line, or returns None if it is not a SavingsVault event."""
+    name = SELECTORS.get(log[:4])
+    if name is None or len(log) != 4 + _FIELDS.byte_len():
+        return None
+    owner, amount, total_saved, completed = _FIELDS.decode(log[4:])
+    return VaultEvent(name, app_id, round_, position, owner, amount, total_saved, completed)
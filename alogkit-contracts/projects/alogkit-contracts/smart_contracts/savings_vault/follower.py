@@ -0,0 +1,149 @@
+"""
+Block follower for SavingsVault events.
+
+Instead of polling the global state of every vault, follow the chain one block at
+a time and decode the ARC-28 events vaults log on deposit, goal completion and
+withdrawal (see events.py). One sequential block stream replaces N per-app polls.
+
+Progress is kept in a checkpoint file holding the next round to process. It is
+written once all events of a round have been consumed, so after a crash the last
+round is replayed rather than skipped (at-least-once delivery).
+
+Usage (from the project root):
+    poetry run python -m smart_contracts.savings_vault.follower --from-round 1000 \
+        --checkpoint vaults.checkpoint [--app-id 1234 ...] [--follow]
+"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from smart_contracts.savings_vault.events import VaultEvent, decode_event
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """The next round to process, persisted as a small JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> int | None:
+        if not self.path.exists():
+            return None
+        return json.loads(self.path.read_text())["next_round"]
+
+    def save(self, next_round: int) -> None:
+        # Write-then-rename so a crash never leaves a truncated checkpoint.
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary.write_text(json.dumps({"next_round": next_round}))
+        temporary.replace(self.path)
+
+
+def block_events(
+    block: dict[str, Any], app_ids: set[int] | None = None
+) -> Iterator[VaultEvent]:
+    """Decodes the vault events of one block as returned by algod's JSON block API."""
+    round_ = block["rnd"]
+    for position, signed in enumerate(block.get("txns", [])):
+        txn = signed["txn"]
+        if txn.get("type") != "appl":
+            continue
+        # Calls carry the app ID in the transaction, creations in the apply data.
+        app_id = txn.get("apid") or signed.get("apid", 0)
+        if app_ids is not None and app_id not in app_ids:
+            continue
+        for log in signed.get("dt", {}).get("lg", []):
+            event = decode_event(app_id, round_, position, base64.b64decode(log))
+            if event is not None:
+                yield event
+
+
+class BlockFollower:
+    """
+    Streams vault events block by block.
+
+    `algod` is an AlgodClient or anything with the same `status`,
+    `status_after_block` and `block_info` methods (such as the LocalNet stand-in).
+    Pass `app_ids` to only accept events from known vaults; without it, any
+    application logging an event with a matching selector is reported.
+    """
+
+    def __init__(
+        self,
+        algod: Any,
+        app_ids: Iterable[int] | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> None:
+        self.algod = algod
+        self.app_ids = set(app_ids) if app_ids is not None else None
+        self.checkpoint = checkpoint
+        self.blocks_read = 0
+
+    def events(
+        self,
+        from_round: int | None = None,
+        to_round: int | None = None,
+        follow: bool = False,
+    ) -> Iterator[VaultEvent]:
+        """
+        Yields events from the checkpoint (or `from_round`, or the next block) up to
+        `to_round`, or up to the current round unless `follow` keeps waiting for
+        new blocks.
+        """
+        saved = self.checkpoint.load() if self.checkpoint else None
+        last_round = self.algod.status()["last-round"]
+        if saved is not None:
+            round_ = saved
+        elif from_round is not None:
+            round_ = from_round
+        else:
+            round_ = last_round + 1
+        logger.info(f"Following vault events from round {round_}")
+
+        while to_round is None or round_ <= to_round:
+            if round_ > last_round:
+                if not follow:
+                    return
+                last_round = self.algod.status_after_block(last_round)["last-round"]
+                continue
+            block = self.algod.block_info(round_num=round_)["block"]
+            self.blocks_read += 1
+            yield from block_events(block, self.app_ids)
+            round_ += 1
+            if self.checkpoint:
+                self.checkpoint.save(round_)
+
+
+def main() -> None:
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Stream SavingsVault events from blocks.")
+    parser.add_argument("--from-round", type=int, default=None)
+    parser.add_argument("--to-round", type=int, default=None)
+    parser.add_argument("--checkpoint", type=Path, default=None)
+    parser.add_argument("--app-id", type=int, action="append", dest="app_ids")
+    parser.add_argument("--follow", action="store_true", help="keep waiting for new blocks")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    load_dotenv()
+    algod = algokit_utils.AlgorandClient.from_environment().client.algod
+    follower = BlockFollower(
+        algod, args.app_ids, Checkpoint(args.checkpoint) if args.checkpoint else None
+    )
+    for event in follower.events(args.from_round, args.to_round, args.follow):
+        print(json.dumps(dataclasses.asdict(event)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Vectorized goal-completion forecasts over a fleet of SavingsVault snapshots.
+
+Each goal is a row of NumPy columns built from its decoded VaultState
+(target_amount, total_saved, deadline, goal_completed) and, when the owner keeps
+a deposit history, its DepositRecords. The history is reduced to a deposit
+process: deposits arrive as a Poisson process at the rate observed over the
+recorded window, with amounts of the recorded mean and standard deviation.
+Per goal the forecast gives:
+
+    • required_daily_rate: microALGOs per day still needed to reach the target
+      by the deadline (0 once completed, inf once the deadline has passed);
+    • projected_completion: when the target is reached at the observed daily
+      rate (now for completed goals, NaN when there is no history or no
+      deposits in it);
+    • probability: the share of Monte Carlo trials in which the deposits made
+      before the deadline cover the remaining amount. A trial draws the number
+      of deposits N ~ Poisson(rate × time left); their sum is normal,
+      N(N·mean, N·std²), and enters as the probability that it covers the
+      remaining amount. Completed goals are 1, goals past their deadline 0 (the
+      contract accepts no deposits after it), goals without history NaN.
+
+Goals are processed in chunks of `chunk_size` rows, and the Monte Carlo step in
+blocks of at most `max_elements` cells, so memory stays bounded however large the
+fleet; the trial count only sets the multinomial draw's size. forecast_fleet()
+consumes any iterable of VaultStates (e.g. VaultReader.read) and yields one
+Forecast per chunk.
+
+Usage (from the project root):
+    poetry run python -m smart_contracts.savings_vault.forecast \
+        --manifest cohort.manifest.jsonl [--history] [--trials 1000] [--out forecast.csv]
+"""
+
+import argparse
+import csv
+import dataclasses
+import logging
+import math
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from smart_contracts._helpers.network import chunked
+from smart_contracts.savings_vault.history import DepositRecord
+from smart_contracts.savings_vault.state import VaultState
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 3600
+
+# Goals with at least this completion probability count as on track.
+ON_TRACK = 0.5
+
+
+@dataclasses.dataclass
+class GoalColumns:
+    """A chunk of goals (rows) with their deposit process, as NumPy columns."""
+
+    app_id: np.ndarray  # (n,) uint64
+    target: np.ndarray  # (n,) float64 microALGOs
+    saved: np.ndarray  # (n,) float64 microALGOs
+    deadline: np.ndarray  # (n,) float64 Unix seconds
+    completed: np.ndarray  # (n,) bool
+    has_history: np.ndarray  # (n,) bool
+    deposits_per_day: np.ndarray  # (n,) float64
+    amount_mean: np.ndarray  # (n,) float64 microALGOs
+    amount_std: np.ndarray  # (n,) float64 microALGOs
+
+    def __len__(self) -> int:
+        return len(self.app_id)
+
+    @classmethod
+    def from_states(
+        cls,
+        states: Sequence[VaultState],
+        histories: Mapping[int, Sequence[DepositRecord]] | None,
+        now: float,
+    ) -> "GoalColumns":
+        """
+        Columns for `states`. A vault missing from `histories` has no known deposit
+        process; one mapped to an empty history has made no recent deposits.
+        """
+        histories = histories or {}
+        count = len(states)
+        stats = np.zeros((count, 4))  # deposits, oldest timestamp, sum, sum of squares
+        has_history = np.zeros(count, dtype=bool)
+        for row, state in enumerate(states):
+            records = histories.get(state.app_id)
+            if records is None:
+                continue
+            has_history[row] = True
+            if records:
+                amounts = [record.amount for record in records]
+                stats[row] = (
+                    len(records),
+                    min(record.timestamp for record in records),
+                    sum(amounts),
+                    sum(amount * amount for amount in amounts),
+                )
+        deposits, oldest, total, squares = stats.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # The window runs from the oldest recorded deposit to now, at least a day.
+            window_days = np.maximum(now - oldest, DAY) / DAY
+            mean = np.where(deposits > 0, total / deposits, 0.0)
+            variance = np.where(deposits > 0, squares / deposits - mean * mean, 0.0)
+        return cls(
+            app_id=np.fromiter((state.app_id for state in states), np.uint64, count),
+            target=np.fromiter((state.target_amount for state in states), np.float64, count),
+            saved=np.fromiter((state.total_saved for state in states), np.float64, count),
+            deadline=np.fromiter((state.deadline for state in states), np.float64, count),
+            completed=np.fromiter((state.goal_completed for state in states), bool, count),
+            has_history=has_history,
+            deposits_per_day=np.where(deposits > 0, deposits / window_days, 0.0),
+            amount_mean=mean,
+            amount_std=np.sqrt(np.maximum(variance, 0.0)),
+        )
+
+
+@dataclasses.dataclass
+class Forecast:
+    """Forecast of one chunk of goals, row for row with its GoalColumns."""
+
+    app_id: np.ndarray  # (n,) uint64
+    remaining: np.ndarray  # (n,) float64 microALGOs, 0 once completed
+    required_daily_rate: np.ndarray  # (n,) float64 microALGOs/day
+    projected_completion: np.ndarray  # (n,) float64 Unix seconds, NaN if unknown
+    probability: np.ndarray  # (n,) float64 in [0, 1], NaN if unknown
+    deadline: np.ndarray  # (n,) float64 Unix seconds
+
+    def __len__(self) -> int:
+        return len(self.app_id)
+
+
+# Coefficients of the erfc approximation in _normal_cdf (Numerical Recipes' erfcc).
+_ERFC = (
+    -1.26551223, 1.00002368, 0.37409196, 0.09678418, -0.18628806,
+    0.27886807, -1.13520398, 1.48851587, -0.82215223, 0.17087277,
+)  # fmt: skip
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (erfc approximation, relative error below 1.2e-7)."""
+    z = np.abs(x) / math.sqrt(2)
+    t = 1 / (1 + 0.5 * z)
+    poly = np.zeros_like(t)
+    for coefficient in reversed(_ERFC):
+        poly = poly * t + coefficient
+    tail = 0.5 * t * np.exp(-z * z + poly)
+    return np.where(x >= 0, 1 - tail, tail)
+
+
+def _window(expected: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """First deposit count and number of counts covering ±10σ of each Poisson(expected)."""
+    spread = 10 * np.sqrt(expected) + 6
+    first = np.maximum(np.floor(expected - spread), 0).astype(np.int64)
+    # Widths are rounded up to powers of two so rows group into a few blocks.
+    width = 2 ** np.ceil(np.log2(np.ceil(expected + spread) - first + 1)).astype(np.int64)
+    return first, width
+
+
+def _completion_probability(
+    expected: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    remaining: np.ndarray,
+    trials: int,
+    rng: np.random.Generator,
+    max_elements: int,
+) -> np.ndarray:
+    """
+    Monte Carlo completion probability for deposit counts ~ Poisson(expected).
+    The trials' deposit counts are drawn in one multinomial draw over each row's
+    window of likely counts, and each trial then contributes P(sum of N deposits
+    >= remaining) rather than a draw of it (conditional Monte Carlo), so the cost
+    is per row and count, not per trial. Rows are processed in blocks of at most
+    `max_elements` (row, count) cells.
+    """
+    probability = np.empty(len(expected))
+    first, width = _window(expected)
+    for block_width in np.unique(width).tolist():
+        rows = np.flatnonzero(width == block_width)
+        step = max(1, max_elements // block_width)
+        for start in range(0, len(rows), step):
+            block = rows[start : start + step]
+            lam = expected[block][:, None]
+            counts = first[block][:, None] + np.arange(block_width)
+            log_factorial = np.concatenate(
+                ([0.0], np.cumsum(np.log(np.arange(1, counts.max() + 1))))
+            )
+            pmf = np.exp(counts * np.log(lam) - lam - log_factorial[counts])
+            pmf /= pmf.sum(axis=1, keepdims=True)  # tails beyond ±10σ are negligible
+            drawn = rng.multinomial(trials, pmf)
+
+            needed = remaining[block][:, None]
+            saved = counts * mean[block][:, None]
+            spread = np.sqrt(counts) * std[block][:, None]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                covered = np.where(
+                    spread > 0, _normal_cdf((saved - needed) / spread), saved >= needed
+                )
+            probability[block] = (drawn * covered).sum(axis=1) / trials
+    return probability
+
+
+def forecast(
+    columns: GoalColumns,
+    now: float,
+    trials: int = 1000,
+    rng: np.random.Generator | None = None,
+    max_elements: int = 1 << 20,
+) -> Forecast:
+    """Forecasts one chunk of goals as of `now`."""
+    rng = rng or np.random.default_rng()
+    remaining = np.where(columns.completed, 0.0, np.maximum(columns.target - columns.saved, 0.0))
+    seconds_left = np.maximum(columns.deadline - now, 0.0)
+    open_ = ~columns.completed & (seconds_left > 0) & (remaining > 0)
+    daily_rate = columns.deposits_per_day * columns.amount_mean
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required = np.where(open_, remaining * DAY / seconds_left, 0.0)
+        projected = np.where(daily_rate > 0, now + remaining / daily_rate * DAY, np.nan)
+    required[~columns.completed & (remaining > 0) & (seconds_left == 0)] = np.inf
+    projected[columns.completed | (remaining == 0)] = now
+
+    probability = np.where(columns.completed | (remaining == 0), 1.0, 0.0)
+    probability[open_ & ~columns.has_history] = np.nan
+    rows = np.flatnonzero(open_ & (daily_rate > 0))
+    if len(rows):
+        probability[rows] = _completion_probability(
+            columns.deposits_per_day[rows] * seconds_left[rows] / DAY,
+            columns.amount_mean[rows],
+            columns.amount_std[rows],
+            remaining[rows],
+            trials,
+            rng,
+            max_elements,
+        )
+    return Forecast(
+        columns.app_id, remaining, required, projected, probability, columns.deadline
+    )
+
+
+def forecast_fleet(
+    states: Iterable[VaultState],
+    histories: Mapping[int, Sequence[DepositRecord]] | None = None,
+    now: float | None = None,
+    chunk_size: int = 16_384,
+    trials: int = 1000,
+    seed: int | None = None,
+) -> Iterator[Forecast]:
+    """Streams the forecast of every goal in `states`, one chunk at a time."""
+    now = time.time() if now is None else now
+    rng = np.random.default_rng(seed)
+    for chunk in chunked(states, chunk_size):
+        yield forecast(GoalColumns.from_states(chunk, histories, now), now, trials, rng)
+
+
+@dataclasses.dataclass
+class FleetSummary:
+    """Fleet-wide counts for the risk view, accumulated chunk by chunk."""
+
+    goals: int = 0
+    completed: int = 0
+    on_track: int = 0
+    at_risk: int = 0
+    missed: int = 0  # deadline passed before the target was reached
+    unknown: int = 0  # open goals without deposit history
+    expected_completions: float = 0.0
+
+    def add(self, forecast: Forecast, now: float) -> None:
+        probability = forecast.probability
+        known = ~np.isnan(probability)
+        completed = forecast.remaining == 0
+        open_ = ~completed & (forecast.deadline > now)
+        self.goals += len(forecast)
+        self.completed += int(np.count_nonzero(completed))
+        self.missed += int(np.count_nonzero(~completed & ~open_))
+        self.unknown += int(np.count_nonzero(~known))
+        live = known & open_
+        self.on_track += int(np.count_nonzero(live & (probability >= ON_TRACK)))
+        self.at_risk += int(np.count_nonzero(live & (probability < ON_TRACK)))
+        self.expected_completions += float(probability[known].sum())
+
+    def __str__(self) -> str:
+        return (
+            f"{self.goals} goals: {self.completed} completed, {self.on_track} on track, "
+            f"{self.at_risk} at risk, {self.missed} missed, {self.unknown} without history; "
+            f"{self.expected_completions:,.0f} expected completions"
+        )
+
+
+def _write_rows(writer: Any, forecast: Forecast) -> None:
+    for app_id, required, projected, probability in zip(
+        forecast.app_id.tolist(),
+        forecast.required_daily_rate.tolist(),
+        forecast.projected_completion.tolist(),
+        forecast.probability.tolist(),
+    ):
+        writer.writerow(
+            [
+                app_id,
+                "" if math.isinf(required) else round(required),
+                "" if math.isnan(projected) else round(projected),
+                "" if math.isnan(probability) else f"{probability:.3f}",
+            ]
+        )
+
+
+def main() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dotenv import load_dotenv
+
+    from smart_contracts.savings_vault.bulk_deploy import Manifest
+    from smart_contracts.savings_vault.history import read_history
+    from smart_contracts.savings_vault.reader import VaultReader
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", type=Path, help="bulk_deploy manifest of the vaults")
+    source.add_argument("--app-ids", type=int, nargs="+")
+    parser.add_argument(
+        "--history", action="store_true", help="read each open vault's deposit history box"
+    )
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=16_384)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", type=Path, help="write per-goal forecasts to this CSV")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    load_dotenv()
+    reader = VaultReader.from_environment(args.max_in_flight)
+    if args.manifest:
+        entries = Manifest(args.manifest).load().values()
+        app_ids = sorted(entry["app_id"] for entry in entries if "app_id" in entry)
+    else:
+        app_ids = args.app_ids
+
+    now = time.time()
+    rng = np.random.default_rng(args.seed)
+    summary = FleetSummary()
+    out = open(args.out, "w", newline="") if args.out else None
+    writer = csv.writer(out) if out else None
+    if writer:
+        writer.writerow(["app_id", "required_daily_rate", "projected_completion", "probability"])
+    try:
+        with ThreadPoolExecutor(max_workers=args.max_in_flight) as executor:
+            for chunk in chunked(reader.read(app_ids), args.chunk_size):
+                histories = None
+                if args.history:
+                    open_ids = [vault.app_id for vault in chunk if not vault.goal_completed]
+                    records = executor.map(
+                        lambda app_id: read_history(reader.transport, app_id), open_ids
+                    )
+                    # An empty read means no history box, so no known deposit process.
+                    histories = {
+                        app_id: history for app_id, history in zip(open_ids, records) if history
+                    }
+                columns = GoalColumns.from_states(chunk, histories, now)
+                result = forecast(columns, now, args.trials, rng)
+                summary.add(result, now)
+                if writer:
+                    _write_rows(writer, result)
+    finally:
+        if out:
+            out.close()
+    logger.info(f"Forecast: {summary}")
+
+
+if __name__ == "__main__":
+    main()
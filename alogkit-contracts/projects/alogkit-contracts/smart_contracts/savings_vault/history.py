@@ -0,0 +1,73 @@
+"""
+Deposit history of a SavingsVault, read straight from its "h" box.
+
+Once the owner has called enable_history, SavingsVault keeps the most recent
+deposits in a ring buffer box (see contract.py):
+
+    deposit count (uint64) ‖ capacity × (timestamp uint64 ‖ amount uint64)
+
+so a goal's recent deposits cost one box read instead of an indexer search over
+the application's transactions. recent_deposits() returns the same entries from
+the contract itself, e.g. through a simulate call.
+
+Usage:
+    records = read_history(algod_transport(algod), app_id, count=10)
+"""
+
+import base64
+import struct
+import urllib.parse
+from typing import NamedTuple
+
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.network import Transport
+
+# Must match the history constants in contract.py.
+HISTORY_BOX = b"h"
+HEADER_SIZE = 8
+ENTRY_SIZE = 16
+MAX_CAPACITY = 63
+
+_ENTRY = struct.Struct(">QQ")
+
+
+class DepositRecord(NamedTuple):
+    timestamp: int
+    amount: int
+
+
+def box_mbr(capacity: int) -> int:
+    """Minimum balance (microALGOs) enable_history must be paid for `capacity` entries."""
+    return 2_500 + 400 * (len(HISTORY_BOX) + HEADER_SIZE + capacity * ENTRY_SIZE)
+
+
+def decode_history(value: bytes, count: int | None = None) -> list[DepositRecord]:
+    """Decodes a history box into its (up to `count`) most recent deposits, newest first."""
+    recorded = int.from_bytes(value[:HEADER_SIZE], "big")
+    capacity = (len(value) - HEADER_SIZE) // ENTRY_SIZE
+    available = min(recorded, capacity)
+    if count is not None:
+        available = min(available, count)
+    records = []
+    for i in range(available):
+        offset = HEADER_SIZE + (recorded - 1 - i) % capacity * ENTRY_SIZE
+        records.append(DepositRecord(*_ENTRY.unpack_from(value, offset)))
+    return records
+
+
+def read_history(
+    transport: Transport, app_id: int, count: int | None = None
+) -> list[DepositRecord]:
+    """
+    Reads a vault's recent deposits with a single box request; empty when the
+    vault has no history box (history never enabled, or already paid out).
+    """
+    name = urllib.parse.quote("b64:" + base64.b64encode(HISTORY_BOX).decode())
+    try:
+        box = transport(f"/applications/{app_id}/box?name={name}")
+    except AlgodHTTPError as exc:
+        if exc.code == 404:
+            return []
+        raise
+    return decode_history(base64.b64decode(box["value"]), count)
@@ -0,0 +1,168 @@
+"""
+Concurrent state reader for a fleet of SavingsVault applications.
+
+Where the frontend's getGoalOnChainState() fetches and decodes one application at
+a time, VaultReader streams the state of many vaults:
+
+    • application lookups run concurrently, at most `max_in_flight` at a time, over
+      a pool of keep-alive connections (see network.AlgodConnectionPool);
+    • records are yielded in the order they arrive, and app IDs are consumed
+      lazily, so the requests held in memory are bounded by the in-flight window,
+      not the fleet;
+    • the last `cache_size` decoded VaultState records of the current round are
+      cached, so reading the same vault again within a round costs no request;
+      the cache is emptied when the round advances, as its records can no longer
+      be served. The round itself is looked up at most once per `round_max_age`
+      seconds (one block by default), so a read served from the cache costs no
+      request at all, and may trail the chain by up to that long.
+
+Usage:
+    reader = VaultReader.from_environment()
+    for vault in reader.read(app_ids):
+        ...
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.network import ROUND_SECONDS, AlgodConnectionPool, Transport
+from smart_contracts.savings_vault.state import VaultState, decode_global_state
+
+logger = logging.getLogger(__name__)
+
+Decoder = Callable[[int, Iterable[Mapping[str, Any]], int], VaultState]
+
+
+def algod_transport(algod: Any) -> Transport:
+    """Adapts an AlgodClient (or the LocalNet stand-in) to a Transport."""
+    return lambda path: algod.algod_request("GET", path)
+
+
+class VaultReader:
+    """Reads and caches the state of many vaults."""
+
+    def __init__(
+        self,
+        transport: Transport,
+        max_in_flight: int = 8,
+        decode: Decoder = decode_global_state,
+        cache_size: int = 4096,
+        round_max_age: float = ROUND_SECONDS,
+    ) -> None:
+        self.transport = transport
+        self.max_in_flight = max_in_flight
+        self.decode = decode
+        self.cache_size = cache_size
+        self.round_max_age = round_max_age
+        self.requests = 0
+        self.cache_hits = 0
+        self.missing: set[int] = set()
+        # Least recently read first; every record is from _cache_round.
+        self._cache: OrderedDict[int, VaultState] = OrderedDict()
+        self._cache_round = 0
+        self._round_fetched_at = 0.0
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, max_in_flight: int = 8) -> "VaultReader":
+        """A reader on a connection pool to ALGOD_SERVER[:ALGOD_PORT] (LocalNet by default)."""
+        server = os.getenv("ALGOD_SERVER", "http://localhost")
+        port = os.getenv("ALGOD_PORT", "4001")
+        address = f"{server}:{port}" if port else server
+        token = os.getenv("ALGOD_TOKEN", "a" * 64)
+        return cls(AlgodConnectionPool(address, token, size=max_in_flight), max_in_flight)
+
+    def last_round(self) -> int:
+        self.requests += 1
+        return self.transport("/status")["last-round"]
+
+    def _current_round(self) -> int:
+        """The cache's round, refreshed from algod once it is `round_max_age` old."""
+        with self._cache_lock:
+            if time.monotonic() - self._round_fetched_at < self.round_max_age:
+                return self._cache_round
+        round_ = self.last_round()
+        with self._cache_lock:
+            self._round_fetched_at = time.monotonic()
+            if round_ > self._cache_round:
+                self._cache.clear()
+                self._cache_round = round_
+            return self._cache_round
+
+    def _fetch(self, app_id: int, round_: int) -> VaultState | None:
+        try:
+            info = self.transport(f"/applications/{app_id}")
+        except AlgodHTTPError as exc:
+            if exc.code == 404:
+                return None
+            raise
+        return self.decode(app_id, info["params"].get("global-state", []), round_)
+
+    def read(self, app_ids: Iterable[int]) -> Iterator[VaultState]:
+        """
+        Yields the current state of each vault as it arrives (not in input order).
+        Vaults that no longer exist are skipped and added to `missing`.
+        """
+        round_ = self._current_round()
+        pending = iter(app_ids)
+        in_flight: dict[Future[VaultState | None], int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+
+            def fill() -> Iterator[VaultState]:
+                # Tops up the in-flight window, yielding cache hits on the way.
+                while len(in_flight) < self.max_in_flight:
+                    app_id = next(pending, None)
+                    if app_id is None:
+                        return
+                    cached = self._recall(app_id)
+                    if cached is not None:
+                        self.cache_hits += 1
+                        yield cached
+                        continue
+                    self.requests += 1
+                    in_flight[executor.submit(self._fetch, app_id, round_)] = app_id
+
+            yield from fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    app_id = in_flight.pop(future)
+                    vault = future.result()
+                    if vault is None:
+                        logger.warning(f"Vault application {app_id} does not exist")
+                        self.missing.add(app_id)
+                        with self._cache_lock:
+                            self._cache.pop(app_id, None)
+                        continue
+                    self._remember(vault)
+                    yield vault
+                yield from fill()
+
+    def _recall(self, app_id: int) -> VaultState | None:
+        with self._cache_lock:
+            cached = self._cache.get(app_id)
+            if cached is not None:
+                self._cache.move_to_end(app_id)
+            return cached
+
+    def _remember(self, vault: VaultState) -> None:
+        with self._cache_lock:
+            if vault.round < self._cache_round or not self.cache_size:
+                return
+            self._cache[vault.app_id] = vault
+            self._cache.move_to_end(vault.app_id)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def get(self, app_id: int) -> VaultState | None:
+        """State of a single vault, or None if it does not exist."""
+        return next(self.read([app_id]), None)
@@ -0,0 +1,290 @@
+"""
+Vectorized reference model of SavingsVault for property-based testing at scale.
+
+The model runs create_goal/deposit/withdraw over a whole batch of randomized
+operation sequences at once: every vault is a row, every operation a column, and
+each step is a handful of NumPy array operations over all rows. It mirrors
+contract.py check by check (same order, same assert messages) and records, per
+operation, whether it was accepted, why it was rejected, and the state after it.
+
+Invariants checked on every trace:
+    • total_saved equals the sum of the accepted deposits so far;
+    • goal_completed is set exactly when total_saved reaches the target;
+    • a withdrawal is only accepted when the goal was completed or the deadline
+      had passed.
+
+The differential mode replays a sample of the same sequences through the real
+contract under algorand-python-testing and reports any step where the contract
+and the model disagree.
+
+Usage (from the project root):
+    poetry run python -m smart_contracts.savings_vault.reference_model \
+        [--sequences 1000000] [--length 16] [--differential 200]
+"""
+
+import argparse
+import collections
+import dataclasses
+import time
+
+import numpy as np
+
+OP_DEPOSIT = 0
+OP_WITHDRAW = 1
+
+# Rejection reasons, in the order the contract checks them; 0 means accepted.
+REASONS = (
+    "",
+    "Sender must be goal owner",
+    "Cannot deposit after deadline",
+    "Goal already completed",
+    "Payment must go to contract",
+    "Only goal owner can withdraw",
+    "Withdrawal conditions not met: goal incomplete and deadline not reached",
+)
+_REASON_CODES = {message: code for code, message in enumerate(REASONS)}
+
+
+@dataclasses.dataclass
+class Sequences:
+    """A batch of vaults (rows) and the operations replayed on each (columns)."""
+
+    target: np.ndarray  # (n,) uint64
+    deadline: np.ndarray  # (n,) uint64
+    op: np.ndarray  # (n, length) int8, OP_DEPOSIT or OP_WITHDRAW
+    amount: np.ndarray  # (n, length) uint64, deposit payment amount
+    timestamp: np.ndarray  # (n, length) uint64, latest_timestamp at the call
+    from_owner: np.ndarray  # (n, length) bool, sender is the goal owner
+    to_app: np.ndarray  # (n, length) bool, deposit payment goes to the app
+
+    def __len__(self) -> int:
+        return len(self.target)
+
+
+@dataclasses.dataclass
+class Trace:
+    """Outcome of every operation and the state right after it."""
+
+    reason: np.ndarray  # (n, length) int8 index into REASONS, 0 = accepted
+    total_saved: np.ndarray  # (n, length) uint64
+    goal_completed: np.ndarray  # (n, length) bool
+
+    @property
+    def accepted(self) -> np.ndarray:
+        return self.reason == 0
+
+
+def random_sequences(
+    rng: np.random.Generator,
+    count: int,
+    length: int,
+    max_amount: int = 1_000_000,
+    withdraw_share: float = 0.15,
+    stranger_share: float = 0.05,
+    misdirected_share: float = 0.03,
+) -> Sequences:
+    """Random vaults and operation sequences; about half of them cross the deadline."""
+    start = 1_700_000_000
+    steps = rng.integers(0, 3_600, size=(count, length), dtype=np.uint64)
+    timestamp = start + np.cumsum(steps, axis=1, dtype=np.uint64)
+    return Sequences(
+        target=rng.integers(1, max_amount * length // 2 + 2, size=count, dtype=np.uint64),
+        deadline=start + rng.integers(0, 3_600 * length, size=count, dtype=np.uint64),
+        op=(rng.random((count, length)) < withdraw_share).astype(np.int8),
+        amount=rng.integers(0, max_amount + 1, size=(count, length), dtype=np.uint64),
+        timestamp=timestamp,
+        from_owner=rng.random((count, length)) >= stranger_share,
+        to_app=rng.random((count, length)) >= misdirected_share,
+    )
+
+
+def simulate(sequences: Sequences) -> Trace:
+    """Runs every sequence through the model, one vectorized step per operation."""
+    count, length = sequences.op.shape
+    # Work on operation-major copies so each step reads contiguous memory.
+    op, amount, timestamp, from_owner, to_app = (
+        np.ascontiguousarray(array.T)
+        for array in (
+            sequences.op,
+            sequences.amount,
+            sequences.timestamp,
+            sequences.from_owner,
+            sequences.to_app,
+        )
+    )
+    total = np.zeros(count, dtype=np.uint64)
+    completed = np.zeros(count, dtype=bool)
+    reason = np.empty((length, count), dtype=np.int8)
+    totals = np.empty((length, count), dtype=np.uint64)
+    completions = np.empty((length, count), dtype=bool)
+    zero = np.uint64(0)
+
+    for step in range(length):
+        is_deposit = op[step] == OP_DEPOSIT
+        owner = from_owner[step]
+        past_deadline = timestamp[step] >= sequences.deadline
+
+        # The first failing assert wins, so fill reasons from the last check back.
+        deposit_reason = np.where(to_app[step], 0, 4).astype(np.int8)
+        deposit_reason[completed] = 3
+        deposit_reason[past_deadline] = 2
+        withdraw_reason = np.where(completed | past_deadline, 0, 6).astype(np.int8)
+        step_reason = np.where(is_deposit, deposit_reason, withdraw_reason)
+        step_reason[~owner] = np.where(is_deposit, 1, 5)[~owner]
+
+        accepted_deposit = is_deposit & (step_reason == 0)
+        total += np.where(accepted_deposit, amount[step], zero)
+        completed |= accepted_deposit & (total >= sequences.target)
+
+        reason[step] = step_reason
+        totals[step] = total
+        completions[step] = completed
+    return Trace(reason=reason.T, total_saved=totals.T, goal_completed=completions.T)
+
+
+def check_invariants(sequences: Sequences, trace: Trace) -> dict[str, int]:
+    """Number of sequences violating each invariant."""
+    accepted = trace.accepted
+    is_deposit = sequences.op == OP_DEPOSIT
+    deposited = np.cumsum(
+        np.where(accepted & is_deposit, sequences.amount, np.uint64(0)), axis=1, dtype=np.uint64
+    )
+    completed_before = np.concatenate(
+        [np.zeros((len(sequences), 1), dtype=bool), trace.goal_completed[:, :-1]], axis=1
+    )
+    past_deadline = sequences.timestamp >= sequences.deadline[:, None]
+    withdrawn = accepted & ~is_deposit
+    reached = trace.total_saved >= sequences.target[:, None]
+    return {
+        "total_saved == sum of accepted deposits": int(
+            np.any(trace.total_saved != deposited, axis=1).sum()
+        ),
+        "goal_completed iff target reached": int(
+            np.any(trace.goal_completed != reached, axis=1).sum()
+        ),
+        "withdraw only when completed or past deadline": int(
+            np.any(withdrawn & ~(completed_before | past_deadline), axis=1).sum()
+        ),
+    }
+
+
+# ── Differential mode ──────────────────────────────────────────────────────────
+
+
+def replay_contract(sequences: Sequences, index: int) -> Trace:
+    """Replays one sequence through the real contract under algorand-python-testing."""
+    from algopy import UInt64, arc4
+    from algopy_testing import algopy_testing_context
+
+    from smart_contracts.savings_vault.contract import SavingsVault
+
+    length = sequences.op.shape[1]
+    reason = np.zeros((1, length), dtype=np.int8)
+    totals = np.zeros((1, length), dtype=np.uint64)
+    completions = np.zeros((1, length), dtype=bool)
+
+    with algopy_testing_context() as context:
+        owner = context.any.account()
+        stranger = context.any.account()
+        vault = SavingsVault()
+        with context.txn.create_group(active_txn_overrides={"sender": owner}):
+            vault.create_goal(
+                arc4.Address(owner),
+                arc4.UInt64(int(sequences.target[index])),
+                arc4.UInt64(int(sequences.deadline[index])),
+            )
+        app_address = context.ledger.get_app(vault).address
+
+        for step in range(length):
+            context.ledger.patch_global_fields(
+                latest_timestamp=int(sequences.timestamp[index, step])
+            )
+            sender = owner if sequences.from_owner[index, step] else stranger
+            try:
+                if sequences.op[index, step] == OP_DEPOSIT:
+                    payment = context.any.txn.payment(
+                        sender=sender,
+                        receiver=app_address if sequences.to_app[index, step] else stranger,
+                        amount=UInt64(int(sequences.amount[index, step])),
+                    )
+                    with context.txn.create_group(active_txn_overrides={"sender": sender}):
+                        vault.deposit(payment)
+                else:
+                    with context.txn.create_group(active_txn_overrides={"sender": sender}):
+                        vault.withdraw()
+            except AssertionError as exc:
+                reason[0, step] = _REASON_CODES.get(str(exc), -1)
+            totals[0, step] = vault.total_saved.value
+            completions[0, step] = vault.goal_completed.value == 1
+    return Trace(reason=reason, total_saved=totals, goal_completed=completions)
+
+
+def differential(sequences: Sequences, trace: Trace, indices: np.ndarray) -> list[str]:
+    """Describes every step where the contract diverges from the model."""
+    divergences = []
+    for index in indices:
+        actual = replay_contract(sequences, int(index))
+        for name in ("reason", "total_saved", "goal_completed"):
+            expected_row = getattr(trace, name)[index]
+            actual_row = getattr(actual, name)[0]
+            mismatched = np.flatnonzero(expected_row != actual_row)
+            if mismatched.size:
+                step = int(mismatched[0])
+                divergences.append(
+                    f"sequence {index} step {step}: {name} model={expected_row[step]} "
+                    f"contract={actual_row[step]}"
+                )
+    return divergences
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sequences", type=int, default=1_000_000)
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--chunk", type=int, default=1 << 14, help="sequences per batch")
+    parser.add_argument("--differential", type=int, default=200, help="sequences to replay")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    violations: collections.Counter[str] = collections.Counter()
+    rejections = np.zeros(len(REASONS), dtype=np.int64)
+    divergences: list[str] = []
+    simulated = 0.0
+    remaining = args.sequences
+    while remaining > 0:
+        count = min(args.chunk, remaining)
+        sequences = random_sequences(rng, count, args.length)
+        started = time.perf_counter()
+        trace = simulate(sequences)
+        simulated += time.perf_counter() - started
+        violations.update(check_invariants(sequences, trace))
+        rejections += np.bincount(trace.reason.ravel(), minlength=len(REASONS))
+        if remaining == args.sequences and args.differential:
+            sample = rng.choice(count, size=min(args.differential, count), replace=False)
+            divergences = differential(sequences, trace, sample)
+        remaining -= count
+
+    print(
+        f"Simulated {args.sequences} sequences of {args.length} operations in {simulated:.2f}s "
+        f"({args.sequences / simulated:,.0f} sequences/s)"
+    )
+    print("Outcomes:")
+    for code, count in enumerate(rejections):
+        print(f"  {count:>12,}  {REASONS[code] or 'accepted'}")
+    print("Invariant violations:")
+    for name, count in violations.items():
+        print(f"  {count:>12,}  {name}")
+    if args.differential:
+        print(
+            f"Differential replay of {args.differential} sequences: "
+            f"{len(divergences)} divergence(s)"
+        )
+        for divergence in divergences[:20]:
+            print(f"  {divergence}")
+    if any(violations.values()) or divergences:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Batched SavingsVault reads through simulate.
+
+SavingsVault.get_state returns a vault's whole state, its app account balance and
+the amount still missing to its target as one ARC-4 tuple. SnapshotReader packs
+one get_state call per vault, up to 16 vaults (one atomic group), into a single
+simulate request, so listing a user's goals costs one round-trip instead of an
+application lookup (and an account lookup for the balance) per vault, and the
+derived fields are computed on-chain rather than by every client. Batches of a
+longer list run concurrently, at most `max_in_flight` at a time.
+
+Nothing is signed or committed: the calls are simulated with empty signatures.
+The sender still pays the simulated fees, so it must be a funded account, e.g.
+the owner whose goals are being listed.
+
+Usage:
+    reader = SnapshotReader(algod, sender=owner_address)
+    for snapshot in reader.read(app_ids):
+        ...
+"""
+
+import base64
+import logging
+import struct
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple
+
+from algosdk import abi, transaction
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts._helpers.network import MAX_GROUP_SIZE, SuggestedParamsCache, chunked
+from smart_contracts.savings_vault.state import VaultState
+
+logger = logging.getLogger(__name__)
+
+GET_STATE = abi.Method.from_signature(
+    "get_state()(address,uint64,uint64,uint64,bool,uint64,uint64)"
+)
+
+# Prefix of an ARC-4 return value log.
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+# ARC-4 encoding of the get_state tuple: a bool on its own takes a byte (0x80 = true).
+_SNAPSHOT = struct.Struct(">32sQQQBQQ")
+
+
+class VaultSnapshot(NamedTuple):
+    app_id: int
+    goal_owner: bytes
+    target_amount: int
+    total_saved: int
+    deadline: int
+    goal_completed: bool
+    balance: int
+    remaining: int
+    round: int = 0
+
+    def to_state(self) -> VaultState:
+        return VaultState(
+            app_id=self.app_id,
+            goal_owner=self.goal_owner,
+            target_amount=self.target_amount,
+            total_saved=self.total_saved,
+            deadline=self.deadline,
+            goal_completed=self.goal_completed,
+            round=self.round,
+        )
+
+
+def encode_snapshot(snapshot: VaultSnapshot) -> bytes:
+    """get_state's ARC-4 return value for a snapshot (used by the stand-in)."""
+    return _SNAPSHOT.pack(
+        snapshot.goal_owner,
+        snapshot.target_amount,
+        snapshot.total_saved,
+        snapshot.deadline,
+        0x80 if snapshot.goal_completed else 0,
+        snapshot.balance,
+        snapshot.remaining,
+    )
+
+
+def decode_snapshot(app_id: int, value: bytes, round: int = 0) -> VaultSnapshot:
+    """Decodes get_state's ARC-4 return value."""
+    owner, target, total, deadline, flags, balance, remaining = _SNAPSHOT.unpack(value)
+    return VaultSnapshot(
+        app_id, owner, target, total, deadline, bool(flags & 0x80), balance, remaining, round
+    )
+
+
+class SnapshotReader:
+    """Reads many vaults with one simulate request per 16 of them."""
+
+    def __init__(
+        self,
+        algod: Any,
+        sender: str,
+        max_in_flight: int = 8,
+        batch_size: int = MAX_GROUP_SIZE,
+    ) -> None:
+        if not 0 < batch_size <= MAX_GROUP_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_GROUP_SIZE}")
+        self.algod = algod
+        self.sender = sender
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.params = SuggestedParamsCache(algod)
+        self.requests = 0
+        self.missing: set[int] = set()
+
+    def _request(self, app_ids: list[int]) -> SimulateRequest:
+        params = self.params.get()
+        txns = [
+            transaction.ApplicationCallTxn(
+                self.sender,
+                params,
+                app_id,
+                transaction.OnComplete.NoOpOC,
+                app_args=[GET_STATE.get_selector()],
+            )
+            for app_id in app_ids
+        ]
+        if len(txns) > 1:
+            txns = transaction.assign_group_id(txns)
+        return SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                )
+            ],
+            allow_empty_signatures=True,
+        )
+
+    def _simulate(self, app_ids: list[int]) -> tuple[list[VaultSnapshot], list[int], int]:
+        """
+        Simulates one batch. A vault that cannot be read (deleted, or not a
+        SavingsVault) fails the whole group, so it is dropped and the rest of the
+        batch is simulated again. Returns the snapshots, the dropped app IDs and
+        the number of requests made.
+        """
+        pending, dropped, requests = list(app_ids), [], 0
+        while pending:
+            requests += 1
+            response = self.algod.simulate_transactions(self._request(pending))
+            group = response["txn-groups"][0]
+            if group.get("failure-message"):
+                app_id = pending.pop(group["failed-at"][0])
+                logger.warning(f"Vault application {app_id} could not be read: {group['failure-message']}")
+                dropped.append(app_id)
+                continue
+            snapshots = []
+            for app_id, result in zip(pending, group["txn-results"]):
+                value = base64.b64decode(result["txn-result"]["logs"][-1])
+                if not value.startswith(_RETURN_PREFIX):
+                    raise ValueError(f"get_state of application {app_id} returned no value")
+                snapshots.append(
+                    decode_snapshot(app_id, value[len(_RETURN_PREFIX) :], response["last-round"])
+                )
+            return snapshots, dropped, requests
+        return [], dropped, requests
+
+    def read(self, app_ids: Iterable[int]) -> Iterator[VaultSnapshot]:
+        """
+        Yields a snapshot of each vault, a batch at a time as batches complete (not
+        in input order). Vaults that cannot be read are skipped and added to `missing`.
+        """
+        batches = chunked(app_ids, self.batch_size)
+        in_flight: set[Future[tuple[list[VaultSnapshot], list[int], int]]] = set()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+
+            def fill() -> None:
+                while len(in_flight) < self.max_in_flight:
+                    batch = next(batches, None)
+                    if batch is None:
+                        return
+                    in_flight.add(executor.submit(self._simulate, batch))
+
+            fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    snapshots, dropped, requests = future.result()
+                    self.requests += requests
+                    self.missing.update(dropped)
+                    yield from snapshots
+                fill()
+
+    def get(self, app_id: int) -> VaultSnapshot | None:
+        """Snapshot of a single vault, or None if it cannot be read."""
+        return next(self.read([app_id]), None)
@@ -0,0 +1,206 @@
+"""
+SavingsVault behaviour for the LocalNet stand-in.
+
+Python handlers mirroring contract.py method by method (same checks, same order,
+same assert messages), so bulk tooling and load tests can run against
+StandinAlgod without compiling or deploying the real contract.
+"""
+
+from algosdk import abi, transaction
+from algosdk.encoding import encode_address
+
+from smart_contracts._helpers.localnet_standin import CallContext, Handler, StandinReject
+from smart_contracts.savings_vault.events import encode_event
+from smart_contracts.savings_vault.history import (
+    ENTRY_SIZE,
+    HEADER_SIZE,
+    HISTORY_BOX,
+    MAX_CAPACITY,
+    box_mbr,
+)
+from smart_contracts.savings_vault.snapshot_reader import GET_STATE, VaultSnapshot, encode_snapshot
+
+CREATE_GOAL = abi.Method.from_signature("create_goal(address,uint64,uint64)void")
+DEPOSIT = abi.Method.from_signature("deposit(pay)void")
+DEPOSIT_BATCH = abi.Method.from_signature("deposit_batch()void")
+WITHDRAW = abi.Method.from_signature("withdraw()void")
+RELEASE = abi.Method.from_signature("release()void")
+ENABLE_HISTORY = abi.Method.from_signature("enable_history(uint64,pay)void")
+RECENT_DEPOSITS = abi.Method.from_signature("recent_deposits(uint64)(uint64,uint64)[]")
+
+
+def _owner(context: CallContext) -> str:
+    return encode_address(context.app.global_state[b"goal_owner"])
+
+
+def _check_deposit_window(context: CallContext) -> None:
+    state = context.app.global_state
+    context.require(context.txn.sender == _owner(context), "Sender must be goal owner")
+    context.require(context.latest_timestamp < state[b"deadline"], "Cannot deposit after deadline")
+    context.require(state[b"goal_completed"] == 0, "Goal already completed")
+
+
+def _emit(context: CallContext, name: str, amount: int, completed: bool) -> None:
+    total = int(context.app.global_state[b"total_saved"])
+    context.log(encode_event(name, _owner(context), amount, total, completed))
+
+
+def _record_deposit(context: CallContext, amount: int) -> None:
+    state = context.app.global_state
+    state[b"total_saved"] = int(state[b"total_saved"]) + amount
+    completed = state[b"total_saved"] >= state[b"target_amount"]
+    if completed:
+        state[b"goal_completed"] = 1
+    _emit(context, "Deposited", amount, completed)
+    if completed:
+        _emit(context, "GoalCompleted", amount, True)
+    if state[b"history_capacity"]:
+        _append_history(context, amount)
+
+
+def _append_history(context: CallContext, amount: int) -> None:
+    history = bytearray(context.app.boxes[HISTORY_BOX])
+    recorded = int.from_bytes(history[:HEADER_SIZE], "big")
+    slot = recorded % context.app.global_state[b"history_capacity"]
+    offset = HEADER_SIZE + slot * ENTRY_SIZE
+    entry = context.latest_timestamp.to_bytes(8, "big") + amount.to_bytes(8, "big")
+    history[offset : offset + ENTRY_SIZE] = entry
+    history[:HEADER_SIZE] = (recorded + 1).to_bytes(HEADER_SIZE, "big")
+    context.app.boxes[HISTORY_BOX] = bytes(history)
+
+
+def create_goal(context: CallContext) -> None:
+    context.require(context.txn.index == 0, "create_goal can only be called on creation")
+    owner, target, deadline_ts = context.args[1], context.args[2], context.args[3]
+    context.app.global_state.update(
+        {
+            b"goal_owner": owner,
+            b"target_amount": int.from_bytes(target, "big"),
+            b"deadline": int.from_bytes(deadline_ts, "big"),
+            b"total_saved": 0,
+            b"goal_completed": 0,
+            b"history_capacity": 0,
+        }
+    )
+
+
+def enable_history(context: CallContext) -> None:
+    state = context.app.global_state
+    payment = context.group[context.index - 1] if context.index else None
+    if not isinstance(payment, transaction.PaymentTxn):
+        raise StandinReject("transaction type is pay")
+    capacity = int.from_bytes(context.args[1], "big")
+    context.require(context.txn.sender == _owner(context), "Sender must be goal owner")
+    context.require(state[b"history_capacity"] == 0, "History already enabled")
+    context.require(
+        context.latest_timestamp < state[b"deadline"], "Cannot enable history after deadline"
+    )
+    context.require(state[b"goal_completed"] == 0, "Goal already completed")
+    context.require(0 < capacity <= MAX_CAPACITY, "History capacity must be between 1 and 63")
+    context.require(payment.receiver == context.app.address, "Payment must go to contract")
+    context.require(payment.amt >= box_mbr(capacity), "Payment must cover history storage")
+    state[b"history_capacity"] = capacity
+    context.app.boxes[HISTORY_BOX] = bytes(HEADER_SIZE + capacity * ENTRY_SIZE)
+
+
+def deposit(context: CallContext) -> None:
+    payment = context.group[context.index - 1] if context.index else None
+    if not isinstance(payment, transaction.PaymentTxn):
+        raise StandinReject("transaction type is pay")
+    _check_deposit_window(context)
+    context.require(payment.receiver == context.app.address, "Payment must go to contract")
+    _record_deposit(context, payment.amt)
+
+
+def deposit_batch(context: CallContext) -> None:
+    _check_deposit_window(context)
+    batch_total = payment_count = 0
+    for i, txn in enumerate(context.group):
+        if isinstance(txn, transaction.PaymentTxn):
+            if txn.receiver == context.app.address:
+                batch_total += txn.amt
+                payment_count += 1
+        elif isinstance(txn, transaction.ApplicationCallTxn) and i != context.index:
+            context.require(
+                txn.index != context.app.app_id, "Batch must be the only vault call in group"
+            )
+    context.require(payment_count > 0, "No payments to contract in group")
+    _record_deposit(context, batch_total)
+
+
+def withdraw(context: CallContext) -> None:
+    state = context.app.global_state
+    owner = _owner(context)
+    context.require(context.txn.sender == owner, "Only goal owner can withdraw")
+    context.require(
+        state[b"goal_completed"] == 1 or context.latest_timestamp >= state[b"deadline"],
+        "Withdrawal conditions not met: goal incomplete and deadline not reached",
+    )
+    _pay_out(context)
+
+
+def release(context: CallContext) -> None:
+    state = context.app.global_state
+    context.require(
+        state[b"goal_completed"] == 1 or context.latest_timestamp >= state[b"deadline"],
+        "Release conditions not met: goal incomplete and deadline not reached",
+    )
+    context.require(
+        context.algod.balances.get(context.app.address, 0) > 0, "Vault already released"
+    )
+    _pay_out(context)
+
+
+def get_state(context: CallContext) -> None:
+    state = context.app.global_state
+    target, total = int(state[b"target_amount"]), int(state[b"total_saved"])
+    snapshot = VaultSnapshot(
+        app_id=context.app.app_id,
+        goal_owner=bytes(state[b"goal_owner"]),
+        target_amount=target,
+        total_saved=total,
+        deadline=int(state[b"deadline"]),
+        goal_completed=state[b"goal_completed"] == 1,
+        balance=context.algod.balances.get(context.app.address, 0),
+        remaining=max(target - total, 0),
+    )
+    context.returns(encode_snapshot(snapshot))
+
+
+def recent_deposits(context: CallContext) -> None:
+    capacity = context.app.global_state[b"history_capacity"]
+    context.require(capacity > 0, "History not enabled")
+    history = context.app.boxes[HISTORY_BOX]
+    recorded = int.from_bytes(history[:HEADER_SIZE], "big")
+    n = min(int.from_bytes(context.args[1], "big"), recorded, capacity)
+    entries = b"".join(
+        history[offset : offset + ENTRY_SIZE]
+        for offset in (
+            HEADER_SIZE + (recorded - 1 - i) % capacity * ENTRY_SIZE for i in range(n)
+        )
+    )
+    context.returns(n.to_bytes(2, "big") + entries)
+
+
+def _pay_out(context: CallContext) -> None:
+    if context.app.global_state[b"history_capacity"]:
+        del context.app.boxes[HISTORY_BOX]
+        context.app.global_state[b"history_capacity"] = 0
+    owner = _owner(context)
+    balance = context.algod.balances.get(context.app.address, 0)
+    _emit(context, "Withdrawn", balance, context.app.global_state[b"goal_completed"] == 1)
+    context.pay(owner, 0, close_remainder_to=owner)
+
+
+def savings_vault_handlers() -> dict[bytes, Handler]:
+    """Handlers to register on a StandinAlgod, keyed by ABI method selector."""
+    return {
+        CREATE_GOAL.get_selector(): create_goal,
+        DEPOSIT.get_selector(): deposit,
+        DEPOSIT_BATCH.get_selector(): deposit_batch,
+        WITHDRAW.get_selector(): withdraw,
+        RELEASE.get_selector(): release,
+        ENABLE_HISTORY.get_selector(): enable_history,
+        RECENT_DEPOSITS.get_selector(): recent_deposits,
+        GET_STATE.get_selector(): get_state,
+    }
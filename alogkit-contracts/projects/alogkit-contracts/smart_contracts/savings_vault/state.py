@@ -0,0 +1,105 @@
+"""
+Decoded SavingsVault state for Python tooling.
+
+VaultState is the one record type every reader works with, whichever on-chain
+layout it came from (see packed_savings_vault/layout.py for the packed variant).
+The owner is kept as its raw 32-byte public key; `owner_address` only pays for
+the checksummed address encoding when it is actually needed.
+"""
+
+import base64
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# algod's TealValue type codes.
+_TEAL_BYTES = 1
+
+# Global-state keys written by SavingsVault (contract.py and contracts/app.py).
+_KEYS = {
+    b"goal_owner": "goal_owner",
+    b"target_amount": "target_amount",
+    b"total_saved": "total_saved",
+    b"deadline": "deadline",
+    b"goal_completed": "goal_completed",
+    b"history_capacity": "history_capacity",
+}
+
+
+class VaultState:
+    """State of one savings vault."""
+
+    __slots__ = (
+        "app_id",
+        "goal_owner",
+        "target_amount",
+        "total_saved",
+        "deadline",
+        "goal_completed",
+        "round",
+        "history_capacity",
+    )
+
+    def __init__(
+        self,
+        app_id: int,
+        goal_owner: bytes,
+        target_amount: int,
+        total_saved: int,
+        deadline: int,
+        goal_completed: bool,
+        round: int = 0,
+        history_capacity: int = 0,
+    ) -> None:
+        self.app_id = app_id
+        self.goal_owner = goal_owner
+        self.target_amount = target_amount
+        self.total_saved = total_saved
+        self.deadline = deadline
+        self.goal_completed = goal_completed
+        self.round = round
+        # Deposit history entries kept in box "h", 0 = history not enabled.
+        self.history_capacity = history_capacity
+
+    @property
+    def owner_address(self) -> str:
+        from algosdk.encoding import encode_address
+
+        return encode_address(self.goal_owner)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VaultState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"VaultState({fields})"
+
+
+def decode_global_state(
+    app_id: int, global_state: Iterable[Mapping[str, Any]], round: int = 0
+) -> VaultState:
+    """
+    Decodes the `global-state` key/value array algod returns for a SavingsVault
+    application (separate keys, the classic layout).
+    """
+    values: dict[str, Any] = {}
+    for entry in global_state:
+        name = _KEYS.get(base64.b64decode(entry["key"]))
+        if name is None:
+            continue
+        value = entry["value"]
+        if value["type"] == _TEAL_BYTES:
+            values[name] = base64.b64decode(value.get("bytes", ""))
+        else:
+            values[name] = value.get("uint", 0)
+    return VaultState(
+        app_id=app_id,
+        goal_owner=values.get("goal_owner", b""),
+        target_amount=values.get("target_amount", 0),
+        total_saved=values.get("total_saved", 0),
+        deadline=values.get("deadline", 0),
+        goal_completed=values.get("goal_completed", 0) == 1,
+        round=round,
+        history_capacity=values.get("history_capacity", 0),
+    )
@@ -0,0 +1,345 @@
+"""
+Bulk settlement of expired or completed SavingsVault applications.
+
+SavingsVault.release() may be called by anyone once a vault's goal is completed
+or its deadline has passed, and always pays out to the goal owner. The sweeper
+settles a whole fleet with it:
+
+    • vault states are read concurrently (VaultReader) and filtered to those
+      that are due; the app-account balance of each due vault is then checked so
+      vaults that were already withdrawn or released are skipped;
+    • release calls are packed into atomic groups of up to 16, and the first call
+      of each group pays the fees of the whole group, inner payments included
+      (fee pooling), so one account funds the sweep;
+    • groups are submitted pipelined with a bounded number in flight;
+    • a group rejected as a whole (e.g. an owner withdrew in the meantime) is
+      retried one vault per group, so one stale vault does not hold back the rest;
+      a group that is not confirmed in time may still confirm late, so it is only
+      retried for the vaults that still hold their balance, and a vault found
+      paid out after a failure counts as settled rather than failed;
+    • with --registry, the expired vaults are taken from a VaultRegistry's
+      deadline index (one box-name listing) instead of scanning every vault, and
+      each release is followed in its group by the registry's deregister call, so
+      the entry goes with the payout; vaults that were paid out but are still
+      listed are only deregistered.
+
+Usage (from the project root):
+    poetry run python -m smart_contracts.savings_vault.sweeper \
+        --manifest cohort.manifest.jsonl [--max-in-flight 8]
+    poetry run python -m smart_contracts.savings_vault.sweeper --app-ids 1001 1002 ...
+    poetry run python -m smart_contracts.savings_vault.sweeper --registry 1000
+"""
+
+import argparse
+import copy
+import dataclasses
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from algosdk import abi, transaction
+from algosdk.error import ConfirmationTimeoutError
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers import failure_traces, runtime
+from smart_contracts._helpers.network import MAX_GROUP_SIZE, SuggestedParamsCache, chunked
+from smart_contracts.savings_vault.history import HISTORY_BOX
+from smart_contracts.savings_vault.reader import VaultReader, algod_transport
+from smart_contracts.savings_vault.state import VaultState
+from smart_contracts.vault_registry.query import deregister_txn, vaults_due
+
+logger = logging.getLogger(__name__)
+
+RELEASE = abi.Method.from_signature("release()void")
+
+# algod's latest_timestamp trails the wall clock by up to a block, so a vault is
+# only treated as expired once its deadline is this many seconds in the past.
+DEADLINE_MARGIN = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class DueVault:
+    app_id: int
+    owner: str
+    balance: int
+    deadline: int = 0
+    registry: int = 0  # VaultRegistry app ID to deregister from, 0 = none
+    history: bool = False  # keeps a deposit history box, deleted on payout
+
+
+@dataclasses.dataclass
+class SweepReport:
+    scanned: int = 0
+    due: int = 0
+    settled: int = 0
+    released: int = 0  # microALGOs paid out to owners
+    fees: int = 0
+    groups: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def vaults_per_second(self) -> float:
+        return self.settled / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.settled}/{self.due} due vaults settled ({self.scanned} scanned), "
+            f"{self.released / 1e6:.6f} ALGO released, {self.fees} µALGO fees in "
+            f"{self.groups} group(s), {self.failed} failed, in {self.elapsed:.2f}s "
+            f"({self.vaults_per_second:.1f} vaults/s)"
+        )
+
+
+def is_due(vault: VaultState, now: int) -> bool:
+    """Whether release() would pass its goal/deadline check at time `now`."""
+    return vault.goal_completed or now >= vault.deadline + DEADLINE_MARGIN
+
+
+class Sweeper:
+    """Finds due vaults and releases them in pipelined, fee-pooled groups."""
+
+    def __init__(
+        self,
+        algod: Any,
+        sender: str,
+        private_key: str,
+        reader: VaultReader | None = None,
+        max_in_flight: int = 8,
+        group_size: int = MAX_GROUP_SIZE,
+        wait_rounds: int = 10,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.algod = algod
+        self.sender = sender
+        self.private_key = private_key
+        self.reader = reader or VaultReader(algod_transport(algod))
+        self.max_in_flight = max_in_flight
+        self.group_size = min(group_size, MAX_GROUP_SIZE)
+        self.wait_rounds = wait_rounds
+        self.clock = clock
+        self.params = SuggestedParamsCache(algod)
+
+    # ── Discovery ──────────────────────────────────────────────────────────────
+
+    def _balance(self, vault: VaultState, registry: int = 0) -> DueVault:
+        address = get_application_address(vault.app_id)
+        info = self.reader.transport(f"/accounts/{address}?exclude=all")
+        return DueVault(
+            vault.app_id,
+            vault.owner_address,
+            info["amount"],
+            vault.deadline,
+            registry,
+            vault.history_capacity > 0,
+        )
+
+    def expired_in_registry(self, registry_app_id: int) -> list[int]:
+        """App IDs of the registry's vaults whose deadline has passed."""
+        before = int(self.clock()) - DEADLINE_MARGIN + 1
+        entries = vaults_due(self.algod, registry_app_id, before=before)
+        return [entry.app_id for entry in entries]
+
+    def find_due(
+        self, app_ids: Iterable[int], report: SweepReport | None = None, registry: int = 0
+    ) -> list[DueVault]:
+        """
+        Vaults that are due and still hold a balance, in app ID order. With a
+        registry, paid-out vaults are kept too, to be deregistered.
+        """
+        report = report or SweepReport()
+        now = int(self.clock())
+        due = []
+        for vault in self.reader.read(app_ids):
+            report.scanned += 1
+            if is_due(vault, now):
+                due.append(vault)
+        with ThreadPoolExecutor(max_workers=self.reader.max_in_flight) as executor:
+            balances = executor.map(lambda vault: self._balance(vault, registry), due)
+            funded = [vault for vault in balances if vault.balance or registry]
+        report.due = len(funded)
+        return sorted(funded, key=lambda vault: vault.app_id)
+
+    # ── Transactions ───────────────────────────────────────────────────────────
+
+    def _release_group(self, vaults: Sequence[DueVault], params: Any) -> list[Any]:
+        # Each release issues one inner payment; the first call pays for the whole
+        # group, deregister calls included.
+        call_params = copy.copy(params)
+        call_params.flat_fee = True
+        call_params.fee = 0
+        txns: list[transaction.Transaction] = []
+        for vault in vaults:
+            if vault.balance:
+                txns.append(
+                    transaction.ApplicationCallTxn(
+                        sender=self.sender,
+                        sp=call_params,
+                        index=vault.app_id,
+                        on_complete=transaction.OnComplete.NoOpOC,
+                        app_args=[RELEASE.get_selector()],
+                        accounts=[vault.owner],
+                        # Deleted on payout when the vault keeps a deposit history.
+                        boxes=[(0, HISTORY_BOX)] if vault.history else None,
+                    )
+                )
+            if vault.registry:
+                txns.append(
+                    deregister_txn(
+                        self.sender, call_params, vault.registry, vault.app_id, vault.deadline
+                    )
+                )
+        min_fee = max(params.min_fee or 0, params.fee or 0)
+        inner = sum(1 for vault in vaults if vault.balance)
+        txns[0].fee = (len(txns) + inner) * min_fee
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        return [txn.sign(self.private_key) for txn in txns]
+
+    def _send_and_confirm(self, signed: list[Any]) -> None:
+        """
+        Submits a group and waits for it. Raises ConfirmationTimeoutError if it is
+        still pending after `wait_rounds`: unlike a rejection, it may yet confirm.
+        """
+        try:
+            self.algod.send_transactions(signed)
+        except Exception:
+            failure_traces.record(self.algod, signed)
+            raise
+        txid = signed[-1].get_txid()
+        try:
+            transaction.wait_for_confirmation(self.algod, txid, self.wait_rounds)
+        except ConfirmationTimeoutError:
+            # It may have confirmed in the round the wait gave up on.
+            if not self.algod.pending_transaction_info(txid).get("confirmed-round"):
+                raise
+
+    def _paid_out(self, vault: DueVault) -> bool:
+        """Whether a funded vault's account has been closed since it was found due."""
+        address = get_application_address(vault.app_id)
+        return self.reader.transport(f"/accounts/{address}?exclude=all")["amount"] == 0
+
+    # ── Pipeline ───────────────────────────────────────────────────────────────
+
+    def run(self, app_ids: Iterable[int], registry: int = 0) -> SweepReport:
+        """Releases the due vaults, deregistering them from `registry` if given."""
+        report = SweepReport()
+        started = time.perf_counter()
+        due = self.find_due(app_ids, report, registry)
+        if due:
+            logger.info(f"Sweep: releasing {len(due)} vault(s) of {report.scanned} scanned")
+
+        # A registered vault takes two transactions: its release and its deregister.
+        groups = chunked(due, self.group_size // 2 if registry else self.group_size)
+        retries: list[list[DueVault]] = []
+        in_flight: dict[Future[None], tuple[list[DueVault], int]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+
+            def fill_pipeline() -> None:
+                while len(in_flight) < self.max_in_flight:
+                    group = retries.pop() if retries else next(groups, None)
+                    if group is None:
+                        return
+                    signed = self._release_group(group, self.params.get())
+                    fee = sum(stxn.transaction.fee for stxn in signed)
+                    in_flight[executor.submit(self._send_and_confirm, signed)] = (group, fee)
+
+            fill_pipeline()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group, fee = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        # Vaults paid out since they were found due (by another sweep,
+                        # their owner, or this group confirming late) are settled; only
+                        # the rest are retried. Deregister-only vaults are always
+                        # retried, as deregistering again is a no-op.
+                        stale = [
+                            vault
+                            for vault in group
+                            if not vault.balance or not self._paid_out(vault)
+                        ]
+                        if (
+                            isinstance(exc, ConfirmationTimeoutError)
+                            and any(vault.balance for vault in group)
+                            and not any(vault.balance for vault in stale)
+                        ):
+                            # Every release went through, so the group confirmed late.
+                            logger.warning(f"Release group of {len(group)} confirmed late")
+                        else:
+                            report.settled += len(group) - len(stale)
+                            if len(group) > 1 and stale:
+                                logger.warning(
+                                    f"Release group of {len(group)} not confirmed, retrying "
+                                    f"{len(stale)} vault(s) one by one: {exc}"
+                                )
+                                retries.extend([vault] for vault in stale)
+                            elif stale:
+                                report.failed += 1
+                                logger.error(f"Release of vault {stale[0].app_id} failed: {exc}")
+                            continue
+                    report.fees += fee
+                    report.groups += 1
+                    report.settled += len(group)
+                    report.released += sum(vault.balance for vault in group)
+                fill_pipeline()
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+def main() -> None:
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    from smart_contracts.savings_vault.bulk_deploy import Manifest
+
+    parser = argparse.ArgumentParser(description="Release every due SavingsVault in bulk.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", type=Path, help="bulk_deploy manifest of the vaults")
+    source.add_argument("--app-ids", type=int, nargs="+")
+    source.add_argument(
+        "--registry", type=int, help="VaultRegistry app ID to take the expired vaults from"
+    )
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--group-size", type=int, default=MAX_GROUP_SIZE)
+    args = parser.parse_args()
+
+    # Under a runtime profile (RUNTIME_PROFILE=prod), failed groups are traced as sampled.
+    if runtime.ENV_VAR in os.environ:
+        runtime.apply(runtime.get_profile(), Path.cwd())
+    else:
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+        )
+    load_dotenv()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    sweeper_account = algorand.account.from_environment("DEPLOYER")
+
+    sweeper = Sweeper(
+        algorand.client.algod,
+        sweeper_account.address,
+        sweeper_account.private_key,
+        max_in_flight=args.max_in_flight,
+        group_size=args.group_size,
+    )
+    if args.manifest:
+        entries = Manifest(args.manifest).load().values()
+        app_ids = sorted(entry["app_id"] for entry in entries if "app_id" in entry)
+    elif args.registry:
+        app_ids = sweeper.expired_in_registry(args.registry)
+    else:
+        app_ids = args.app_ids
+    report = sweeper.run(app_ids, registry=args.registry or 0)
+    logger.info(f"Sweep finished: {report}")
+
+
+if __name__ == "__main__":
+    main()
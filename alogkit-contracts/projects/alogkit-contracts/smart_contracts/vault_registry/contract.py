@@ -0,0 +1,106 @@
+"""
+VaultRegistry Smart Contract
+============================
+An index of SavingsVault applications ordered by deadline, so tooling can find
+the vaults whose deadline falls in a window (reminders, settlement, dashboards)
+from one box-name listing instead of reading the global state of every vault.
+
+Global State:
+    entry_count    (uint64)  — vaults currently registered
+
+Box storage:
+    deadline (uint64) ‖ app_id (uint64)  →  empty
+        One box per registered vault. Both numbers are big-endian, so sorting
+        the box names sorts the vaults by deadline (then app ID), and a deadline
+        range is a contiguous range of names.
+
+Lifecycle of an entry:
+    • Once a vault is created and funded (a box reference must name the box, so
+      its app ID must be known), the registry's creator calls register(vault),
+      which reads the vault's deadline itself. Only vaults the registry's creator
+      created can be listed.
+    • Once the vault is paid out (withdraw or release close its account), anyone
+      may call deregister(vault) and the entry is deleted. Clients that know the
+      registry do it in the same group as the payout; the vault itself stores
+      nothing about the registry, so listing costs unregistered vaults nothing.
+
+Every entry locks ENTRY_MBR in the registry account until it is deregistered.
+The creator keeps the registry funded with plain payments; freed entries fund
+later ones, as the minimum balance is only checked against the live boxes.
+"""
+
+from algopy import (
+    Application,
+    ARC4Contract,
+    Bytes,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    op,
+    subroutine,
+)
+
+# Box MBR: 2500 + 400 × (name bytes + value bytes); name = deadline ‖ app_id, no value.
+ENTRY_MBR = 2_500 + 400 * (8 + 8)
+
+
+class VaultRegistry(ARC4Contract):
+    """Deadline-ordered registry of SavingsVault applications."""
+
+    # ── Global state ───────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        self.entry_count = UInt64(0)
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────────
+
+    @arc4.baremethod(create="require")
+    def create(self) -> None:
+        """Create the (empty) registry. Its creator registers the vaults."""
+
+    # ── Core methods ───────────────────────────────────────────────────────────
+
+    @arc4.abimethod
+    def register(self, vault: Application) -> None:
+        """
+        Add a vault's entry. Only the creator may register vaults, and only funded
+        vaults it created (an empty vault account is how deregister tells a paid
+        out vault).
+
+        The call must reference the vault application and the box
+        deadline ‖ app_id; the registry account must cover ENTRY_MBR more.
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can register vaults"
+        assert (
+            vault.creator == Global.creator_address
+        ), "Vault was not created by the registry creator"
+        assert vault.address.balance > 0, "Vault must be funded"
+        deadline, has_deadline = op.AppGlobal.get_ex_uint64(vault, b"deadline")
+        assert has_deadline, "Vault has no deadline"
+
+        assert op.Box.create(_entry_key(deadline, vault.id), 0), "Vault already registered"
+        self.entry_count += 1
+
+    @arc4.abimethod
+    def deregister(self, vault: Application) -> None:
+        """
+        Remove a paid-out vault's entry, if it has one; callable by anyone.
+
+        withdraw and release close the vault's account, so an empty account means
+        the vault is settled for good. A vault without an entry (never registered,
+        or already removed) is a no-op, so concurrent sweeps cannot fail each other.
+        The call must reference the vault application and the box deadline ‖ app_id.
+        """
+        assert vault.address.balance == 0, "Vault not paid out"
+        deadline, has_deadline = op.AppGlobal.get_ex_uint64(vault, b"deadline")
+        assert has_deadline, "Vault has no deadline"
+
+        if op.Box.delete(_entry_key(deadline, vault.id)):
+            self.entry_count -= 1
+
+
+@subroutine
+def _entry_key(deadline: UInt64, app_id: UInt64) -> Bytes:
+    """Box name of a vault's entry: big-endian deadline ‖ app_id."""
+    return op.itob(deadline) + op.itob(app_id)
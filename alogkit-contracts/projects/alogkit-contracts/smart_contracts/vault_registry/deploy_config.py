@@ -0,0 +1,70 @@
+"""
+Deployment configuration for the VaultRegistry contract.
+
+Deploys a VaultRegistry and funds it for its minimum balance plus DEMO_ENTRIES
+entries. The deployer, as its creator, lists vaults in it by creating them with
+the registry, e.g. `bulk_deploy cohort.csv --registry <App ID>`.
+"""
+
+import logging
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts._helpers.profiling import span
+from smart_contracts._helpers.program_cache import load_contract_programs
+from smart_contracts.vault_registry.contract import ENTRY_MBR
+
+logger = logging.getLogger(__name__)
+
+# Entries the initial funding covers; top the registry up for more.
+DEMO_ENTRIES = 100
+
+
+def deploy() -> None:
+    from smart_contracts.artifacts.vault_registry.vault_registry_client import (
+        VaultRegistryFactory,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        VaultRegistryFactory, default_sender=deployer.address
+    )
+
+    # Deploy the programs assembled by the build, without an algod compile round-trip.
+    with span("load cached programs"):
+        load_contract_programs(Path(__file__).parent, "VaultRegistry").install(factory.app_spec)
+
+    with span("factory.deploy"):
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        )
+
+    logger.info(
+        f"VaultRegistry deployed — App ID: {app_client.app_id} | "
+        f"App Address: {app_client.app_address}"
+    )
+
+    # Fund the contract's minimum balance (0.1 ALGO) and the first entries' boxes.
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        with span("fund app account"):
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(micro_algo=100_000 + DEMO_ENTRIES * ENTRY_MBR),
+                    sender=deployer.address,
+                    receiver=app_client.app_address,
+                )
+            )
+        logger.info(f"Funded contract minimum balance and {DEMO_ENTRIES} entries.")
+
+    logger.info(
+        f"✅  VaultRegistry is live!\n"
+        f"    App ID  : {app_client.app_id}\n"
+        f"    Explorer: https://testnet.explorer.perawallet.app/application/{app_client.app_id}"
+    )
@@ -0,0 +1,81 @@
+"""
+Deadline range queries over a VaultRegistry.
+
+The registry keeps one box per registered vault named big-endian
+deadline ‖ app_id, so every (deadline, app ID) pair is in the box names
+themselves. vaults_due lists the registry's box names with a single request,
+sorts them (which sorts the vaults by deadline) and bisects out the requested
+window; no box values and no vault state are read. Only the vaults in the window
+are then read, e.g. with SnapshotReader, instead of every vault the deployer
+ever created. Once a vault is paid out, anyone can remove its entry with
+deregister_txn, e.g. in the same group as the withdraw or release.
+
+Usage:
+    due = vaults_due(algod, registry_app_id, not_before=now - 86_400, before=now)
+    for snapshot in SnapshotReader(algod, sender).read(entry.app_id for entry in due):
+        ...
+"""
+
+import base64
+import bisect
+import struct
+from typing import Any, NamedTuple
+
+from algosdk import abi, transaction
+
+# algopy passes Application arguments by value: the ABI type is the uint64 app ID
+# (the app must still be in the call's foreign apps to be read).
+REGISTER = abi.Method.from_signature("register(uint64)void")
+DEREGISTER = abi.Method.from_signature("deregister(uint64)void")
+
+_ENTRY = struct.Struct(">QQ")
+_NO_DEADLINE = 2**64
+
+
+class RegistryEntry(NamedTuple):
+    deadline: int
+    app_id: int
+
+
+def entry_name(deadline: int, app_id: int) -> bytes:
+    """Box name of a vault's entry: big-endian deadline ‖ app_id."""
+    return _ENTRY.pack(deadline, app_id)
+
+
+def decode_entry_name(name: bytes) -> RegistryEntry:
+    return RegistryEntry(*_ENTRY.unpack(name))
+
+
+def deregister_txn(
+    sender: str, params: Any, registry_app_id: int, vault_app_id: int, deadline: int
+) -> transaction.ApplicationCallTxn:
+    """
+    Call removing a paid-out vault's entry. It must come after the payout (withdraw
+    or release) when grouped with it, as the registry checks the vault is closed.
+    """
+    return transaction.ApplicationCallTxn(
+        sender=sender,
+        sp=params,
+        index=registry_app_id,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[DEREGISTER.get_selector(), abi.UintType(64).encode(vault_app_id)],
+        foreign_apps=[vault_app_id],
+        boxes=[(0, entry_name(deadline, vault_app_id))],
+    )
+
+
+def list_entries(algod: Any, registry_app_id: int) -> list[RegistryEntry]:
+    """Every entry of a registry, in deadline order, from one box-name listing."""
+    response = algod.application_boxes(registry_app_id)
+    names = sorted(base64.b64decode(box["name"]) for box in response.get("boxes", []))
+    return [decode_entry_name(name) for name in names if len(name) == _ENTRY.size]
+
+
+def vaults_due(
+    algod: Any, registry_app_id: int, not_before: int = 0, before: int = _NO_DEADLINE
+) -> list[RegistryEntry]:
+    """Registered vaults with not_before <= deadline < before, in deadline order."""
+    entries = list_entries(algod, registry_app_id)
+    start = bisect.bisect_left(entries, RegistryEntry(not_before, 0))
+    end = bisect.bisect_left(entries, RegistryEntry(before, 0))
+    return entries[start:end]
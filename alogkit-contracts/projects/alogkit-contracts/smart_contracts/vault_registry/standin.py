@@ -0,0 +1,58 @@
+"""
+VaultRegistry behaviour for the LocalNet stand-in.
+
+Python handlers mirroring contract.py method by method (same checks, same order,
+same assert messages), so registry queries can be exercised and benchmarked
+against StandinAlgod. The registry is created with a bare call, handled under the
+empty selector.
+"""
+
+from smart_contracts._helpers.localnet_standin import CallContext, Handler, StandinApp
+from smart_contracts.vault_registry.query import DEREGISTER, REGISTER, entry_name
+
+
+def create(context: CallContext) -> None:
+    context.require(context.txn.index == 0, "Bare call must create the registry")
+    context.app.global_state[b"entry_count"] = 0
+
+
+def _vault(context: CallContext, vault_id: int) -> StandinApp | None:
+    app = context.algod.apps.get(vault_id)
+    return app if app is not None and not app.deleted else None
+
+
+def register(context: CallContext) -> None:
+    state = context.app.global_state
+    vault_id = int.from_bytes(context.args[1], "big")
+    context.require(context.txn.sender == context.app.creator, "Only creator can register vaults")
+    vault = _vault(context, vault_id)
+    context.require(
+        vault is not None and vault.creator == context.app.creator,
+        "Vault was not created by the registry creator",
+    )
+    context.require(context.algod.balances.get(vault.address, 0) > 0, "Vault must be funded")
+    context.require(b"deadline" in vault.global_state, "Vault has no deadline")
+    name = entry_name(vault.global_state[b"deadline"], vault_id)
+    context.require(name not in context.app.boxes, "Vault already registered")
+    context.app.boxes[name] = b""
+    state[b"entry_count"] += 1
+
+
+def deregister(context: CallContext) -> None:
+    vault_id = int.from_bytes(context.args[1], "big")
+    vault = _vault(context, vault_id)
+    address = vault.address if vault is not None else ""
+    context.require(context.algod.balances.get(address, 0) == 0, "Vault not paid out")
+    context.require(vault is not None and b"deadline" in vault.global_state, "Vault has no deadline")
+    name = entry_name(vault.global_state[b"deadline"], vault_id)
+    if context.app.boxes.pop(name, None) is not None:
+        context.app.global_state[b"entry_count"] -= 1
+
+
+def vault_registry_handlers() -> dict[bytes, Handler]:
+    """Handlers to register on a StandinAlgod, keyed by ABI method selector."""
+    return {
+        b"": create,
+        REGISTER.get_selector(): register,
+        DEREGISTER.get_selector(): deregister,
+    }
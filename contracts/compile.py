@@ -16,13 +16,19 @@ Usage (from the project root):
 
     # 3. Compile
     python contracts/compile.py
+
+    # Or keep beaker/pyteal loaded and recompile whenever contracts/app.py changes
+    python contracts/compile.py --watch
 ─────────────────────────────────────────────────────────────────────────────
 """
 
+import argparse
 import base64
+import importlib
 import json
 import pathlib
 import sys
+import time
 
 # ---------------------------------------------------------------------------
 # Make sure the project root is on the Python path so `from contracts.app`
@@ -31,54 +37,155 @@ import sys
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+APP_SOURCE = ROOT / "contracts" / "app.py"
+BUILD_DIR = ROOT / "contracts" / "build"
+
+
 # ---------------------------------------------------------------------------
 # Import and compile
 # ---------------------------------------------------------------------------
-try:
-    from contracts.app import app   # noqa: E402
-except ImportError as exc:
-    sys.exit(
-        f"ERROR: Could not import contracts/app.py.\n"
-        f"       Make sure you have activated your venv and installed:\n"
-        f"         pip install -r contracts/requirements.txt\n"
-        f"Details: {exc}"
-    )
+def load_app(reload: bool = False):
+    """Imports contracts.app (or re-executes it in watch mode) and returns `app`."""
+    try:
+        if reload and "contracts.app" in sys.modules:
+            module = importlib.reload(sys.modules["contracts.app"])
+        else:
+            module = importlib.import_module("contracts.app")
+    except ImportError as exc:
+        if reload:
+            # Let watch() report a broken edit and keep polling.
+            raise
+        sys.exit(
+            f"ERROR: Could not import contracts/app.py.\n"
+            f"       Make sure you have activated your venv and installed:\n"
+            f"         pip install -r contracts/requirements.txt\n"
+            f"Details: {exc}"
+        )
+    return module.app
+
+
+def _as_bytes(program) -> bytes:
+    return program if isinstance(program, bytes) else program.encode()
+
+
+def build_outputs(app) -> dict[str, bytes]:
+    """Builds the application spec and renders every file written to contracts/build/."""
+    spec = app.build()
+    approval = _as_bytes(spec.approval_program)
+    clear = _as_bytes(spec.clear_program)
+    return {
+        "approval.b64": base64.b64encode(approval),
+        "clear.b64": base64.b64encode(clear),
+        # Also write the raw TEAL text for inspection
+        "approval.teal": approval,
+        "clear.teal": clear,
+        # Write ABI JSON for reference
+        "abi.json": json.dumps(spec.contract.dictify(), indent=2).encode(),
+    }
 
-print("Building SavingsVault application spec…")
-spec = app.build()
 
 # ---------------------------------------------------------------------------
 # Write output files
 # ---------------------------------------------------------------------------
-build_dir = ROOT / "contracts" / "build"
-build_dir.mkdir(parents=True, exist_ok=True)
-
-approval_b64 = base64.b64encode(spec.approval_program).decode()
-clear_b64    = base64.b64encode(spec.clear_program).decode()
+def write_outputs(outputs: dict[str, bytes]) -> list[str]:
+    """
+    Writes the build outputs, skipping files whose bytes are unchanged so their
+    mtimes stay put. Returns the names of the files that were rewritten.
+    """
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    changed = []
+    for name, data in outputs.items():
+        path = BUILD_DIR / name
+        if path.exists() and path.read_bytes() == data:
+            continue
+        path.write_bytes(data)
+        changed.append(name)
+    return changed
 
-(build_dir / "approval.b64").write_text(approval_b64)
-(build_dir / "clear.b64").write_text(clear_b64)
 
-# Also write the raw TEAL text for inspection
-(build_dir / "approval.teal").write_text(spec.approval_program.decode() if isinstance(spec.approval_program, bytes) else "")
-(build_dir / "clear.teal").write_text(spec.clear_program.decode() if isinstance(spec.clear_program, bytes) else "")
+# ---------------------------------------------------------------------------
+# Print instructions
+# ---------------------------------------------------------------------------
+def print_instructions(outputs: dict[str, bytes]) -> None:
+    print("\n✅  Compilation successful!\n")
+    print("─" * 70)
+    print("Paste these two lines into src/lib/blockchain.ts:\n")
+    print(f'const APPROVAL_B64 = "{outputs["approval.b64"].decode()}";')
+    print(f'const CLEAR_B64    = "{outputs["clear.b64"].decode()}";')
+    print("\n─" * 70)
+    print(f"\nFiles written to {BUILD_DIR}/:")
+    print("  approval.b64  – base64 approval program (paste into blockchain.ts)")
+    print("  clear.b64     – base64 clear-state program")
+    print("  approval.teal – human-readable TEAL source")
+    print("  clear.teal    – human-readable clear TEAL source")
+    print("  abi.json      – ARC-4 ABI contract descriptor")
 
-# Write ABI JSON for reference
-abi_path = build_dir / "abi.json"
-abi_path.write_text(json.dumps(spec.contract.dictify(), indent=2))
 
 # ---------------------------------------------------------------------------
-# Print instructions
+# Watch mode
 # ---------------------------------------------------------------------------
-print("\n✅  Compilation successful!\n")
-print("─" * 70)
-print("Paste these two lines into src/lib/blockchain.ts:\n")
-print(f'const APPROVAL_B64 = "{approval_b64}";')
-print(f'const CLEAR_B64    = "{clear_b64}";')
-print("\n─" * 70)
-print(f"\nFiles written to {build_dir}/:")
-print("  approval.b64  – base64 approval program (paste into blockchain.ts)")
-print("  clear.b64     – base64 clear-state program")
-print("  approval.teal – human-readable TEAL source")
-print("  clear.teal    – human-readable clear TEAL source")
-print("  abi.json      – ARC-4 ABI contract descriptor")
+def watch(interval: float) -> None:
+    """
+    Keeps beaker/pyteal imported and rebuilds whenever contracts/app.py changes.
+    Only the app module is re-executed on each change, so a rebuild skips the
+    cold import entirely.
+    """
+    print(f"Watching {APP_SOURCE} for changes (Ctrl+C to stop)…")
+    last_mtime = None
+    while True:
+        try:
+            mtime = APP_SOURCE.stat().st_mtime_ns
+        except FileNotFoundError:  # editors that save by replacing briefly remove it
+            time.sleep(interval)
+            continue
+        if mtime != last_mtime:
+            reload = last_mtime is not None
+            last_mtime = mtime
+            started = time.perf_counter()
+            try:
+                outputs = build_outputs(load_app(reload=reload))
+            except Exception as exc:  # keep watching after a broken edit
+                print(f"❌  Build failed: {exc}")
+            else:
+                changed = write_outputs(outputs)
+                elapsed = time.perf_counter() - started
+                if changed:
+                    print(f"🔨  Rebuilt in {elapsed:.3f}s, updated: {', '.join(changed)}")
+                    if "approval.b64" in changed or "clear.b64" in changed:
+                        print_instructions(outputs)
+                else:
+                    print(f"🔨  Rebuilt in {elapsed:.3f}s, output unchanged")
+        time.sleep(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile the SavingsVault Beaker contract.")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay running and recompile whenever contracts/app.py changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.2,
+        help="Polling interval in seconds for --watch (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    if args.watch:
+        try:
+            watch(args.interval)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return
+
+    app = load_app()
+    print("Building SavingsVault application spec…")
+    outputs = build_outputs(app)
+    write_outputs(outputs)
+    print_instructions(outputs)
+
+
+if __name__ == "__main__":
+    main()